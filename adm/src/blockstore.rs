@@ -22,6 +22,19 @@ use sawtooth_sdk::messages::block::{Block, BlockHeader};
 use database::error::DatabaseError;
 use database::lmdb::LmdbDatabase;
 
+/// Separates the block id from the block number in the entries of the batch
+/// and transaction indexes, as they are written by the validator.
+const INDEX_REF_SEPARATOR: u8 = 0;
+
+/// The indexes of the blockstore database, as they are named by the validator.
+pub const INDEXES: [&str; 5] = [
+    "index_batch",
+    "index_transaction",
+    "index_block_num",
+    "index_batch_sequence",
+    "index_transaction_sequence",
+];
+
 pub struct Blockstore<'a> {
     db: LmdbDatabase<'a>,
 }
@@ -76,7 +89,8 @@ impl<'a> Blockstore<'a> {
                     DatabaseError::NotFoundError(format!("Batch not found: {}", batch_id))
                 })
             })?;
-        let packed = reader.get(&block_id).ok_or_else(|| {
+        let block_id = block_id_from_index_value(&block_id);
+        let packed = reader.get(block_id).ok_or_else(|| {
             DatabaseError::CorruptionError(format!("Block not found: {:?}", block_id))
         })?;
         let block: Block = protobuf::parse_from_bytes(&packed).map_err(|err| {
@@ -100,7 +114,8 @@ impl<'a> Blockstore<'a> {
                     ))
                 })
             })?;
-        let packed = reader.get(&block_id).ok_or_else(|| {
+        let block_id = block_id_from_index_value(&block_id);
+        let packed = reader.get(block_id).ok_or_else(|| {
             DatabaseError::CorruptionError(format!("Block not found: {:?}", block_id))
         })?;
         let block: Block = protobuf::parse_from_bytes(&packed).map_err(|err| {
@@ -116,6 +131,7 @@ impl<'a> Blockstore<'a> {
         let block_header: BlockHeader = protobuf::parse_from_bytes(&block.header).map_err(|err| {
             DatabaseError::CorruptionError(format!("Invalid block header: {}", err))
         })?;
+        let index_value = index_ref_value(&block.header_signature, block_header.block_num);
         let mut writer = self.db.writer()?;
         // Add block to main db
         let packed = block.write_to_bytes().map_err(|err| {
@@ -131,21 +147,34 @@ impl<'a> Blockstore<'a> {
             &block.header_signature.as_bytes(),
         )?;
 
-        for batch in block.batches.iter() {
-            for txn in batch.transactions.iter() {
-                writer.index_put(
-                    "index_transaction",
-                    &txn.header_signature.as_bytes(),
-                    &block.header_signature.as_bytes(),
-                )?;
-            }
+        // Add block to transaction and transaction sequence indexes
+        let transactions = block
+            .batches
+            .iter()
+            .flat_map(|batch| batch.transactions.iter());
+        for (position, txn) in transactions.enumerate() {
+            writer.index_put(
+                "index_transaction",
+                &txn.header_signature.as_bytes(),
+                &index_value,
+            )?;
+            writer.index_put(
+                "index_transaction_sequence",
+                &sequence_key(block_header.block_num, position).as_bytes(),
+                &block.header_signature.as_bytes(),
+            )?;
         }
 
-        // Add block to batch index
-        for batch in block.batches.iter() {
+        // Add block to batch and batch sequence indexes
+        for (position, batch) in block.batches.iter().enumerate() {
             writer.index_put(
                 "index_batch",
                 &batch.header_signature.as_bytes(),
+                &index_value,
+            )?;
+            writer.index_put(
+                "index_batch_sequence",
+                &sequence_key(block_header.block_num, position).as_bytes(),
                 &block.header_signature.as_bytes(),
             )?;
         }
@@ -167,16 +196,26 @@ impl<'a> Blockstore<'a> {
         let block_num_index = format!("0x{:0>16x}", block_header.block_num);
         writer.index_delete("index_block_num", &block_num_index.as_bytes())?;
 
-        // Delete block from transaction index
-        for batch in block.batches.iter() {
-            for txn in batch.transactions.iter() {
-                writer.index_delete("index_transaction", &txn.header_signature.as_bytes())?;
-            }
+        // Delete block from transaction and transaction sequence indexes
+        let transactions = block
+            .batches
+            .iter()
+            .flat_map(|batch| batch.transactions.iter());
+        for (position, txn) in transactions.enumerate() {
+            writer.index_delete("index_transaction", &txn.header_signature.as_bytes())?;
+            writer.index_delete(
+                "index_transaction_sequence",
+                &sequence_key(block_header.block_num, position).as_bytes(),
+            )?;
         }
 
-        // Delete block from batch index
-        for batch in block.batches.iter() {
+        // Delete block from batch and batch sequence indexes
+        for (position, batch) in block.batches.iter().enumerate() {
             writer.index_delete("index_batch", &batch.header_signature.as_bytes())?;
+            writer.index_delete(
+                "index_batch_sequence",
+                &sequence_key(block_header.block_num, position).as_bytes(),
+            )?;
         }
         writer.commit()
     }
@@ -210,6 +249,31 @@ impl<'a> Blockstore<'a> {
     }
 }
 
+/// Creates a batch or transaction index entry, which holds the id and the
+/// number of the containing block.
+fn index_ref_value(block_id: &str, block_num: u64) -> Vec<u8> {
+    let mut value = Vec::from(block_id.as_bytes());
+    value.push(INDEX_REF_SEPARATOR);
+    value.extend_from_slice(format!("0x{:0>16x}", block_num).as_bytes());
+    value
+}
+
+/// Returns the block id of a batch or transaction index entry. Entries
+/// written by earlier versions hold only the block id.
+fn block_id_from_index_value(value: &[u8]) -> &[u8] {
+    match value.iter().position(|byte| *byte == INDEX_REF_SEPARATOR) {
+        Some(end) => &value[..end],
+        None => value,
+    }
+}
+
+/// Creates the batch or transaction sequence index key of the item at the
+/// given position within a block. The position is inverted, so that a
+/// descending scan lists each block's items in their order within the block.
+fn sequence_key(block_num: u64, position: usize) -> String {
+    format!("{:016x}{:08x}", block_num, 0xffff_ffff - position as u64)
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -233,6 +297,22 @@ mod tests {
         assert_eq!(blockstore.get_chain_head().unwrap(), signature,);
     }
 
+    /// Asserts that KEY in BLOCKSTORE's sequence INDEX references BLOCK_ID,
+    /// or is not in the index if BLOCK_ID is None.
+    fn assert_sequence_entry(
+        index: &str,
+        key: &str,
+        block_id: Option<&str>,
+        blockstore: &Blockstore,
+    ) {
+        let reader = blockstore.db.reader().unwrap();
+
+        assert_eq!(
+            reader.index_get(index, key.as_bytes()).unwrap(),
+            block_id.map(|block_id| Vec::from(block_id.as_bytes())),
+        );
+    }
+
     /// Opens a blockstore and executes its basic operations (adding,
     /// deleting, and looking up blocks), making assertions about the
     /// blockstore contents at each step.
@@ -244,14 +324,11 @@ mod tests {
 
         // Set the file size to 10MB, so as to support file systems that do
         // not support sparse files.
-        let ctx = LmdbContext::new(blockstore_path, 3, Some(10 * 1024 * 1024))
+        let ctx = LmdbContext::new(blockstore_path, INDEXES.len() as u32, Some(10 * 1024 * 1024))
             .map_err(|err| DatabaseError::InitError(format!("{}", err)))
             .unwrap();
 
-        let database = LmdbDatabase::new(
-            &ctx,
-            &["index_batch", "index_transaction", "index_block_num"],
-        ).map_err(|err| DatabaseError::InitError(format!("{}", err)))
+        let database = LmdbDatabase::new(&ctx, &INDEXES).map_err(|err| DatabaseError::InitError(format!("{}", err)))
             .unwrap();
 
         let blockstore = Blockstore::new(database);
@@ -317,10 +394,98 @@ mod tests {
 
         assert_header_signature(get_by_transaction, String::from("block-with-batch"));
 
+        // The batch and transaction are in the sequence indexes.
+        assert_sequence_entry(
+            "index_batch_sequence",
+            "0000000000000006ffffffff",
+            Some("block-with-batch"),
+            &blockstore,
+        );
+        assert_sequence_entry(
+            "index_transaction_sequence",
+            "0000000000000006ffffffff",
+            Some("block-with-batch"),
+            &blockstore,
+        );
+
         // Delete a block.
         blockstore.delete("block-with-batch").unwrap();
 
         assert_current_height(5, &blockstore);
         assert_chain_head(String::from("block-4"), &blockstore);
+        assert_sequence_entry(
+            "index_batch_sequence",
+            "0000000000000006ffffffff",
+            None,
+            &blockstore,
+        );
+        assert_sequence_entry(
+            "index_transaction_sequence",
+            "0000000000000006ffffffff",
+            None,
+            &blockstore,
+        );
+    }
+
+    /// Writes a block, and the batch and transaction index entries the
+    /// validator writes for it, directly to the database, then looks the
+    /// block up by batch and transaction id. Entries with and without the
+    /// block number reference are both read.
+    #[test]
+    fn test_blockstore_reads_validator_index_entries() {
+        let path_config = config::get_path_config();
+
+        let blockstore_path = &path_config
+            .data_dir
+            .join(String::from("unit-blockstore-index.lmdb"));
+        let _ = ::std::fs::remove_file(blockstore_path);
+
+        let ctx = LmdbContext::new(blockstore_path, INDEXES.len() as u32, Some(10 * 1024 * 1024))
+            .map_err(|err| DatabaseError::InitError(format!("{}", err)))
+            .unwrap();
+
+        let database = LmdbDatabase::new(&ctx, &INDEXES).map_err(|err| DatabaseError::InitError(format!("{}", err)))
+            .unwrap();
+
+        let mut transaction = Transaction::new();
+        transaction.set_header_signature(String::from("transaction"));
+
+        let mut batch = Batch::new();
+        batch.set_header_signature(String::from("batch"));
+        batch.set_transactions(protobuf::RepeatedField::from_vec(vec![transaction]));
+
+        let mut block = Block::new();
+        block.set_header_signature(String::from("block-3"));
+        let mut header = BlockHeader::new();
+        header.set_block_num(3);
+        block.set_header(header.write_to_bytes().unwrap());
+        block.set_batches(protobuf::RepeatedField::from_vec(vec![batch]));
+
+        {
+            let mut writer = database.writer().unwrap();
+            writer
+                .put(b"block-3", &block.write_to_bytes().unwrap())
+                .unwrap();
+            writer
+                .index_put("index_block_num", b"0x0000000000000003", b"block-3")
+                .unwrap();
+            writer
+                .index_put("index_batch", b"batch", b"block-3\x000x0000000000000003")
+                .unwrap();
+            writer
+                .index_put("index_transaction", b"transaction", b"block-3")
+                .unwrap();
+            writer.commit().unwrap();
+        }
+
+        let blockstore = Blockstore::new(database);
+
+        let get_by_batch = blockstore.get_by_batch("batch").unwrap();
+
+        assert_header_signature(get_by_batch, String::from("block-3"));
+
+        let get_by_transaction = blockstore.get_by_transaction("transaction").unwrap();
+
+        assert_header_signature(get_by_transaction, String::from("block-3"));
     }
 }
@@ -27,7 +27,7 @@ use serde_yaml;
 use sawtooth_sdk::messages::block::{Block, BlockHeader};
 use sawtooth_sdk::messages::transaction::TransactionHeader;
 
-use blockstore::Blockstore;
+use blockstore::{Blockstore, INDEXES};
 use config;
 use database::error::DatabaseError;
 use database::lmdb;
@@ -375,15 +375,12 @@ fn create_context() -> Result<lmdb::LmdbContext, CliError> {
     let path_config = config::get_path_config();
     let blockstore_path = &path_config.data_dir.join(config::get_blockstore_filename());
 
-    lmdb::LmdbContext::new(blockstore_path, 3, None)
+    lmdb::LmdbContext::new(blockstore_path, INDEXES.len() as u32, None)
         .map_err(|err| CliError::EnvironmentError(format!("{}", err)))
 }
 
 fn open_blockstore(ctx: &lmdb::LmdbContext) -> Result<Blockstore, CliError> {
-    let blockstore_db = lmdb::LmdbDatabase::new(
-        ctx,
-        &["index_batch", "index_transaction", "index_block_num"],
-    ).map_err(|err| CliError::EnvironmentError(format!("{}", err)))?;
+    let blockstore_db = lmdb::LmdbDatabase::new(ctx, &INDEXES).map_err(|err| CliError::EnvironmentError(format!("{}", err)))?;
 
     Ok(Blockstore::new(blockstore_db))
 }
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: sawtooth_block_info/protobuf/consensus.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'sawtooth_block_info/protobuf/consensus.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n,sawtooth_block_info/protobuf/consensus.proto\"\\\n\x14\x43onsensusPeerMessage\x12\x14\n\x0cmessage_type\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\x0c\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07version\x18\x04 \x01(\t\"\x7f\n\x0e\x43onsensusBlock\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x13\n\x0bprevious_id\x18\x02 \x01(\x0c\x12\x11\n\tsigner_id\x18\x03 \x01(\x0c\x12\x11\n\tblock_num\x18\x04 \x01(\x04\x12\x0f\n\x07payload\x18\x05 \x01(\x0c\x12\x0f\n\x07summary\x18\x06 \x01(\x0c\"$\n\x11\x43onsensusPeerInfo\x12\x0f\n\x07peer_id\x18\x01 \x01(\x0c\"4\n\x16\x43onsensusSettingsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"4\n\x13\x43onsensusStateEntry\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"9\n\x18\x43onsensusRegisterRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\"\x9a\x02\n\x19\x43onsensusRegisterResponse\x12\x31\n\x06status\x18\x01 \x01(\x0e\x32!.ConsensusRegisterResponse.Status\x12#\n\nchain_head\x18\x02 \x01(\x0b\x32\x0f.ConsensusBlock\x12!\n\x05peers\x18\x03 \x03(\x0b\x32\x12.ConsensusPeerInfo\x12+\n\x0flocal_peer_info\x18\x04 \x01(\x0b\x32\x12.ConsensusPeerInfo\"U\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\"E\n\x1c\x43onsensusNotifyPeerConnected\x12%\n\tpeer_info\x18\x01 \x01(\x0b\x32\x12.ConsensusPeerInfo\"2\n\x1f\x43onsensusNotifyPeerDisconnected\x12\x0f\n\x07peer_id\x18\x01 \x01(\x0c\"W\n\x1a\x43onsensusNotifyPeerMessage\x12&\n\x07message\x18\x01 \x01(\x0b\x32\x15.ConsensusPeerMessage\x12\x11\n\tsender_id\x18\x02 \x01(\x0c\"9\n\x17\x43onsensusNotifyBlockNew\x12\x1e\n\x05\x62lock\x18\x01 \x01(\x0b\x32\x0f.ConsensusBlock\"-\n\x19\x43onsensusNotifyBlockValid\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"/\n\x1b\x43onsensusNotifyBlockInvalid\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\".\n\x1a\x43onsensusNotifyBlockCommit\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\x14\n\x12\x43onsensusNotifyAck\"Q\n\x16\x43onsensusSendToRequest\x12&\n\x07message\x18\x01 \x01(\x0b\x32\x15.ConsensusPeerMessage\x12\x0f\n\x07peer_id\x18\x02 \x01(\x0c\"\xb3\x01\n\x17\x43onsensusSendToResponse\x12/\n\x06status\x18\x01 \x01(\x0e\x32\x1f.ConsensusSendToResponse.Status\"g\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x10\n\x0cUNKNOWN_PEER\x10\x05\"C\n\x19\x43onsensusBroadcastRequest\x12&\n\x07message\x18\x01 \x01(\x0b\x32\x15.ConsensusPeerMessage\"\xa7\x01\n\x1a\x43onsensusBroadcastResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusBroadcastResponse.Status\"U\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\"6\n\x1f\x43onsensusInitializeBlockRequest\x12\x13\n\x0bprevious_id\x18\x01 \x01(\x0c\"\xd9\x01\n ConsensusInitializeBlockResponse\x12\x38\n\x06status\x18\x01 \x01(\x0e\x32(.ConsensusInitializeBlockResponse.Status\"{\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x11\n\rUNKNOWN_BLOCK\x10\x06\" \n\x1e\x43onsensusSummarizeBlockRequest\"\xea\x01\n\x1f\x43onsensusSummarizeBlockResponse\x12\x37\n\x06status\x18\x01 \x01(\x0e\x32\'.ConsensusSummarizeBlockResponse.Status\x12\x0f\n\x07summary\x18\x02 \x01(\x0c\"}\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x13\n\x0f\x42LOCK_NOT_READY\x10\x06\"-\n\x1d\x43onsensusFinalizeBlockRequest\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\xe9\x01\n\x1e\x43onsensusFinalizeBlockResponse\x12\x36\n\x06status\x18\x01 \x01(\x0e\x32&.ConsensusFinalizeBlockResponse.Status\x12\x10\n\x08\x62lock_id\x18\x02 \x01(\x0c\"}\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x13\n\x0f\x42LOCK_NOT_READY\x10\x06\"\x1d\n\x1b\x43onsensusCancelBlockRequest\"\xbe\x01\n\x1c\x43onsensusCancelBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCancelBlockResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\"0\n\x1b\x43onsensusCheckBlocksRequest\x12\x11\n\tblock_ids\x18\x01 \x03(\x0c\"\xbe\x01\n\x1c\x43onsensusCheckBlocksResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCheckBlocksResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"/\n\x1b\x43onsensusCommitBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xbe\x01\n\x1c\x43onsensusCommitBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCommitBlockResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"/\n\x1b\x43onsensusIgnoreBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xbe\x01\n\x1c\x43onsensusIgnoreBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusIgnoreBlockResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"-\n\x19\x43onsensusFailBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xba\x01\n\x1a\x43onsensusFailBlockResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusFailBlockResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\".\n\x19\x43onsensusBlocksGetRequest\x12\x11\n\tblock_ids\x18\x01 \x03(\x0c\"\xdb\x01\n\x1a\x43onsensusBlocksGetResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusBlocksGetResponse.Status\x12\x1f\n\x06\x62locks\x18\x02 \x03(\x0b\x32\x0f.ConsensusBlock\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"\x1e\n\x1c\x43onsensusChainHeadGetRequest\"\xe0\x01\n\x1d\x43onsensusChainHeadGetResponse\x12\x35\n\x06status\x18\x01 \x01(\x0e\x32%.ConsensusChainHeadGetResponse.Status\x12\x1e\n\x05\x62lock\x18\x02 \x01(\x0b\x32\x0f.ConsensusBlock\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rNO_CHAIN_HEAD\x10\x05\"=\n\x1b\x43onsensusSettingsGetRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x0c\n\x04keys\x18\x02 \x03(\t\"\xe8\x01\n\x1c\x43onsensusSettingsGetResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusSettingsGetResponse.Status\x12(\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x17.ConsensusSettingsEntry\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"?\n\x18\x43onsensusStateGetRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x11\n\taddresses\x18\x02 \x03(\t\"\xdf\x01\n\x19\x43onsensusStateGetResponse\x12\x31\n\x06status\x18\x01 \x01(\x0e\x32!.ConsensusStateGetResponse.Status\x12%\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x14.ConsensusStateEntry\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_block_info.protobuf.consensus_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_CONSENSUSPEERMESSAGE']._serialized_start=48
+  _globals['_CONSENSUSPEERMESSAGE']._serialized_end=140
+  _globals['_CONSENSUSBLOCK']._serialized_start=142
+  _globals['_CONSENSUSBLOCK']._serialized_end=269
+  _globals['_CONSENSUSPEERINFO']._serialized_start=271
+  _globals['_CONSENSUSPEERINFO']._serialized_end=307
+  _globals['_CONSENSUSSETTINGSENTRY']._serialized_start=309
+  _globals['_CONSENSUSSETTINGSENTRY']._serialized_end=361
+  _globals['_CONSENSUSSTATEENTRY']._serialized_start=363
+  _globals['_CONSENSUSSTATEENTRY']._serialized_end=415
+  _globals['_CONSENSUSREGISTERREQUEST']._serialized_start=417
+  _globals['_CONSENSUSREGISTERREQUEST']._serialized_end=474
+  _globals['_CONSENSUSREGISTERRESPONSE']._serialized_start=477
+  _globals['_CONSENSUSREGISTERRESPONSE']._serialized_end=759
+  _globals['_CONSENSUSREGISTERRESPONSE_STATUS']._serialized_start=674
+  _globals['_CONSENSUSREGISTERRESPONSE_STATUS']._serialized_end=759
+  _globals['_CONSENSUSNOTIFYPEERCONNECTED']._serialized_start=761
+  _globals['_CONSENSUSNOTIFYPEERCONNECTED']._serialized_end=830
+  _globals['_CONSENSUSNOTIFYPEERDISCONNECTED']._serialized_start=832
+  _globals['_CONSENSUSNOTIFYPEERDISCONNECTED']._serialized_end=882
+  _globals['_CONSENSUSNOTIFYPEERMESSAGE']._serialized_start=884
+  _globals['_CONSENSUSNOTIFYPEERMESSAGE']._serialized_end=971
+  _globals['_CONSENSUSNOTIFYBLOCKNEW']._serialized_start=973
+  _globals['_CONSENSUSNOTIFYBLOCKNEW']._serialized_end=1030
+  _globals['_CONSENSUSNOTIFYBLOCKVALID']._serialized_start=1032
+  _globals['_CONSENSUSNOTIFYBLOCKVALID']._serialized_end=1077
+  _globals['_CONSENSUSNOTIFYBLOCKINVALID']._serialized_start=1079
+  _globals['_CONSENSUSNOTIFYBLOCKINVALID']._serialized_end=1126
+  _globals['_CONSENSUSNOTIFYBLOCKCOMMIT']._serialized_start=1128
+  _globals['_CONSENSUSNOTIFYBLOCKCOMMIT']._serialized_end=1174
+  _globals['_CONSENSUSNOTIFYACK']._serialized_start=1176
+  _globals['_CONSENSUSNOTIFYACK']._serialized_end=1196
+  _globals['_CONSENSUSSENDTOREQUEST']._serialized_start=1198
+  _globals['_CONSENSUSSENDTOREQUEST']._serialized_end=1279
+  _globals['_CONSENSUSSENDTORESPONSE']._serialized_start=1282
+  _globals['_CONSENSUSSENDTORESPONSE']._serialized_end=1461
+  _globals['_CONSENSUSSENDTORESPONSE_STATUS']._serialized_start=1358
+  _globals['_CONSENSUSSENDTORESPONSE_STATUS']._serialized_end=1461
+  _globals['_CONSENSUSBROADCASTREQUEST']._serialized_start=1463
+  _globals['_CONSENSUSBROADCASTREQUEST']._serialized_end=1530
+  _globals['_CONSENSUSBROADCASTRESPONSE']._serialized_start=1533
+  _globals['_CONSENSUSBROADCASTRESPONSE']._serialized_end=1700
+  _globals['_CONSENSUSBROADCASTRESPONSE_STATUS']._serialized_start=674
+  _globals['_CONSENSUSBROADCASTRESPONSE_STATUS']._serialized_end=759
+  _globals['_CONSENSUSINITIALIZEBLOCKREQUEST']._serialized_start=1702
+  _globals['_CONSENSUSINITIALIZEBLOCKREQUEST']._serialized_end=1756
+  _globals['_CONSENSUSINITIALIZEBLOCKRESPONSE']._serialized_start=1759
+  _globals['_CONSENSUSINITIALIZEBLOCKRESPONSE']._serialized_end=1976
+  _globals['_CONSENSUSINITIALIZEBLOCKRESPONSE_STATUS']._serialized_start=1853
+  _globals['_CONSENSUSINITIALIZEBLOCKRESPONSE_STATUS']._serialized_end=1976
+  _globals['_CONSENSUSSUMMARIZEBLOCKREQUEST']._serialized_start=1978
+  _globals['_CONSENSUSSUMMARIZEBLOCKREQUEST']._serialized_end=2010
+  _globals['_CONSENSUSSUMMARIZEBLOCKRESPONSE']._serialized_start=2013
+  _globals['_CONSENSUSSUMMARIZEBLOCKRESPONSE']._serialized_end=2247
+  _globals['_CONSENSUSSUMMARIZEBLOCKRESPONSE_STATUS']._serialized_start=2122
+  _globals['_CONSENSUSSUMMARIZEBLOCKRESPONSE_STATUS']._serialized_end=2247
+  _globals['_CONSENSUSFINALIZEBLOCKREQUEST']._serialized_start=2249
+  _globals['_CONSENSUSFINALIZEBLOCKREQUEST']._serialized_end=2294
+  _globals['_CONSENSUSFINALIZEBLOCKRESPONSE']._serialized_start=2297
+  _globals['_CONSENSUSFINALIZEBLOCKRESPONSE']._serialized_end=2530
+  _globals['_CONSENSUSFINALIZEBLOCKRESPONSE_STATUS']._serialized_start=2122
+  _globals['_CONSENSUSFINALIZEBLOCKRESPONSE_STATUS']._serialized_end=2247
+  _globals['_CONSENSUSCANCELBLOCKREQUEST']._serialized_start=2532
+  _globals['_CONSENSUSCANCELBLOCKREQUEST']._serialized_end=2561
+  _globals['_CONSENSUSCANCELBLOCKRESPONSE']._serialized_start=2564
+  _globals['_CONSENSUSCANCELBLOCKRESPONSE']._serialized_end=2754
+  _globals['_CONSENSUSCANCELBLOCKRESPONSE_STATUS']._serialized_start=1853
+  _globals['_CONSENSUSCANCELBLOCKRESPONSE_STATUS']._serialized_end=1957
+  _globals['_CONSENSUSCHECKBLOCKSREQUEST']._serialized_start=2756
+  _globals['_CONSENSUSCHECKBLOCKSREQUEST']._serialized_end=2804
+  _globals['_CONSENSUSCHECKBLOCKSRESPONSE']._serialized_start=2807
+  _globals['_CONSENSUSCHECKBLOCKSRESPONSE']._serialized_end=2997
+  _globals['_CONSENSUSCHECKBLOCKSRESPONSE_STATUS']._serialized_start=2893
+  _globals['_CONSENSUSCHECKBLOCKSRESPONSE_STATUS']._serialized_end=2997
+  _globals['_CONSENSUSCOMMITBLOCKREQUEST']._serialized_start=2999
+  _globals['_CONSENSUSCOMMITBLOCKREQUEST']._serialized_end=3046
+  _globals['_CONSENSUSCOMMITBLOCKRESPONSE']._serialized_start=3049
+  _globals['_CONSENSUSCOMMITBLOCKRESPONSE']._serialized_end=3239
+  _globals['_CONSENSUSCOMMITBLOCKRESPONSE_STATUS']._serialized_start=2893
+  _globals['_CONSENSUSCOMMITBLOCKRESPONSE_STATUS']._serialized_end=2997
+  _globals['_CONSENSUSIGNOREBLOCKREQUEST']._serialized_start=3241
+  _globals['_CONSENSUSIGNOREBLOCKREQUEST']._serialized_end=3288
+  _globals['_CONSENSUSIGNOREBLOCKRESPONSE']._serialized_start=3291
+  _globals['_CONSENSUSIGNOREBLOCKRESPONSE']._serialized_end=3481
+  _globals['_CONSENSUSIGNOREBLOCKRESPONSE_STATUS']._serialized_start=2893
+  _globals['_CONSENSUSIGNOREBLOCKRESPONSE_STATUS']._serialized_end=2997
+  _globals['_CONSENSUSFAILBLOCKREQUEST']._serialized_start=3483
+  _globals['_CONSENSUSFAILBLOCKREQUEST']._serialized_end=3528
+  _globals['_CONSENSUSFAILBLOCKRESPONSE']._serialized_start=3531
+  _globals['_CONSENSUSFAILBLOCKRESPONSE']._serialized_end=3717
+  _globals['_CONSENSUSFAILBLOCKRESPONSE_STATUS']._serialized_start=2893
+  _globals['_CONSENSUSFAILBLOCKRESPONSE_STATUS']._serialized_end=2997
+  _globals['_CONSENSUSBLOCKSGETREQUEST']._serialized_start=3719
+  _globals['_CONSENSUSBLOCKSGETREQUEST']._serialized_end=3765
+  _globals['_CONSENSUSBLOCKSGETRESPONSE']._serialized_start=3768
+  _globals['_CONSENSUSBLOCKSGETRESPONSE']._serialized_end=3987
+  _globals['_CONSENSUSBLOCKSGETRESPONSE_STATUS']._serialized_start=2893
+  _globals['_CONSENSUSBLOCKSGETRESPONSE_STATUS']._serialized_end=2997
+  _globals['_CONSENSUSCHAINHEADGETREQUEST']._serialized_start=3989
+  _globals['_CONSENSUSCHAINHEADGETREQUEST']._serialized_end=4019
+  _globals['_CONSENSUSCHAINHEADGETRESPONSE']._serialized_start=4022
+  _globals['_CONSENSUSCHAINHEADGETRESPONSE']._serialized_end=4246
+  _globals['_CONSENSUSCHAINHEADGETRESPONSE_STATUS']._serialized_start=4142
+  _globals['_CONSENSUSCHAINHEADGETRESPONSE_STATUS']._serialized_end=4246
+  _globals['_CONSENSUSSETTINGSGETREQUEST']._serialized_start=4248
+  _globals['_CONSENSUSSETTINGSGETREQUEST']._serialized_end=4309
+  _globals['_CONSENSUSSETTINGSGETRESPONSE']._serialized_start=4312
+  _globals['_CONSENSUSSETTINGSGETRESPONSE']._serialized_end=4544
+  _globals['_CONSENSUSSETTINGSGETRESPONSE_STATUS']._serialized_start=2893
+  _globals['_CONSENSUSSETTINGSGETRESPONSE_STATUS']._serialized_end=2997
+  _globals['_CONSENSUSSTATEGETREQUEST']._serialized_start=4546
+  _globals['_CONSENSUSSTATEGETREQUEST']._serialized_end=4609
+  _globals['_CONSENSUSSTATEGETRESPONSE']._serialized_start=4612
+  _globals['_CONSENSUSSTATEGETRESPONSE']._serialized_end=4835
+  _globals['_CONSENSUSSTATEGETRESPONSE_STATUS']._serialized_start=2893
+  _globals['_CONSENSUSSTATEGETRESPONSE_STATUS']._serialized_end=2997
+# @@protoc_insertion_point(module_scope)
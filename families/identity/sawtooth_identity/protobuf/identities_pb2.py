@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: sawtooth_identity/protobuf/identities.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'sawtooth_identity/protobuf/identities.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n+sawtooth_identity/protobuf/identities.proto\"\x8b\x01\n\x0fIdentityPayload\x12+\n\x04type\x18\x01 \x01(\x0e\x32\x1d.IdentityPayload.IdentityType\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"=\n\x0cIdentityType\x12\x17\n\x13IDENTITY_TYPE_UNSET\x10\x00\x12\n\n\x06POLICY\x10\x01\x12\x08\n\x04ROLE\x10\x02\x42\x1e\n\x1asawtooth.identity.protobufP\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_identity.protobuf.identities_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\032sawtooth.identity.protobufP\001'
+  _globals['_IDENTITYPAYLOAD']._serialized_start=48
+  _globals['_IDENTITYPAYLOAD']._serialized_end=187
+  _globals['_IDENTITYPAYLOAD_IDENTITYTYPE']._serialized_start=126
+  _globals['_IDENTITYPAYLOAD_IDENTITYTYPE']._serialized_end=187
+# @@protoc_insertion_point(module_scope)
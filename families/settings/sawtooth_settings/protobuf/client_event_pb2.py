@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: sawtooth_settings/protobuf/client_event.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'sawtooth_settings/protobuf/client_event.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from sawtooth_settings.protobuf import events_pb2 as sawtooth__settings_dot_protobuf_dot_events__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n-sawtooth_settings/protobuf/client_event.proto\x1a\'sawtooth_settings/protobuf/events.proto\"g\n\x1c\x43lientEventsSubscribeRequest\x12)\n\rsubscriptions\x18\x01 \x03(\x0b\x32\x12.EventSubscription\x12\x1c\n\x14last_known_block_ids\x18\x02 \x03(\t\"\xbb\x01\n\x1d\x43lientEventsSubscribeResponse\x12\x35\n\x06status\x18\x01 \x01(\x0e\x32%.ClientEventsSubscribeResponse.Status\x12\x18\n\x10response_message\x18\x02 \x01(\t\"I\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x12\n\x0eINVALID_FILTER\x10\x02\x12\x11\n\rUNKNOWN_BLOCK\x10\x03\" \n\x1e\x43lientEventsUnsubscribeRequest\"\x92\x01\n\x1f\x43lientEventsUnsubscribeResponse\x12\x37\n\x06status\x18\x01 \x01(\x0e\x32\'.ClientEventsUnsubscribeResponse.Status\"6\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x12\n\x0eINTERNAL_ERROR\x10\x02\"V\n\x16\x43lientEventsGetRequest\x12)\n\rsubscriptions\x18\x01 \x03(\x0b\x32\x12.EventSubscription\x12\x11\n\tblock_ids\x18\x02 \x03(\t\"\xc1\x01\n\x17\x43lientEventsGetResponse\x12/\n\x06status\x18\x01 \x01(\x0e\x32\x1f.ClientEventsGetResponse.Status\x12\x16\n\x06\x65vents\x18\x02 \x03(\x0b\x32\x06.Event\"]\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x12\n\x0eINTERNAL_ERROR\x10\x02\x12\x12\n\x0eINVALID_FILTER\x10\x03\x12\x11\n\rUNKNOWN_BLOCK\x10\x04\x42+\n\x15sawtooth.sdk.protobufP\x01Z\x10\x63lient_event_pb2b\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_settings.protobuf.client_event_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\025sawtooth.sdk.protobufP\001Z\020client_event_pb2'
+  _globals['_CLIENTEVENTSSUBSCRIBEREQUEST']._serialized_start=90
+  _globals['_CLIENTEVENTSSUBSCRIBEREQUEST']._serialized_end=193
+  _globals['_CLIENTEVENTSSUBSCRIBERESPONSE']._serialized_start=196
+  _globals['_CLIENTEVENTSSUBSCRIBERESPONSE']._serialized_end=383
+  _globals['_CLIENTEVENTSSUBSCRIBERESPONSE_STATUS']._serialized_start=310
+  _globals['_CLIENTEVENTSSUBSCRIBERESPONSE_STATUS']._serialized_end=383
+  _globals['_CLIENTEVENTSUNSUBSCRIBEREQUEST']._serialized_start=385
+  _globals['_CLIENTEVENTSUNSUBSCRIBEREQUEST']._serialized_end=417
+  _globals['_CLIENTEVENTSUNSUBSCRIBERESPONSE']._serialized_start=420
+  _globals['_CLIENTEVENTSUNSUBSCRIBERESPONSE']._serialized_end=566
+  _globals['_CLIENTEVENTSUNSUBSCRIBERESPONSE_STATUS']._serialized_start=512
+  _globals['_CLIENTEVENTSUNSUBSCRIBERESPONSE_STATUS']._serialized_end=566
+  _globals['_CLIENTEVENTSGETREQUEST']._serialized_start=568
+  _globals['_CLIENTEVENTSGETREQUEST']._serialized_end=654
+  _globals['_CLIENTEVENTSGETRESPONSE']._serialized_start=657
+  _globals['_CLIENTEVENTSGETRESPONSE']._serialized_end=850
+  _globals['_CLIENTEVENTSGETRESPONSE_STATUS']._serialized_start=757
+  _globals['_CLIENTEVENTSGETRESPONSE_STATUS']._serialized_end=850
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,160 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import logging
+import time
+
+
+LOGGER = logging.getLogger(__name__)
+
+# The number of recent chain heads remembered, to find where a fork switch
+# branched from the previous chain
+MAX_RECENT_HEADS = 256
+
+# The time, in seconds, the chain head is used for after it was last
+# reported or confirmed by the validator
+DEFAULT_MAX_AGE = 1.0
+
+
+class ChainHeadCache:
+    """Holds the id and state root hash of the validator's current chain
+    head, as reported by "sawtooth/block-commit" events.
+
+    The cache is only valid while the event subscription that feeds it is
+    open; it is invalidated when the connection to the validator drops, and
+    callers should then query the validator for the chain head instead.
+
+    Events are received some time after the block is committed, so the
+    cached head may lag a commit that a client has already seen. To bound
+    that lag, the chain head is only returned for max_age seconds after it
+    was last reported, or confirmed by querying the validator.
+
+    Listeners may be notified when a fork switch uncommits blocks.
+
+    Args:
+        max_age (float): The time, in seconds, the chain head is returned for
+            after it was last reported or confirmed.
+    """
+
+    def __init__(self, max_age=DEFAULT_MAX_AGE):
+        self._max_age = max_age
+        self._head_id = None
+        self._state_root_hash = None
+        self._block_num = None
+        self._confirmed = None
+
+        # block_num -> block_id, of the recent chain heads
+        self._recent_heads = {}
+        self._uncommit_listeners = []
+
+    @property
+    def block_num(self):
+        """The block number of the current chain head, or None if the chain
+        head is not known.
+        """
+        return self._block_num
+
+    def add_uncommit_listener(self, callback):
+        """Registers a callback to be called when blocks may have been
+        uncommitted, by a fork switch or while the chain head was not known.
+
+        The callback is passed the block number of the newest block still
+        committed; every block after it may have been uncommitted. It is
+        passed None if that block is not known.
+
+        Args:
+            callback (function): the function to call
+        """
+        self._uncommit_listeners.append(callback)
+
+    def get(self):
+        """Returns the current chain head, if it was reported or confirmed
+        within the last max_age seconds.
+
+        Returns:
+            tuple: (head_id, state_root_hash), or None if the chain head is
+                not known, or should be queried from the validator
+        """
+        if self._head_id is None or \
+                time.monotonic() - self._confirmed > self._max_age:
+            return None
+        return self._head_id, self._state_root_hash
+
+    def confirm(self, head_id):
+        """Records that the validator reported the given block as the chain
+        head, so the cached head may be used for another max_age seconds if
+        it is that block.
+
+        Args:
+            head_id (str): The id of the validator's chain head
+        """
+        if head_id == self._head_id:
+            self._confirmed = time.monotonic()
+
+    def update(self, head_id, state_root_hash, block_num, previous_block_id):
+        """Sets the current chain head, from the most recently committed
+        block.
+
+        Args:
+            head_id (str): The id of the block
+            state_root_hash (str): The state root hash of the block
+            block_num (int): The block number of the block
+            previous_block_id (str): The id of the block's predecessor
+        """
+        if head_id == self._head_id:
+            self._confirmed = time.monotonic()
+            return
+
+        if self._head_id is not None and \
+                previous_block_id != self._head_id:
+            # A fork switch: the new chain branched from the previous one at
+            # the predecessor of this block, if it was a known chain head
+            common_block_num = block_num - 1
+            if self._recent_heads.get(common_block_num) != previous_block_id:
+                common_block_num = None
+
+            LOGGER.debug('Fork switch to %s, from %s',
+                         head_id[:8], self._head_id[:8])
+            self._recent_heads = {
+                num: block_id
+                for num, block_id in self._recent_heads.items()
+                if common_block_num is not None and num <= common_block_num
+            }
+            self._notify_uncommit(common_block_num)
+
+        LOGGER.debug('Chain head is now %s', head_id[:8])
+        self._head_id = head_id
+        self._state_root_hash = state_root_hash
+        self._block_num = block_num
+        self._confirmed = time.monotonic()
+
+        self._recent_heads[block_num] = head_id
+        self._recent_heads.pop(block_num - MAX_RECENT_HEADS, None)
+
+    def invalidate(self):
+        """Forgets the current chain head, until the next update. Blocks
+        committed or uncommitted in the meantime are not known, so the
+        uncommit listeners are notified.
+        """
+        self._head_id = None
+        self._state_root_hash = None
+        self._block_num = None
+        self._confirmed = None
+        self._recent_heads = {}
+        self._notify_uncommit(None)
+
+    def _notify_uncommit(self, common_block_num):
+        for callback in self._uncommit_listeners:
+            callback(common_block_num)
@@ -35,6 +35,10 @@ class _ApiError(HTTPError):
         title (str): A short headline for the error.
         message (str): The human-readable description of the error.
 
+    Args:
+        additional_info (str, optional): Appended to the message.
+        headers (dict, optional): Additional headers for the response.
+
     Raises:
         AssertionError: If api_code, status_code, title, or message were
             not set.
@@ -44,7 +48,7 @@ class _ApiError(HTTPError):
     title = None
     message = None
 
-    def __init__(self, additional_info=''):
+    def __init__(self, additional_info='', headers=None):
         assert self.api_code is not None, 'Invalid ApiError, api_code not set'
         assert self.status_code is not None, 'Invalid ApiError, status not set'
         assert self.title is not None, 'Invalid ApiError, title not set'
@@ -57,6 +61,7 @@ class _ApiError(HTTPError):
         }
 
         super().__init__(
+            headers=headers,
             content_type='application/json',
             text=json.dumps(
                 {'error': error},
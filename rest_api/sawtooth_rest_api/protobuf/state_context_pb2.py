@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: sawtooth_rest_api/protobuf/state_context.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'sawtooth_rest_api/protobuf/state_context.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from sawtooth_rest_api.protobuf import events_pb2 as sawtooth__rest__api_dot_protobuf_dot_events__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n.sawtooth_rest_api/protobuf/state_context.proto\x1a\'sawtooth_rest_api/protobuf/events.proto\"-\n\x0cTpStateEntry\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\":\n\x11TpStateGetRequest\x12\x12\n\ncontext_id\x18\x01 \x01(\t\x12\x11\n\taddresses\x18\x02 \x03(\t\"\x9d\x01\n\x12TpStateGetResponse\x12\x1e\n\x07\x65ntries\x18\x01 \x03(\x0b\x32\r.TpStateEntry\x12*\n\x06status\x18\x02 \x01(\x0e\x32\x1a.TpStateGetResponse.Status\";\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x17\n\x13\x41UTHORIZATION_ERROR\x10\x02\"G\n\x11TpStateSetRequest\x12\x12\n\ncontext_id\x18\x01 \x01(\t\x12\x1e\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\r.TpStateEntry\"\x90\x01\n\x12TpStateSetResponse\x12\x11\n\taddresses\x18\x01 \x03(\t\x12*\n\x06status\x18\x02 \x01(\x0e\x32\x1a.TpStateSetResponse.Status\";\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x17\n\x13\x41UTHORIZATION_ERROR\x10\x02\"=\n\x14TpStateDeleteRequest\x12\x12\n\ncontext_id\x18\x01 \x01(\t\x12\x11\n\taddresses\x18\x02 \x03(\t\"\x96\x01\n\x15TpStateDeleteResponse\x12\x11\n\taddresses\x18\x01 \x03(\t\x12-\n\x06status\x18\x02 \x01(\x0e\x32\x1d.TpStateDeleteResponse.Status\";\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x17\n\x13\x41UTHORIZATION_ERROR\x10\x02\";\n\x17TpReceiptAddDataRequest\x12\x12\n\ncontext_id\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\"{\n\x18TpReceiptAddDataResponse\x12\x30\n\x06status\x18\x02 \x01(\x0e\x32 .TpReceiptAddDataResponse.Status\"-\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\t\n\x05\x45RROR\x10\x02\">\n\x11TpEventAddRequest\x12\x12\n\ncontext_id\x18\x01 \x01(\t\x12\x15\n\x05\x65vent\x18\x02 \x01(\x0b\x32\x06.Event\"o\n\x12TpEventAddResponse\x12*\n\x06status\x18\x02 \x01(\x0e\x32\x1a.TpEventAddResponse.Status\"-\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\t\n\x05\x45RROR\x10\x02\x42,\n\x15sawtooth.sdk.protobufP\x01Z\x11state_context_pb2b\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_rest_api.protobuf.state_context_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\025sawtooth.sdk.protobufP\001Z\021state_context_pb2'
+  _globals['_TPSTATEENTRY']._serialized_start=91
+  _globals['_TPSTATEENTRY']._serialized_end=136
+  _globals['_TPSTATEGETREQUEST']._serialized_start=138
+  _globals['_TPSTATEGETREQUEST']._serialized_end=196
+  _globals['_TPSTATEGETRESPONSE']._serialized_start=199
+  _globals['_TPSTATEGETRESPONSE']._serialized_end=356
+  _globals['_TPSTATEGETRESPONSE_STATUS']._serialized_start=297
+  _globals['_TPSTATEGETRESPONSE_STATUS']._serialized_end=356
+  _globals['_TPSTATESETREQUEST']._serialized_start=358
+  _globals['_TPSTATESETREQUEST']._serialized_end=429
+  _globals['_TPSTATESETRESPONSE']._serialized_start=432
+  _globals['_TPSTATESETRESPONSE']._serialized_end=576
+  _globals['_TPSTATESETRESPONSE_STATUS']._serialized_start=297
+  _globals['_TPSTATESETRESPONSE_STATUS']._serialized_end=356
+  _globals['_TPSTATEDELETEREQUEST']._serialized_start=578
+  _globals['_TPSTATEDELETEREQUEST']._serialized_end=639
+  _globals['_TPSTATEDELETERESPONSE']._serialized_start=642
+  _globals['_TPSTATEDELETERESPONSE']._serialized_end=792
+  _globals['_TPSTATEDELETERESPONSE_STATUS']._serialized_start=297
+  _globals['_TPSTATEDELETERESPONSE_STATUS']._serialized_end=356
+  _globals['_TPRECEIPTADDDATAREQUEST']._serialized_start=794
+  _globals['_TPRECEIPTADDDATAREQUEST']._serialized_end=853
+  _globals['_TPRECEIPTADDDATARESPONSE']._serialized_start=855
+  _globals['_TPRECEIPTADDDATARESPONSE']._serialized_end=978
+  _globals['_TPRECEIPTADDDATARESPONSE_STATUS']._serialized_start=933
+  _globals['_TPRECEIPTADDDATARESPONSE_STATUS']._serialized_end=978
+  _globals['_TPEVENTADDREQUEST']._serialized_start=980
+  _globals['_TPEVENTADDREQUEST']._serialized_end=1042
+  _globals['_TPEVENTADDRESPONSE']._serialized_start=1044
+  _globals['_TPEVENTADDRESPONSE']._serialized_end=1155
+  _globals['_TPEVENTADDRESPONSE_STATUS']._serialized_start=933
+  _globals['_TPEVENTADDRESPONSE_STATUS']._serialized_end=978
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,134 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+from collections import namedtuple
+from collections import OrderedDict
+import hashlib
+import logging
+
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+_CacheEntry = namedtuple('_CacheEntry', ['body', 'etag', 'block_num'])
+
+
+class ResponseCache:
+    """A size-bounded LRU cache of rendered JSON responses, for committed
+    resources addressed by id: blocks, batches, transactions and receipts.
+
+    These do not change while the block they are in stays committed, so each
+    entry records the number of the block the resource is in. Entries are
+    dropped when a fork switch uncommits a block with a number that high,
+    which the cache learns of as a listener of a ChainHeadCache. Entries for
+    which the block is not known are dropped by every fork switch.
+
+    Args:
+        max_bytes (int): The maximum size of the cached response bodies, in
+            bytes.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+
+        # Incremented whenever entries are uncommitted, so that responses
+        # queried before then are not cached after
+        self._generation = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def generation(self):
+        """A value that changes whenever blocks are uncommitted. It should be
+        read before querying the validator for a response, and passed back
+        to put.
+        """
+        return self._generation
+
+    def get(self, key):
+        """Returns the cached response.
+
+        Args:
+            key (hashable): The key the response was cached under
+
+        Returns:
+            tuple: (body, etag), with the body as bytes, or None if the
+                response is not cached
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+        return entry.body, entry.etag
+
+    def put(self, key, body, etag, block_num, generation):
+        """Caches a response.
+
+        Args:
+            key (hashable): The key to cache the response under
+            body (bytes): The encoded response body
+            etag (str): The entity tag of the body
+            block_num (int): The number of the block the resource is in, or
+                None if it is not known
+            generation (int): The generation read before the response was
+                queried; the response is not cached if it has changed since
+        """
+        if generation != self._generation or len(body) > self._max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous.body)
+
+        self._entries[key] = _CacheEntry(body, etag, block_num)
+        self._size += len(body)
+
+        while self._size > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.body)
+
+    def uncommit(self, common_block_num):
+        """Drops the responses for resources that may have been in blocks
+        after the given block, which have been uncommitted.
+
+        Args:
+            common_block_num (int): The number of the newest block still
+                committed, or None if it is not known, to drop everything
+        """
+        self._generation += 1
+
+        if common_block_num is None:
+            self._entries.clear()
+            self._size = 0
+            return
+
+        for key, entry in list(self._entries.items()):
+            if entry.block_num is None or entry.block_num > common_block_num:
+                del self._entries[key]
+                self._size -= len(entry.body)
+
+        LOGGER.debug('%s responses cached after fork switch', len(self))
+
+
+def make_etag(body):
+    """Returns a strong entity tag for an encoded response body.
+    """
+    return '"{}"'.format(hashlib.sha256(body).hexdigest())
@@ -33,6 +33,8 @@ from sawtooth_sdk.processor.config import get_log_config
 from sawtooth_sdk.processor.config import get_log_dir
 from sawtooth_sdk.processor.config import get_config_dir
 from sawtooth_rest_api.messaging import Connection
+from sawtooth_rest_api.chain_head_cache import ChainHeadCache
+from sawtooth_rest_api.response_cache import ResponseCache
 from sawtooth_rest_api.route_handlers import RouteHandler
 from sawtooth_rest_api.state_delta_subscription_handler \
     import StateDeltaSubscriberHandler
@@ -102,7 +104,11 @@ def start_rest_api(host, port, connection, timeout, registry,
     # Add routes to the web app
     LOGGER.info('Creating handlers for validator at %s', connection.url)
 
-    handler = RouteHandler(loop, connection, timeout, registry)
+    chain_head_cache = ChainHeadCache()
+    response_cache = ResponseCache()
+    chain_head_cache.add_uncommit_listener(response_cache.uncommit)
+    handler = RouteHandler(
+        loop, connection, timeout, registry, chain_head_cache, response_cache)
 
     app.router.add_post('/batches', handler.submit_batches)
     app.router.add_get('/batch_statuses', handler.list_statuses)
@@ -128,8 +134,10 @@ def start_rest_api(host, port, connection, timeout, registry,
     app.router.add_get('/peers', handler.fetch_peers)
     app.router.add_get('/status', handler.fetch_status)
 
-    subscriber_handler = StateDeltaSubscriberHandler(connection)
+    subscriber_handler = StateDeltaSubscriberHandler(
+        connection, chain_head_cache)
     app.router.add_get('/subscriptions', subscriber_handler.subscriptions)
+    app.on_startup.append(lambda app: subscriber_handler.on_startup())
     app.on_shutdown.append(lambda app: subscriber_handler.on_shutdown())
 
     # Start app
@@ -31,6 +31,7 @@ import sawtooth_rest_api.exceptions as errors
 from sawtooth_rest_api import error_handlers
 from sawtooth_rest_api.messaging import DisconnectError
 from sawtooth_rest_api.messaging import SendBackoffTimeoutError
+from sawtooth_rest_api.response_cache import make_etag
 from sawtooth_rest_api.protobuf import client_transaction_pb2
 from sawtooth_rest_api.protobuf import client_list_control_pb2
 from sawtooth_rest_api.protobuf import client_batch_submit_pb2
@@ -98,14 +99,24 @@ class RouteHandler:
             with the validator.
         timeout (int, optional): The time in seconds before the Api should
             cancel a request and report that the validator is unavailable.
+        chain_head_cache (:obj: ChainHeadCache, optional): If set, the chain
+            head used for state queries without a head, when it is known and
+            was recently reported or confirmed.
+        response_cache (:obj: ResponseCache, optional): If set, caches the
+            responses for blocks, batches, transactions and receipts fetched
+            by id. Requires a chain_head_cache, which must notify it of
+            uncommitted blocks.
     """
 
     def __init__(
             self, loop, connection,
-            timeout=DEFAULT_TIMEOUT, metrics_registry=None):
+            timeout=DEFAULT_TIMEOUT, metrics_registry=None,
+            chain_head_cache=None, response_cache=None):
         self._loop = loop
         self._connection = connection
         self._timeout = timeout
+        self._chain_head_cache = chain_head_cache
+        self._response_cache = response_cache
         if metrics_registry:
             self._post_batches_count = CounterWrapper(
                 metrics_registry.counter('post_batches_count'))
@@ -363,15 +374,23 @@ class RouteHandler:
         block_id = request.match_info.get('block_id', '')
         self._validate_id(block_id)
 
+        cache_key = self._get_cache_key(request, block_id)
+        cached = self._get_cached_response(request, cache_key)
+        if cached is not None:
+            return cached
+        generation = self._get_cache_generation()
+
         response = await self._query_validator(
             Message.CLIENT_BLOCK_GET_BY_ID_REQUEST,
             client_block_pb2.ClientBlockGetResponse,
             client_block_pb2.ClientBlockGetByIdRequest(block_id=block_id),
             error_traps)
 
-        return self._wrap_response(
-            request,
-            data=self._expand_block(response['block']),
+        block = self._expand_block(response['block'])
+        return self._wrap_cacheable_response(
+            request, cache_key, generation,
+            block_num=int(block['header'].get('block_num', 0)),
+            data=block,
             metadata=self._get_metadata(request, response))
 
     async def list_batches(self, request):
@@ -422,14 +441,20 @@ class RouteHandler:
         batch_id = request.match_info.get('batch_id', '')
         self._validate_id(batch_id)
 
+        cache_key = self._get_cache_key(request, batch_id)
+        cached = self._get_cached_response(request, cache_key)
+        if cached is not None:
+            return cached
+        generation = self._get_cache_generation()
+
         response = await self._query_validator(
             Message.CLIENT_BATCH_GET_REQUEST,
             client_batch_pb2.ClientBatchGetResponse,
             client_batch_pb2.ClientBatchGetRequest(batch_id=batch_id),
             error_traps)
 
-        return self._wrap_response(
-            request,
+        return self._wrap_cacheable_response(
+            request, cache_key, generation,
             data=self._expand_batch(response['batch']),
             metadata=self._get_metadata(request, response))
 
@@ -483,6 +508,12 @@ class RouteHandler:
         txn_id = request.match_info.get('transaction_id', '')
         self._validate_id(txn_id)
 
+        cache_key = self._get_cache_key(request, txn_id)
+        cached = self._get_cached_response(request, cache_key)
+        if cached is not None:
+            return cached
+        generation = self._get_cache_generation()
+
         response = await self._query_validator(
             Message.CLIENT_TRANSACTION_GET_REQUEST,
             client_transaction_pb2.ClientTransactionGetResponse,
@@ -490,8 +521,8 @@ class RouteHandler:
                 transaction_id=txn_id),
             error_traps)
 
-        return self._wrap_response(
-            request,
+        return self._wrap_cacheable_response(
+            request, cache_key, generation,
             data=self._expand_transaction(response['transaction']),
             metadata=self._get_metadata(request, response))
 
@@ -536,6 +567,12 @@ class RouteHandler:
                 LOGGER.debug('Request for receipts missing id query')
                 raise errors.ReceiptIdQueryInvalid()
 
+        cache_key = self._get_cache_key(request, *ids)
+        cached = self._get_cached_response(request, cache_key)
+        if cached is not None:
+            return cached
+        generation = self._get_cache_generation()
+
         # Query validator
         validator_query = \
             client_receipt_pb2.ClientReceiptGetRequest(
@@ -557,7 +594,8 @@ class RouteHandler:
         data = self._drop_id_prefixes(
             self._drop_empty_props(response['receipts']))
 
-        return self._wrap_response(request, data=data, metadata=metadata)
+        return self._wrap_cacheable_response(
+            request, cache_key, generation, data=data, metadata=metadata)
 
     async def fetch_peers(self, request):
         """Fetches the peers from the validator.
@@ -643,6 +681,11 @@ class RouteHandler:
                 error_traps)
             block = self._expand_block(response['block'])
         else:
+            if self._chain_head_cache is not None:
+                head = self._chain_head_cache.get()
+                if head is not None:
+                    return head
+
             response = await self._query_validator(
                 Message.CLIENT_BLOCK_LIST_REQUEST,
                 client_block_pb2.ClientBlockListResponse,
@@ -651,6 +694,8 @@ class RouteHandler:
                         limit=1)),
                 error_traps)
             block = self._expand_block(response['blocks'][0])
+            if self._chain_head_cache is not None:
+                self._chain_head_cache.confirm(block['header_signature'])
         return (
             block['header_signature'],
             block['header']['state_root_hash'],
@@ -707,28 +752,105 @@ class RouteHandler:
         except AttributeError:
             pass
 
+        # Pass the validator's retry hint on to the client, so that it can
+        # pace its submissions
+        try:
+            if content.status == proto.QUEUE_FULL and content.retry_after:
+                raise errors.BatchQueueFull(
+                    headers={'Retry-After': str(content.retry_after)})
+        except AttributeError:
+            pass
+
         # Check custom error traps from the particular route message
         if error_traps is not None:
             for trap in error_traps:
                 trap.check(content.status)
 
-    @staticmethod
-    def _wrap_response(request, data=None, metadata=None, status=200):
+    @classmethod
+    def _wrap_response(cls, request, data=None, metadata=None, status=200):
         """Creates the JSON response envelope to be sent back to the client.
         """
+        return web.Response(
+            status=status,
+            content_type='application/json',
+            text=cls._dump_envelope(data, metadata))
+
+    @staticmethod
+    def _dump_envelope(data=None, metadata=None):
         envelope = metadata or {}
 
         if data is not None:
             envelope['data'] = data
 
+        return json.dumps(
+            envelope,
+            indent=2,
+            separators=(',', ': '),
+            sort_keys=True)
+
+    def _wrap_cacheable_response(self, request, cache_key, generation,
+                                 block_num=None, data=None, metadata=None):
+        """Creates the JSON response envelope for a resource fetched by id,
+        tagged with an ETag, and caches it.
+
+        The block_num is the number of the block the resource is in. If it
+        is not known, the response is dropped from the cache by any fork
+        switch.
+        """
+        body = self._dump_envelope(data, metadata).encode()
+        etag = make_etag(body)
+
+        # Responses are only cached while fork switches are being reported
+        if self._response_cache is not None and \
+                self._chain_head_cache is not None and \
+                self._chain_head_cache.block_num is not None:
+            self._response_cache.put(
+                cache_key, body, etag, block_num, generation)
+
+        return self._wrap_tagged_response(request, body, etag)
+
+    def _get_cached_response(self, request, cache_key):
+        """Returns the cached response for a resource fetched by id, or None
+        if it is not cached.
+        """
+        if self._response_cache is None:
+            return None
+
+        cached = self._response_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        body, etag = cached
+        return self._wrap_tagged_response(request, body, etag)
+
+    def _get_cache_generation(self):
+        if self._response_cache is None:
+            return None
+        return self._response_cache.generation
+
+    @classmethod
+    def _get_cache_key(cls, request, *resource_ids):
+        """Returns the key a response is cached under. Responses include a
+        link built from the request, so it is part of the key.
+        """
+        return request.method, cls._build_url(request), resource_ids
+
+    @staticmethod
+    def _wrap_tagged_response(request, body, etag):
+        """Creates a response with an ETag, or a 304 Not Modified response
+        if the client already has the body, per its If-None-Match header.
+        """
+        if_none_match = request.headers.get('If-None-Match', '')
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        if '*' in tags or etag in tags or 'W/' + etag in tags:
+            return web.Response(status=304, headers={'ETag': etag})
+
         return web.Response(
-            status=status,
+            status=200,
             content_type='application/json',
-            text=json.dumps(
-                envelope,
-                indent=2,
-                separators=(',', ': '),
-                sort_keys=True))
+            charset='utf-8',
+            body=body,
+            headers={'ETag': etag})
 
     @classmethod
     def _wrap_paginated_response(cls, request, response, controls, data,
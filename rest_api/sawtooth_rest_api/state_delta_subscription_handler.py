@@ -16,6 +16,7 @@
 import asyncio
 import logging
 import json
+import re
 import aiohttp
 from aiohttp import web
 
@@ -27,6 +28,7 @@ from sawtooth_rest_api.messaging import ConnectionEvent
 from sawtooth_rest_api.messaging import DisconnectError
 from sawtooth_rest_api.protobuf import client_list_control_pb2
 from sawtooth_rest_api.protobuf import client_block_pb2
+from sawtooth_rest_api.protobuf import block_pb2
 from sawtooth_rest_api.protobuf import client_event_pb2
 from sawtooth_rest_api.protobuf import events_pb2
 from sawtooth_rest_api.protobuf import transaction_receipt_pb2
@@ -43,21 +45,29 @@ class StateDeltaSubscriberHandler:
     deltas.
 
     This handler acts as a subscriber on behalf of all incoming websocket
-    connections.  The handler subscribes to all state delta changes when the
-    first websocket client requests a subscription, regardless of the client's
-    own address prefix filters of interest. Subsequent websocket subscribers
-    all are fed state deltas from the incoming complete stream, filtered by
-    this handler according to their preferred filters.
+    connections.  The handler subscribes to the state deltas of the blocks
+    that change an address under any of the websocket clients' address
+    prefixes, renewing the subscription as clients subscribe. Each websocket
+    subscriber is fed the state deltas from this stream, filtered by this
+    handler according to their preferred filters.
+
+    If given a chain head cache, the handler also subscribes to block commits
+    on startup, and keeps the cache up to date with each block committed for
+    as long as the REST API runs. State deltas are only subscribed to while
+    there are websocket subscribers.
     """
 
-    def __init__(self, connection):
+    def __init__(self, connection, chain_head_cache=None):
         """
         Constructs this handler on a given validator connection.
 
         Args:
             connection (messaging.Connection): the validator connection
+            chain_head_cache (ChainHeadCache, optional): the cache to update
+                with each block committed
         """
         self._connection = connection
+        self._chain_head_cache = chain_head_cache
 
         self._latest_state_delta_event = None
         self._subscribers = []
@@ -73,14 +83,21 @@ class StateDeltaSubscriberHandler:
             ConnectionEvent.RECONNECTED,
             self._handle_reconnection)
 
+    async def on_startup(self):
+        """
+        Subscribes to events, if there is a chain head cache to update.
+        """
+        if self._should_listen():
+            await self._register_subscriptions()
+
     async def on_shutdown(self):
         """
         Cleans up any outstanding subscriptions.
         """
-        await self._unregister_subscriptions()
-
         self._accepting = False
 
+        await self._unregister_subscriptions()
+
         for (ws, _) in self._subscribers:
             await ws.close(code=aiohttp.WSCloseCode.GOING_AWAY,
                            message='Server shutdown')
@@ -138,12 +155,15 @@ class StateDeltaSubscriberHandler:
             }))
 
     async def _handle_subscribe(self, web_sock, subscription_message):
-        if not self._subscribers:
-            await self._register_subscriptions()
+        addr_prefixes = subscription_message.get('address_prefixes', [])
+
+        # Renew the subscription, so it includes the new subscriber's
+        # address prefixes
+        await self._register_subscriptions(
+            self._subscribers + [(web_sock, addr_prefixes)])
 
         LOGGER.debug('Sending initial most recent event to new subscriber')
 
-        addr_prefixes = subscription_message.get('address_prefixes', [])
         with await self._subscriber_lock:
             self._subscribers.append((web_sock, addr_prefixes))
 
@@ -170,10 +190,18 @@ class StateDeltaSubscriberHandler:
                 del self._subscribers[index]
 
             if not self._subscribers:
-                asyncio.ensure_future(self._unregister_subscriptions())
+                asyncio.ensure_future(self._release_subscriptions())
+
+    def _should_listen(self):
+        return bool(self._subscribers) or (
+            self._accepting and self._chain_head_cache is not None)
 
     async def _handle_disconnect(self):
         LOGGER.debug('Validator disconnected')
+        if self._chain_head_cache is not None:
+            # Blocks committed until the subscription is renewed would be
+            # missed
+            self._chain_head_cache.invalidate()
         for (ws, _) in self._subscribers:
             await ws.send_str(json.dumps({
                 'warning': 'Validator unavailable'
@@ -185,17 +213,36 @@ class StateDeltaSubscriberHandler:
         # not a validator restart)
         try:
             await self._unregister_subscriptions()
-            if self._subscribers:
+            if self._should_listen():
                 await self._register_subscriptions()
         except DisconnectError:
             LOGGER.debug('Validator is not yet available')
             return
 
-    async def _register_subscriptions(self):
+    async def _release_subscriptions(self):
+        """Once the last websocket subscriber has left, unsubscribes, or
+        subscribes to block commits alone, if the chain head cache is still
+        kept up to date.
+        """
+        if self._should_listen():
+            await self._register_subscriptions()
+        else:
+            await self._unregister_subscriptions()
+
+    async def _register_subscriptions(self, subscribers=None):
+        """Subscribes to block commits, and to the state deltas of interest
+        to the given websocket subscribers, which default to the current
+        ones. A subscription already in place is replaced.
+        """
+        if subscribers is None:
+            subscribers = self._subscribers
+
         try:
-            last_known_block_id = await self._get_latest_block_id()
-            self._latest_state_delta_event = \
-                await self._get_block_deltas(last_known_block_id)
+            last_known_block_id, last_known_header = \
+                await self._get_chain_head()
+            if subscribers:
+                self._latest_state_delta_event = \
+                    await self._get_block_deltas(last_known_block_id)
 
             LOGGER.debug('Starting subscriber from %s',
                          last_known_block_id[:8])
@@ -203,7 +250,7 @@ class StateDeltaSubscriberHandler:
             resp = await self._connection.send(
                 Message.CLIENT_EVENTS_SUBSCRIBE_REQUEST,
                 client_event_pb2.ClientEventsSubscribeRequest(
-                    subscriptions=self._make_subscriptions(),
+                    subscriptions=self._make_subscriptions(subscribers),
                     last_known_block_ids=[last_known_block_id],
                 ).SerializeToString())
 
@@ -214,9 +261,20 @@ class StateDeltaSubscriberHandler:
             if subscription.status != \
                     client_event_pb2.ClientEventsSubscribeResponse.OK:
                 LOGGER.error('unable to subscribe!')
+            elif self._chain_head_cache is not None and \
+                    last_known_header is not None and \
+                    self._chain_head_cache.block_num is None:
+                # Unless an event for a later block has already been received
+                self._chain_head_cache.update(
+                    last_known_block_id,
+                    last_known_header.state_root_hash,
+                    last_known_header.block_num,
+                    last_known_header.previous_block_id)
 
             self._listening = True
-            self._delta_task = asyncio.ensure_future(self._listen_for_events())
+            if self._delta_task is None:
+                self._delta_task = asyncio.ensure_future(
+                    self._listen_for_events())
         except asyncio.TimeoutError as e:
             LOGGER.error('Unable to subscribe to events: %s', str(e))
         except DisconnectError:
@@ -225,7 +283,7 @@ class StateDeltaSubscriberHandler:
 
     async def _unregister_subscriptions(self):
         with await self._subscriber_lock:
-            if self._delta_task and not self._subscribers:
+            if self._delta_task and not self._should_listen():
                 self._listening = False
                 self._delta_task.cancel()
                 self._delta_task = None
@@ -264,7 +322,12 @@ class StateDeltaSubscriberHandler:
         resp = await self._connection.send(
             Message.CLIENT_EVENTS_GET_REQUEST,
             client_event_pb2.ClientEventsGetRequest(
-                subscriptions=self._make_subscriptions(),
+                subscriptions=[
+                    events_pb2.EventSubscription(
+                        event_type="sawtooth/state-delta"),
+                    events_pb2.EventSubscription(
+                        event_type="sawtooth/block-commit"),
+                ],
                 block_ids=[block_id]).SerializeToString(),
             timeout=DEFAULT_TIMEOUT)
 
@@ -281,7 +344,7 @@ class StateDeltaSubscriberHandler:
 
         return None
 
-    async def _get_latest_block_id(self):
+    async def _get_chain_head(self):
         resp = await self._connection.send(
             Message.CLIENT_BLOCK_LIST_REQUEST,
             client_block_pb2.ClientBlockListRequest(
@@ -295,7 +358,12 @@ class StateDeltaSubscriberHandler:
            client_block_pb2.ClientBlockListResponse.OK:
             LOGGER.error('Unable to fetch latest block id')
 
-        return block_list_resp.head_id
+        header = None
+        if block_list_resp.blocks:
+            header = block_pb2.BlockHeader()
+            header.ParseFromString(block_list_resp.blocks[0].header)
+
+        return block_list_resp.head_id, header
 
     async def _listen_for_events(self):
         LOGGER.debug('Subscribing to state delta events')
@@ -315,11 +383,19 @@ class StateDeltaSubscriberHandler:
                     state_delta_event = StateDeltaEvent(events)
                 except KeyError as err:
                     LOGGER.warning("Received unexpected event list: %s", err)
+                    continue
 
                 LOGGER.debug('Received event %s: %s changes',
                              state_delta_event.block_id[:8],
                              len(state_delta_event.state_changes))
 
+                if self._chain_head_cache is not None:
+                    self._chain_head_cache.update(
+                        state_delta_event.block_id,
+                        state_delta_event.state_root_hash,
+                        int(state_delta_event.block_num),
+                        state_delta_event.previous_block_id)
+
                 base_event = {
                     'block_id': state_delta_event.block_id,
                     'block_num': state_delta_event.block_num,
@@ -362,11 +438,32 @@ class StateDeltaSubscriberHandler:
         return False
 
     @staticmethod
-    def _make_subscriptions(address_prefixes=None):
-        return [
-            events_pb2.EventSubscription(event_type="sawtooth/state-delta"),
+    def _make_subscriptions(subscribers):
+        """Creates the event subscriptions for the given websocket
+        subscribers: block commits, and if there are subscribers, the state
+        deltas that change an address under any of their address prefixes.
+        """
+        subscriptions = [
             events_pb2.EventSubscription(event_type="sawtooth/block-commit"),
         ]
+        if not subscribers:
+            return subscriptions
+
+        filters = []
+        addr_prefixes = [
+            prefix for _, prefixes in subscribers for prefix in prefixes]
+        # A subscriber without address prefixes receives every state delta
+        if all(prefixes for _, prefixes in subscribers):
+            filters.append(events_pb2.EventFilter(
+                key="address",
+                match_string='^(?:{})'.format(
+                    '|'.join(re.escape(prefix)
+                             for prefix in sorted(set(addr_prefixes)))),
+                filter_type=events_pb2.EventFilter.REGEX_ANY))
+
+        subscriptions.append(events_pb2.EventSubscription(
+            event_type="sawtooth/state-delta", filters=filters))
+        return subscriptions
 
     @staticmethod
     def _make_state_delta_event(event_list):
@@ -379,22 +476,29 @@ class StateDeltaEvent:
     def __init__(self, event_list):
         """
         Convert an event list into an object that is similar to the previous
-        state delta event for compatibility.
+        state delta event for compatibility. The state changes are empty if
+        the list has no state delta event, as the block changed no address
+        subscribed to, or state deltas were not subscribed to.
 
         Raises
             KeyError
-                An event was missing from the event list or an attribute was
-                missing from an event.
+                The block commit event was missing from the event list or an
+                attribute was missing from an event.
         """
         block_commit = self._get_event("sawtooth/block-commit", event_list)
         self.block_id = self._get_attr(block_commit, "block_id")
         self.block_num = self._get_attr(block_commit, "block_num")
         self.previous_block_id = self._get_attr(
             block_commit, "previous_block_id")
+        self.state_root_hash = self._get_attr(
+            block_commit, "state_root_hash")
 
-        state_delta = self._get_event("sawtooth/state-delta", event_list)
         state_change_list = transaction_receipt_pb2.StateChangeList()
-        state_change_list.ParseFromString(state_delta.data)
+        try:
+            state_delta = self._get_event("sawtooth/state-delta", event_list)
+            state_change_list.ParseFromString(state_delta.data)
+        except KeyError:
+            pass
         self.state_changes = state_change_list.state_changes
 
     @staticmethod
@@ -14,7 +14,10 @@
 # ------------------------------------------------------------------------------
 
 from aiohttp.test_utils import unittest_run_loop
-from components import Mocks, BaseApiTest
+from components import Mocks, BaseApiTest, TEST_TIMEOUT
+from sawtooth_rest_api.chain_head_cache import ChainHeadCache
+from sawtooth_rest_api.response_cache import ResponseCache
+from sawtooth_rest_api.route_handlers import RouteHandler
 from sawtooth_rest_api.protobuf.validator_pb2 import Message
 from sawtooth_rest_api.protobuf import client_batch_pb2
 
@@ -578,3 +581,52 @@ class BatchGetTests(BaseApiTest):
                                                 404)
 
         self.assert_has_valid_error(response, 71)
+
+
+class BatchGetCachedTests(BaseApiTest):
+    async def get_application(self):
+        self.set_status_and_connection(
+            Message.CLIENT_BATCH_GET_REQUEST,
+            client_batch_pb2.ClientBatchGetRequest,
+            client_batch_pb2.ClientBatchGetResponse)
+
+        self.chain_head_cache = ChainHeadCache()
+        self.chain_head_cache.update(ID_B, 'root_hash', 1, ID_A)
+        self.chain_head_cache.update(ID_C, 'root_hash', 2, ID_B)
+        response_cache = ResponseCache()
+        self.chain_head_cache.add_uncommit_listener(response_cache.uncommit)
+
+        handlers = RouteHandler(
+            self.loop, self.connection, TEST_TIMEOUT,
+            chain_head_cache=self.chain_head_cache,
+            response_cache=response_cache)
+        return self.build_app(
+            self.loop, '/batches/{batch_id}', handlers.fetch_batch)
+
+    @unittest_run_loop
+    async def test_batch_get_uncommitted(self):
+        """Verifies a cached GET /batches/{batch_id} response, whose block
+        is not known, is dropped by any fork switch, even one that keeps
+        every block known when the batch was fetched.
+
+        It will receive a Protobuf response, twice, with:
+            - a batch with an id of ID_D
+
+        It should send a Protobuf request with:
+            - a batch_id property of ID_D, only once before the fork switch,
+              and again after it
+        """
+        self.connection.preset_response(batch=Mocks.make_batches(ID_D)[0])
+        await self.get_assert_200('/batches/{}'.format(ID_D))
+        self.connection.assert_valid_request_sent(batch_id=ID_D)
+
+        await self.get_assert_200('/batches/{}'.format(ID_D))
+
+        # The batch's block may be committed before its event is received,
+        # and be uncommitted by a fork switch from a later block
+        self.chain_head_cache.update(ID_D, 'root_hash', 3, ID_C)
+        self.chain_head_cache.update('e' * 128, 'root_hash', 3, ID_C)
+
+        self.connection.preset_response(batch=Mocks.make_batches(ID_D)[0])
+        await self.get_assert_200('/batches/{}'.format(ID_D))
+        self.connection.assert_valid_request_sent(batch_id=ID_D)
@@ -14,7 +14,10 @@
 # ------------------------------------------------------------------------------
 
 from aiohttp.test_utils import unittest_run_loop
-from components import Mocks, BaseApiTest
+from components import Mocks, BaseApiTest, TEST_TIMEOUT
+from sawtooth_rest_api.chain_head_cache import ChainHeadCache
+from sawtooth_rest_api.response_cache import ResponseCache
+from sawtooth_rest_api.route_handlers import RouteHandler
 from sawtooth_rest_api.protobuf.validator_pb2 import Message
 from sawtooth_rest_api.protobuf import client_block_pb2
 
@@ -573,3 +576,77 @@ class BlockGetTests(BaseApiTest):
         response = await self.get_assert_status('/blocks/{}'.format(ID_D), 404)
 
         self.assert_has_valid_error(response, 70)
+
+
+class BlockGetCachedTests(BaseApiTest):
+    async def get_application(self):
+        self.set_status_and_connection(
+            Message.CLIENT_BLOCK_GET_BY_ID_REQUEST,
+            client_block_pb2.ClientBlockGetByIdRequest,
+            client_block_pb2.ClientBlockGetResponse)
+
+        self.chain_head_cache = ChainHeadCache()
+        self.chain_head_cache.update(ID_C, 'root_hash', 2, ID_B)
+        response_cache = ResponseCache()
+        self.chain_head_cache.add_uncommit_listener(response_cache.uncommit)
+
+        handlers = RouteHandler(
+            self.loop, self.connection, TEST_TIMEOUT,
+            chain_head_cache=self.chain_head_cache,
+            response_cache=response_cache)
+        return self.build_app(
+            self.loop, '/blocks/{block_id}', handlers.fetch_block)
+
+    @unittest_run_loop
+    async def test_block_get_cached(self):
+        """Verifies a repeated GET /blocks/{block_id} is answered from the
+        response cache, with an ETag.
+
+        It will receive a Protobuf response, only once, with:
+            - a block with an id of ID_B
+
+        It should send back JSON responses with:
+            - a response status of 200
+            - the same ETag header, and the same body
+
+        And when the ETag is sent back in an If-None-Match header:
+            - a response status of 304
+        """
+        self.connection.preset_response(block=Mocks.make_blocks(ID_B)[0])
+
+        first = await self.client.get('/blocks/{}'.format(ID_B))
+        self.assertEqual(200, first.status)
+        self.connection.assert_valid_request_sent(block_id=ID_B)
+
+        second = await self.client.get('/blocks/{}'.format(ID_B))
+        self.assertEqual(200, second.status)
+        self.assertEqual(await first.text(), await second.text())
+        self.assertIn('ETag', first.headers)
+        self.assertEqual(first.headers['ETag'], second.headers['ETag'])
+
+        not_modified = await self.client.get(
+            '/blocks/{}'.format(ID_B),
+            headers={'If-None-Match': first.headers['ETag']})
+        self.assertEqual(304, not_modified.status)
+
+    @unittest_run_loop
+    async def test_block_get_uncommitted(self):
+        """Verifies a cached GET /blocks/{block_id} response is dropped when
+        its block is uncommitted by a fork switch.
+
+        It will receive a Protobuf response, twice, with:
+            - a block with an id of ID_B
+
+        It should send a Protobuf request with:
+            - a block_id property of ID_B, again after the fork switch
+        """
+        self.connection.preset_response(block=Mocks.make_blocks(ID_B)[0])
+        await self.get_assert_200('/blocks/{}'.format(ID_B))
+        self.connection.assert_valid_request_sent(block_id=ID_B)
+
+        # A new head that does not follow the previous one
+        self.chain_head_cache.update(ID_D, 'root_hash', 3, ID_A)
+
+        self.connection.preset_response(block=Mocks.make_blocks(ID_B)[0])
+        await self.get_assert_200('/blocks/{}'.format(ID_B))
+        self.connection.assert_valid_request_sent(block_id=ID_B)
@@ -0,0 +1,59 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import unittest
+
+from sawtooth_rest_api.response_cache import ResponseCache
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def test_size_in_bytes(self):
+        """Verifies that the size of the cached bodies is bounded in bytes,
+        evicting the least recently used bodies.
+        """
+        cache = ResponseCache(max_bytes=9)
+
+        cache.put('a', 'ééé'.encode(), 'etag-a', 1, cache.generation)
+        cache.put('b', b'bb', 'etag-b', 1, cache.generation)
+        self.assertEqual(('ééé'.encode(), 'etag-a'), cache.get('a'))
+
+        cache.put('c', b'ccc', 'etag-c', 1, cache.generation)
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('c'))
+
+        # Larger than the cache in bytes, though not in characters
+        cache.put('d', 'ééééé'.encode(), 'etag-d', 1, cache.generation)
+        self.assertIsNone(cache.get('d'))
+
+    def test_uncommit(self):
+        """Verifies that an uncommit drops the bodies from blocks after the
+        newest block still committed, and those from unknown blocks.
+        """
+        cache = ResponseCache()
+        cache.put('committed', b'1', 'etag-1', 1, cache.generation)
+        cache.put('uncommitted', b'2', 'etag-2', 2, cache.generation)
+        cache.put('unknown', b'3', 'etag-3', None, cache.generation)
+
+        generation = cache.generation
+        cache.uncommit(1)
+
+        self.assertIsNotNone(cache.get('committed'))
+        self.assertIsNone(cache.get('uncommitted'))
+        self.assertIsNone(cache.get('unknown'))
+
+        # Responses queried before the uncommit are not cached
+        cache.put('stale', b'4', 'etag-4', 1, generation)
+        self.assertIsNone(cache.get('stale'))
@@ -0,0 +1,88 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+# pylint: disable=protected-access
+
+import unittest
+
+from sawtooth_rest_api.state_delta_subscription_handler import \
+    StateDeltaEvent
+from sawtooth_rest_api.state_delta_subscription_handler import \
+    StateDeltaSubscriberHandler
+from sawtooth_rest_api.protobuf.events_pb2 import Event
+from sawtooth_rest_api.protobuf.events_pb2 import EventFilter
+from sawtooth_rest_api.protobuf.events_pb2 import EventSubscription
+
+
+class StateDeltaSubscriptionTests(unittest.TestCase):
+    def test_subscriptions_without_subscribers(self):
+        """Verifies that without websocket subscribers, only block commits
+        are subscribed to.
+        """
+        self.assertEqual(
+            [EventSubscription(event_type='sawtooth/block-commit')],
+            StateDeltaSubscriberHandler._make_subscriptions([]))
+
+    def test_subscriptions_with_address_prefixes(self):
+        """Verifies that with websocket subscribers, the state deltas that
+        change an address under any of their prefixes are subscribed to.
+        """
+        subscriptions = StateDeltaSubscriberHandler._make_subscriptions(
+            [('ws-a', ['abcdef']), ('ws-b', ['012345', 'abcdef'])])
+
+        self.assertEqual(
+            [EventSubscription(event_type='sawtooth/block-commit'),
+             EventSubscription(
+                 event_type='sawtooth/state-delta',
+                 filters=[EventFilter(
+                     key='address',
+                     match_string='^(?:012345|abcdef)',
+                     filter_type=EventFilter.REGEX_ANY)])],
+            subscriptions)
+
+    def test_subscriptions_without_address_prefixes(self):
+        """Verifies that if any websocket subscriber has no address prefixes,
+        every state delta is subscribed to.
+        """
+        subscriptions = StateDeltaSubscriberHandler._make_subscriptions(
+            [('ws-a', ['abcdef']), ('ws-b', [])])
+
+        self.assertEqual(
+            [EventSubscription(event_type='sawtooth/block-commit'),
+             EventSubscription(event_type='sawtooth/state-delta')],
+            subscriptions)
+
+    def test_event_without_state_delta(self):
+        """Verifies that a block commit event without a state delta event is
+        read as a block without state changes.
+        """
+        block_commit = Event(
+            event_type='sawtooth/block-commit',
+            attributes=[
+                Event.Attribute(key='block_id', value='b' * 128),
+                Event.Attribute(key='block_num', value='3'),
+                Event.Attribute(key='previous_block_id', value='a' * 128),
+                Event.Attribute(key='state_root_hash', value='c' * 64),
+            ])
+
+        event = StateDeltaEvent([block_commit])
+
+        self.assertEqual('b' * 128, event.block_id)
+        self.assertEqual('3', event.block_num)
+        self.assertEqual('c' * 64, event.state_root_hash)
+        self.assertEqual([], list(event.state_changes))
+
+        with self.assertRaises(KeyError):
+            StateDeltaEvent([])
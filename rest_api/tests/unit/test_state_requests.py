@@ -14,10 +14,15 @@
 # ------------------------------------------------------------------------------
 
 from base64 import b64decode
+import time
+from unittest.mock import patch
 
 from aiohttp.test_utils import unittest_run_loop
 
-from components import Mocks, BaseApiTest
+from components import Mocks, BaseApiTest, TEST_TIMEOUT
+from sawtooth_rest_api.chain_head_cache import ChainHeadCache
+from sawtooth_rest_api.chain_head_cache import DEFAULT_MAX_AGE
+from sawtooth_rest_api.route_handlers import RouteHandler
 from sawtooth_rest_api.protobuf.validator_pb2 import Message
 from sawtooth_rest_api.protobuf import client_state_pb2
 from sawtooth_rest_api.protobuf import client_block_pb2
@@ -754,3 +759,119 @@ class StateGetTests(BaseApiTest):
             '/state/b?head={}'.format(ID_D), 404)
 
         self.assert_has_valid_error(response, 50)
+
+
+class StateGetCachedHeadTests(BaseApiTest):
+
+    async def get_application(self):
+        self.set_status_and_connection(
+            Message.CLIENT_STATE_GET_REQUEST,
+            client_state_pb2.ClientStateGetRequest,
+            client_state_pb2.ClientStateGetResponse)
+
+        self.chain_head_cache = ChainHeadCache()
+        handlers = RouteHandler(
+            self.loop, self.connection, TEST_TIMEOUT,
+            chain_head_cache=self.chain_head_cache)
+        return self.build_app(
+            self.loop, '/state/{address}', handlers.fetch_state)
+
+    @unittest_run_loop
+    async def test_state_get_with_cached_head(self):
+        """Verifies a GET /state/{address} without a head uses the cached
+        chain head, without querying the validator for it.
+
+        It will receive a Protobuf response with:
+            - a leaf with addresses/data of: 'a': b'3'
+
+        It should send a Protobuf request with:
+            - a state_root property of 'beef', from the cache
+            - an address property of 'a'
+
+        It should send back a JSON response with:
+            - a response status of 200
+            - a head property of ID_C, from the cache
+        """
+        self.chain_head_cache.update(ID_C, 'beef', 2, ID_B)
+        self.connection.preset_response(state_root='beef', value=b'3')
+
+        response = await self.get_assert_200('/state/a')
+        self.connection.assert_valid_request_sent(
+            state_root='beef', address='a')
+
+        self.assert_has_valid_head(response, ID_C)
+        self.assertEqual(b'3', b64decode(response['data']))
+
+    @unittest_run_loop
+    async def test_state_get_with_invalidated_head(self):
+        """Verifies a GET /state/{address} without a head queries the
+        validator for the chain head once the cache has been invalidated.
+
+        It will receive a Protobuf response with:
+            - a head id of ID_D
+            - a leaf with addresses/data of: 'a': b'3'
+
+        It should send a Protobuf request with:
+            - a state_root property of 'cafe', from the validator
+
+        It should send back a JSON response with:
+            - a response status of 200
+            - a head property of ID_D
+        """
+        self.chain_head_cache.update(ID_C, 'beef', 2, ID_B)
+        self.chain_head_cache.invalidate()
+        self.connection.preset_response(state_root='cafe', value=b'3')
+        self.connection.preset_response(
+            proto=client_block_pb2.ClientBlockGetResponse,
+            block=block_pb2.Block(
+                header_signature=ID_D,
+                header=block_pb2.BlockHeader(
+                    state_root_hash='cafe').SerializeToString()))
+
+        response = await self.get_assert_200('/state/a')
+        self.connection.assert_valid_request_sent(
+            state_root='cafe', address='a')
+
+        self.assert_has_valid_head(response, ID_D)
+
+    @unittest_run_loop
+    async def test_state_get_with_expired_head(self):
+        """Verifies a GET /state/{address} without a head queries the
+        validator for the chain head once the cached head has not been
+        reported or confirmed for max_age seconds, since it may lag a
+        commit the client has already seen.
+
+        It will receive a Protobuf response with:
+            - a head id of ID_D, newer than the cached ID_C
+            - a leaf with addresses/data of: 'a': b'3'
+
+        It should send a Protobuf request with:
+            - a state_root property of 'cafe', from the validator
+
+        It should send back a JSON response with:
+            - a response status of 200
+            - a head property of ID_D
+        """
+        self.chain_head_cache.update(ID_C, 'beef', 2, ID_B)
+        self.connection.preset_response(state_root='cafe', value=b'3')
+        self.connection.preset_response(
+            proto=client_block_pb2.ClientBlockListResponse,
+            blocks=[block_pb2.Block(
+                header_signature=ID_D,
+                header=block_pb2.BlockHeader(
+                    state_root_hash='cafe').SerializeToString())])
+
+        expired = time.monotonic() + DEFAULT_MAX_AGE + 1
+        with patch('sawtooth_rest_api.chain_head_cache.time.monotonic',
+                   return_value=expired):
+            response = await self.get_assert_200('/state/a')
+
+            # The validator reported a different head, so the cached head
+            # stays expired until the event for ID_D is received
+            self.assertIsNone(self.chain_head_cache.get())
+            self.chain_head_cache.update(ID_D, 'cafe', 3, ID_C)
+            self.assertEqual((ID_D, 'cafe'), self.chain_head_cache.get())
+
+        self.connection.assert_valid_request_sent(
+            state_root='cafe', address='a')
+        self.assert_has_valid_head(response, ID_D)
@@ -183,6 +183,31 @@ class PostBatchTests(BaseApiTest):
 
         request = await self.post_batches(batches)
         self.assertEqual(429, request.status)
+        self.assertNotIn('Retry-After', request.headers)
+        response = await request.json()
+        self.assert_has_valid_error(response, 31)
+
+    @unittest_run_loop
+    async def test_post_rejected_with_retry_after(self):
+        """Verifies a POST /batches when the validator reports QUEUE_FULL
+        with a retry hint passes the hint on.
+
+        It will receive a Protobuf response with:
+            - a status of QUEUE_FULL
+            - a retry_after of 5
+
+        It should send back a JSON response with:
+            - a response status of 429
+            - a Retry-After header of 5
+            - an error property with a code of 31
+        """
+        batches = Mocks.make_batches(ID_A)
+        self.connection.preset_response(
+            self.status.QUEUE_FULL, retry_after=5)
+
+        request = await self.post_batches(batches)
+        self.assertEqual(429, request.status)
+        self.assertEqual('5', request.headers['Retry-After'])
         response = await request.json()
         self.assert_has_valid_error(response, 31)
 
@@ -48,6 +48,7 @@ class Future:
         self._result = None
         self._condition = Condition()
         self._request_type = request_type
+        self._callbacks = []
 
     def done(self):
         return self._result is not None
@@ -63,10 +64,23 @@ class Future:
                             message_type))
         return self._result
 
+    def add_done_callback(self, callback):
+        """Calls the callback with this future once its result is set. The
+        callback is called immediately if the result is already set.
+        """
+        with self._condition:
+            if self._result is None:
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
     def set_result(self, result):
         with self._condition:
             self._result = result
             self._condition.notify()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
 
 
 class FutureCollectionKeyError(Exception):
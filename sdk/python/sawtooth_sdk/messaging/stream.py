@@ -179,6 +179,15 @@ class _SendReceiveThread(Thread):
         return asyncio.run_coroutine_threadsafe(self._get_message(),
                                                 self._event_loop)
 
+    def run_coroutine(self, coro):
+        """
+        :param coro: the coroutine to run on the event loop
+        :return: concurrent.futures.Future
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._event_loop is not None)
+        return asyncio.run_coroutine_threadsafe(coro, self._event_loop)
+
     def _cancel_tasks_yet_to_be_done(self):
         """Cancels all the tasks (pending coroutines and futures)
         """
@@ -326,6 +335,14 @@ class Stream:
         """
         return self._send_recieve_thread.get_message()
 
+    def run_coroutine(self, coro):
+        """
+        Run a coroutine on the event loop of the background thread
+        :param coro: the coroutine to run
+        :return: concurrent.futures.Future
+        """
+        return self._send_recieve_thread.run_coroutine(coro)
+
     def wait_for_ready(self):
         """Blocks until the background thread has recovered
         from a disconnect with the validator.
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ------------------------------------------------------------------------------
+import asyncio
+from collections import OrderedDict
+
 from sawtooth_sdk.protobuf.validator_pb2 import Message
 from sawtooth_sdk.protobuf import state_context_pb2
 from sawtooth_sdk.protobuf import events_pb2
@@ -25,15 +28,35 @@ class Context:
     validator state. All validator interactions by a handler should be
     through a Context instance.
 
+    In buffered mode, the Context remembers the state it has read and
+    written, so an address is fetched from the validator at most once, and
+    holds sets and deletes until flush is called, when they are sent in a
+    single TpStateSetRequest and a single TpStateDeleteRequest. Writes to
+    addresses the transaction is not authorized to change are then only
+    rejected by flush.
+
     Attributes:
         _stream (sawtooth.client.stream.Stream): client grpc communication
         _context_id (str): the context_id passed in from the validator
+        _buffered (bool): whether reads are cached and writes held until
+            flush
+        _cache (dict): in buffered mode, address to data for the addresses
+            read or written, with b'' for an address that has no value
+        _pending (OrderedDict): in buffered mode, address to data for the
+            writes not yet flushed, with None for a delete
 
     """
 
-    def __init__(self, stream, context_id):
+    def __init__(self, stream, context_id, buffered=False):
         self._stream = stream
         self._context_id = context_id
+        self._buffered = buffered
+        self._cache = {}
+        self._pending = OrderedDict()
+
+    def _send(self, request, timeout):
+        message_type, content = request
+        return self._stream.send(message_type, content).result(timeout).content
 
     def get_state(self, addresses, timeout=None):
         """
@@ -51,21 +74,32 @@ class Context:
         Raises:
             AuthorizationException
         """
-        request = state_context_pb2.TpStateGetRequest(
-            context_id=self._context_id,
-            addresses=addresses)
-        response_string = self._stream.send(
-            Message.TP_STATE_GET_REQUEST,
-            request.SerializeToString()).result(timeout).content
-        response = state_context_pb2.TpStateGetResponse()
-        response.ParseFromString(response_string)
-        if response.status == \
-                state_context_pb2.TpStateGetResponse.AUTHORIZATION_ERROR:
-            raise AuthorizationException(
-                'Tried to get unauthorized address: {}'.format(addresses))
-        entries = response.entries if response is not None else []
-        results = [e for e in entries if len(e.data) != 0]
-        return results
+        if not self._buffered:
+            return self._get_state(addresses, timeout)
+
+        missing = [
+            address for address in OrderedDict.fromkeys(addresses)
+            if address not in self._cache
+        ]
+        if missing:
+            fetched = {
+                entry.address: entry.data
+                for entry in self._get_state(missing, timeout)
+            }
+            for address in missing:
+                self._cache[address] = fetched.get(address, b'')
+
+        return [
+            state_context_pb2.TpStateEntry(
+                address=address, data=self._cache[address])
+            for address in addresses
+            if self._cache[address]
+        ]
+
+    def _get_state(self, addresses, timeout=None):
+        return _parse_get_response(
+            self._send(_get_request(self._context_id, addresses), timeout),
+            addresses)
 
     def set_state(self, entries, timeout=None):
         """
@@ -84,23 +118,18 @@ class Context:
         Raises:
             AuthorizationException
         """
-        state_entries = [
-            state_context_pb2.TpStateEntry(address=e, data=entries[e])
-            for e in entries
-        ]
-        request = state_context_pb2.TpStateSetRequest(
-            entries=state_entries,
-            context_id=self._context_id).SerializeToString()
-        response = state_context_pb2.TpStateSetResponse()
-        response.ParseFromString(
-            self._stream.send(Message.TP_STATE_SET_REQUEST,
-                              request).result(timeout).content)
-        if response.status == \
-                state_context_pb2.TpStateSetResponse.AUTHORIZATION_ERROR:
-            addresses = [e.address for e in state_entries]
-            raise AuthorizationException(
-                'Tried to set unauthorized address: {}'.format(addresses))
-        return response.addresses
+        if self._buffered:
+            for address, data in entries.items():
+                self._cache[address] = data
+                self._pending[address] = data
+            return list(entries)
+
+        return self._set_state(entries, timeout)
+
+    def _set_state(self, entries, timeout=None):
+        return _parse_set_response(
+            self._send(_set_request(self._context_id, entries), timeout),
+            entries)
 
     def delete_state(self, addresses, timeout=None):
         """
@@ -118,18 +147,46 @@ class Context:
         Raises:
             AuthorizationException
         """
-        request = state_context_pb2.TpStateDeleteRequest(
-            context_id=self._context_id,
-            addresses=addresses).SerializeToString()
-        response = state_context_pb2.TpStateDeleteResponse()
-        response.ParseFromString(
-            self._stream.send(Message.TP_STATE_DELETE_REQUEST,
-                              request).result(timeout).content)
-        if response.status == \
-                state_context_pb2.TpStateDeleteResponse.AUTHORIZATION_ERROR:
-            raise AuthorizationException(
-                'Tried to delete unauthorized address: {}'.format(addresses))
-        return response.addresses
+        if self._buffered:
+            for address in addresses:
+                self._cache[address] = b''
+                self._pending[address] = None
+            return list(addresses)
+
+        return self._delete_state(addresses, timeout)
+
+    def _delete_state(self, addresses, timeout=None):
+        return _parse_delete_response(
+            self._send(_delete_request(self._context_id, addresses), timeout),
+            addresses)
+
+    def flush(self, timeout=None):
+        """Sends the sets and deletes held in buffered mode to the
+        validator. Does nothing if the Context is not buffered.
+
+        Args:
+            timeout: optional timeout, in seconds
+
+        Raises:
+            AuthorizationException
+        """
+        if not self._pending:
+            return
+
+        pending = self._pending
+        self._pending = OrderedDict()
+
+        sets = OrderedDict(
+            (address, data) for address, data in pending.items()
+            if data is not None)
+        deletes = [
+            address for address, data in pending.items() if data is None
+        ]
+
+        if sets:
+            self._set_state(sets, timeout)
+        if deletes:
+            self._delete_state(deletes, timeout)
 
     def add_receipt_data(self, data, timeout=None):
         """Add a blob to the execution result for this transaction.
@@ -137,17 +194,9 @@ class Context:
         Args:
             data (bytes): The data to add.
         """
-        request = state_context_pb2.TpReceiptAddDataRequest(
-            context_id=self._context_id,
-            data=data).SerializeToString()
-        response = state_context_pb2.TpReceiptAddDataResponse()
-        response.ParseFromString(
-            self._stream.send(
-                Message.TP_RECEIPT_ADD_DATA_REQUEST,
-                request).result(timeout).content)
-        if response.status == state_context_pb2.TpReceiptAddDataResponse.ERROR:
-            raise InternalError(
-                "Failed to add receipt data: {}".format((data)))
+        _parse_receipt_data_response(
+            self._send(_receipt_data_request(self._context_id, data), timeout),
+            data)
 
     def add_event(self, event_type, attributes=None, data=None, timeout=None):
         """Add a new event to the execution result for this transaction.
@@ -162,25 +211,202 @@ class Context:
             data (bytes): Additional information about the event that is opaque
                 to the validator.
         """
-        if attributes is None:
-            attributes = []
-
-        event = events_pb2.Event(
-            event_type=event_type,
-            attributes=[
-                events_pb2.Event.Attribute(key=key, value=value)
-                for key, value in attributes
-            ],
-            data=data,
-        )
-        request = state_context_pb2.TpEventAddRequest(
-            context_id=self._context_id, event=event).SerializeToString()
-        response = state_context_pb2.TpEventAddResponse()
-        response.ParseFromString(
-            self._stream.send(
-                Message.TP_EVENT_ADD_REQUEST,
-                request).result(timeout).content)
-        if response.status == state_context_pb2.TpEventAddResponse.ERROR:
-            raise InternalError(
-                "Failed to add event: ({}, {}, {})".format(
-                    event_type, attributes, data))
+        _parse_event_response(
+            self._send(
+                _event_request(self._context_id, event_type, attributes, data),
+                timeout),
+            event_type, attributes, data)
+
+
+class AsyncContext:
+    """
+    AsyncContext provides the same interface as Context to handlers whose
+    apply is a coroutine. Each method is a coroutine that waits for the
+    validator's response on the event loop, instead of blocking a thread.
+
+    Attributes:
+        _stream (sawtooth.client.stream.Stream): client grpc communication
+        _context_id (str): the context_id passed in from the validator
+
+    """
+
+    def __init__(self, stream, context_id):
+        self._stream = stream
+        self._context_id = context_id
+
+    @asyncio.coroutine
+    def _send(self, request, timeout):
+        message_type, content = request
+        result = yield from asyncio.wait_for(
+            _wrap_future(self._stream.send(message_type, content)),
+            timeout)
+        return result.content
+
+    @asyncio.coroutine
+    def get_state(self, addresses, timeout=None):
+        """
+        Queries the validator state for data at each of the addresses in
+        the given list. See Context.get_state.
+        """
+        content = yield from self._send(
+            _get_request(self._context_id, addresses), timeout)
+        return _parse_get_response(content, addresses)
+
+    @asyncio.coroutine
+    def set_state(self, entries, timeout=None):
+        """
+        Requests that each address in the provided dictionary be set in
+        validator state to its corresponding value. See Context.set_state.
+        """
+        content = yield from self._send(
+            _set_request(self._context_id, entries), timeout)
+        return _parse_set_response(content, entries)
+
+    @asyncio.coroutine
+    def delete_state(self, addresses, timeout=None):
+        """
+        Requests that each of the provided addresses be unset in validator
+        state. See Context.delete_state.
+        """
+        content = yield from self._send(
+            _delete_request(self._context_id, addresses), timeout)
+        return _parse_delete_response(content, addresses)
+
+    @asyncio.coroutine
+    def add_receipt_data(self, data, timeout=None):
+        """Add a blob to the execution result for this transaction. See
+        Context.add_receipt_data.
+        """
+        content = yield from self._send(
+            _receipt_data_request(self._context_id, data), timeout)
+        _parse_receipt_data_response(content, data)
+
+    @asyncio.coroutine
+    def add_event(self, event_type, attributes=None, data=None, timeout=None):
+        """Add a new event to the execution result for this transaction. See
+        Context.add_event.
+        """
+        content = yield from self._send(
+            _event_request(self._context_id, event_type, attributes, data),
+            timeout)
+        _parse_event_response(content, event_type, attributes, data)
+
+
+def _wrap_future(future):
+    """Returns an asyncio future, on the current event loop, that is
+    resolved with the result of the given messaging Future.
+    """
+    loop = asyncio.get_event_loop()
+    wrapped = loop.create_future()
+
+    def set_result(result):
+        if not wrapped.done():
+            wrapped.set_result(result)
+
+    future.add_done_callback(
+        lambda done: loop.call_soon_threadsafe(set_result, done.result()))
+    return wrapped
+
+
+def _get_request(context_id, addresses):
+    return (
+        Message.TP_STATE_GET_REQUEST,
+        state_context_pb2.TpStateGetRequest(
+            context_id=context_id,
+            addresses=addresses).SerializeToString())
+
+
+def _parse_get_response(content, addresses):
+    response = state_context_pb2.TpStateGetResponse()
+    response.ParseFromString(content)
+    if response.status == \
+            state_context_pb2.TpStateGetResponse.AUTHORIZATION_ERROR:
+        raise AuthorizationException(
+            'Tried to get unauthorized address: {}'.format(addresses))
+    entries = response.entries if response is not None else []
+    results = [e for e in entries if len(e.data) != 0]
+    return results
+
+
+def _set_request(context_id, entries):
+    state_entries = [
+        state_context_pb2.TpStateEntry(address=e, data=entries[e])
+        for e in entries
+    ]
+    return (
+        Message.TP_STATE_SET_REQUEST,
+        state_context_pb2.TpStateSetRequest(
+            entries=state_entries,
+            context_id=context_id).SerializeToString())
+
+
+def _parse_set_response(content, entries):
+    response = state_context_pb2.TpStateSetResponse()
+    response.ParseFromString(content)
+    if response.status == \
+            state_context_pb2.TpStateSetResponse.AUTHORIZATION_ERROR:
+        addresses = list(entries)
+        raise AuthorizationException(
+            'Tried to set unauthorized address: {}'.format(addresses))
+    return response.addresses
+
+
+def _delete_request(context_id, addresses):
+    return (
+        Message.TP_STATE_DELETE_REQUEST,
+        state_context_pb2.TpStateDeleteRequest(
+            context_id=context_id,
+            addresses=addresses).SerializeToString())
+
+
+def _parse_delete_response(content, addresses):
+    response = state_context_pb2.TpStateDeleteResponse()
+    response.ParseFromString(content)
+    if response.status == \
+            state_context_pb2.TpStateDeleteResponse.AUTHORIZATION_ERROR:
+        raise AuthorizationException(
+            'Tried to delete unauthorized address: {}'.format(addresses))
+    return response.addresses
+
+
+def _receipt_data_request(context_id, data):
+    return (
+        Message.TP_RECEIPT_ADD_DATA_REQUEST,
+        state_context_pb2.TpReceiptAddDataRequest(
+            context_id=context_id,
+            data=data).SerializeToString())
+
+
+def _parse_receipt_data_response(content, data):
+    response = state_context_pb2.TpReceiptAddDataResponse()
+    response.ParseFromString(content)
+    if response.status == state_context_pb2.TpReceiptAddDataResponse.ERROR:
+        raise InternalError(
+            "Failed to add receipt data: {}".format((data)))
+
+
+def _event_request(context_id, event_type, attributes, data):
+    if attributes is None:
+        attributes = []
+
+    event = events_pb2.Event(
+        event_type=event_type,
+        attributes=[
+            events_pb2.Event.Attribute(key=key, value=value)
+            for key, value in attributes
+        ],
+        data=data,
+    )
+    return (
+        Message.TP_EVENT_ADD_REQUEST,
+        state_context_pb2.TpEventAddRequest(
+            context_id=context_id, event=event).SerializeToString())
+
+
+def _parse_event_response(content, event_type, attributes, data):
+    response = state_context_pb2.TpEventAddResponse()
+    response.ParseFromString(content)
+    if response.status == state_context_pb2.TpEventAddResponse.ERROR:
+        raise InternalError(
+            "Failed to add event: ({}, {}, {})".format(
+                event_type, attributes, data))
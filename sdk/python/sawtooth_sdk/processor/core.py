@@ -13,8 +13,11 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+import asyncio
 from concurrent.futures import CancelledError
+from concurrent.futures import ThreadPoolExecutor
 import concurrent.futures
+import functools
 import itertools
 import logging
 
@@ -24,10 +27,12 @@ from sawtooth_sdk.messaging.future import FutureTimeoutError
 from sawtooth_sdk.messaging.stream import RECONNECT_EVENT
 from sawtooth_sdk.messaging.stream import Stream
 
+from sawtooth_sdk.processor.context import AsyncContext
 from sawtooth_sdk.processor.context import Context
 from sawtooth_sdk.processor.exceptions import InvalidTransaction
 from sawtooth_sdk.processor.exceptions import InternalError
 from sawtooth_sdk.processor.exceptions import AuthorizationException
+from sawtooth_sdk.processor.handler import AsyncTransactionHandler
 
 from sawtooth_sdk.protobuf.processor_pb2 import TpRegisterRequest
 from sawtooth_sdk.protobuf.processor_pb2 import TpRegisterResponse
@@ -41,6 +46,14 @@ from sawtooth_sdk.protobuf.validator_pb2 import Message
 
 LOGGER = logging.getLogger(__name__)
 
+# The errors raised by handler.apply that are reported to the validator
+_APPLY_ERRORS = (
+    InvalidTransaction,
+    InternalError,
+    ValidatorConnectionError,
+    AuthorizationException,
+)
+
 
 class TransactionProcessor:
     """TransactionProcessor is a generic class for communicating with a
@@ -48,14 +61,46 @@ class TransactionProcessor:
     handler. It uses ZMQ and channels to handle requests concurrently.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, max_workers=None, buffer_state=False,
+                 max_occupancy=None):
         """
         Args:
             url (string): The URL of the validator
+            max_workers (int): If set, transactions are applied concurrently
+                by a pool of this many threads, and the validator is asked
+                to send up to this many transactions at once. Handlers must
+                then be thread safe. Otherwise, transactions are applied one
+                at a time.
+            buffer_state (bool): Whether handlers are given buffered
+                Contexts, which cache the state they read and send the
+                state they set or delete to the validator once apply
+                returns.
+            max_occupancy (int): The number of transactions the validator
+                is asked to send at once, overriding max_workers. Set this
+                for AsyncTransactionHandlers, whose applies are interleaved
+                on a single thread.
         """
         self._stream = Stream(url)
         self._url = url
         self._handlers = []
+        self._buffer_state = buffer_state
+        # The applies of AsyncTransactionHandlers running on the stream's
+        # event loop
+        self._in_flight = set()
+
+        self._executor = None
+        # The number of transactions the validator may send at once, or 0
+        # for the validator's default
+        self._max_occupancy = 0
+        if max_workers is not None:
+            if max_workers < 1:
+                raise ValueError("max_workers must be at least 1")
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+            self._max_occupancy = max_workers
+        if max_occupancy is not None:
+            if max_occupancy < 1:
+                raise ValueError("max_occupancy must be at least 1")
+            self._max_occupancy = max_occupancy
 
     @property
     def zmq_id(self):
@@ -95,7 +140,8 @@ class TransactionProcessor:
                 [TpRegisterRequest(
                     family=n,
                     version=v,
-                    namespaces=h.namespaces)
+                    namespaces=h.namespaces,
+                    max_occupancy=self._max_occupancy)
                  for n, v in itertools.product(
                     [h.family_name],
                      h.family_versions,)] for h in self._handlers])
@@ -119,7 +165,6 @@ class TransactionProcessor:
 
         request = TpProcessRequest()
         request.ParseFromString(msg.content)
-        state = Context(self._stream, request.context_id)
         header = request.header
         try:
             if not self._stream.is_ready():
@@ -127,23 +172,55 @@ class TransactionProcessor:
             handler = self._find_handler(header)
             if handler is None:
                 return
+            if isinstance(handler, AsyncTransactionHandler):
+                self._process_async(handler, request, msg)
+                return
+            state = Context(
+                self._stream, request.context_id, buffered=self._buffer_state)
             handler.apply(request, state)
-            self._stream.send_back(
-                message_type=Message.TP_PROCESS_RESPONSE,
-                correlation_id=msg.correlation_id,
-                content=TpProcessResponse(
-                    status=TpProcessResponse.OK
-                ).SerializeToString())
-        except InvalidTransaction as it:
-            LOGGER.warning("Invalid Transaction %s", it)
+            state.flush()
+            self._respond_ok(msg)
+        except _APPLY_ERRORS as err:
+            self._respond_to_error(msg, err)
+
+    def _process_async(self, handler, request, msg):
+        """Schedules the handler's apply on the stream's event loop, and
+        responds once it completes.
+        """
+        @asyncio.coroutine
+        def apply():
+            try:
+                yield from handler.apply(
+                    request, AsyncContext(self._stream, request.context_id))
+                self._respond_ok(msg)
+            except _APPLY_ERRORS as err:
+                self._respond_to_error(msg, err)
+
+        future = self._stream.run_coroutine(apply())
+        self._in_flight.add(future)
+        future.add_done_callback(self._in_flight.discard)
+        future.add_done_callback(
+            functools.partial(self._respond_to_unhandled_error, msg))
+
+    def _respond_ok(self, msg):
+        self._stream.send_back(
+            message_type=Message.TP_PROCESS_RESPONSE,
+            correlation_id=msg.correlation_id,
+            content=TpProcessResponse(
+                status=TpProcessResponse.OK
+            ).SerializeToString())
+
+    def _respond_to_error(self, msg, err):
+        if isinstance(err, InvalidTransaction):
+            LOGGER.warning("Invalid Transaction %s", err)
             try:
                 self._stream.send_back(
                     message_type=Message.TP_PROCESS_RESPONSE,
                     correlation_id=msg.correlation_id,
                     content=TpProcessResponse(
                         status=TpProcessResponse.INVALID_TRANSACTION,
-                        message=str(it),
-                        extended_data=it.extended_data
+                        message=str(err),
+                        extended_data=err.extended_data
                     ).SerializeToString())
             except ValidatorConnectionError as vce:
                 # TP_PROCESS_REQUEST has made it through the
@@ -151,37 +228,37 @@ class TransactionProcessor:
                 # sent back but the validator has disconnected and so it
                 # doesn't care about the response.
                 LOGGER.warning("during invalid transaction response: %s", vce)
-        except InternalError as ie:
-            LOGGER.warning("internal error: %s", ie)
+        elif isinstance(err, InternalError):
+            LOGGER.warning("internal error: %s", err)
             try:
                 self._stream.send_back(
                     message_type=Message.TP_PROCESS_RESPONSE,
                     correlation_id=msg.correlation_id,
                     content=TpProcessResponse(
                         status=TpProcessResponse.INTERNAL_ERROR,
-                        message=str(ie),
-                        extended_data=ie.extended_data
+                        message=str(err),
+                        extended_data=err.extended_data
                     ).SerializeToString())
             except ValidatorConnectionError as vce:
                 # Same as the prior except block, but an internal error has
                 # happened, but because of the disconnect the validator
                 # probably doesn't care about the response.
                 LOGGER.warning("during internal error response: %s", vce)
-        except ValidatorConnectionError as vce:
+        elif isinstance(err, ValidatorConnectionError):
             # Somewhere within handler.apply a future resolved with an
             # error status that the validator has disconnected. There is
             # nothing left to do but reconnect.
             LOGGER.warning("during handler.apply a future was resolved "
-                           "with error status: %s", vce)
-        except AuthorizationException as ae:
-            LOGGER.warning("AuthorizationException: %s", ae)
+                           "with error status: %s", err)
+        elif isinstance(err, AuthorizationException):
+            LOGGER.warning("AuthorizationException: %s", err)
             try:
                 self._stream.send_back(
                     message_type=Message.TP_PROCESS_RESPONSE,
                     correlation_id=msg.correlation_id,
                     content=TpProcessResponse(
                         status=TpProcessResponse.INVALID_TRANSACTION,
-                        message=str(ae),
+                        message=str(err),
                     ).SerializeToString())
             except ValidatorConnectionError as vce:
                 # TP_PROCESS_REQUEST has made it through the
@@ -190,6 +267,32 @@ class TransactionProcessor:
                 # doesn't care about the response.
                 LOGGER.warning("during invalid transaction response: %s", vce)
 
+    def _respond_to_unhandled_error(self, msg, future):
+        """Logs an unexpected error raised while processing a transaction
+        apart from the receive loop, and responds with an internal error, so
+        that the validator is not left waiting on the transaction.
+        """
+        if future.cancelled():
+            return
+
+        exception = future.exception()
+        if exception is None:
+            return
+
+        LOGGER.error(
+            "Unhandled error while processing transaction: %s", exception,
+            exc_info=(type(exception), exception, exception.__traceback__))
+        try:
+            self._stream.send_back(
+                message_type=Message.TP_PROCESS_RESPONSE,
+                correlation_id=msg.correlation_id,
+                content=TpProcessResponse(
+                    status=TpProcessResponse.INTERNAL_ERROR,
+                    message=str(exception)
+                ).SerializeToString())
+        except ValidatorConnectionError as vce:
+            LOGGER.warning("during internal error response: %s", vce)
+
     def _process_future(self, future, timeout=None, sigint=False):
         try:
             msg = future.result(timeout)
@@ -213,7 +316,12 @@ class TransactionProcessor:
                     correlation_id=msg.correlation_id,
                     content=PingResponse().SerializeToString())
                 return
-            self._process(msg)
+
+            if self._executor is None:
+                self._process(msg)
+            else:
+                self._executor.submit(self._process, msg).add_done_callback(
+                    functools.partial(self._respond_to_unhandled_error, msg))
 
     def _register(self):
         futures = []
@@ -285,6 +393,12 @@ class TransactionProcessor:
                 # unregister request, exit.
                 pass
 
+            # let the transactions already being applied finish, while
+            # the connection is still open to respond to them
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+            concurrent.futures.wait(list(self._in_flight))
+
     def stop(self):
         """Closes the connection between the TransactionProcessor and the
         validator.
@@ -59,3 +59,23 @@ class TransactionHandler(metaclass=abc.ABCMeta):
         initialized instance of the Context type.
         """
         pass
+
+
+class AsyncTransactionHandler(TransactionHandler):
+    """
+    AsyncTransactionHandler is a TransactionHandler whose apply is a
+    coroutine, run on the event loop of the transaction processor's
+    connection to the validator. Many transactions may be applied at once on
+    a single thread, interleaved while they wait on the validator.
+    """
+
+    @abc.abstractmethod
+    def apply(self, transaction, context):
+        """
+        Apply is a coroutine, called with the TpProcessRequest and an
+        initialized instance of the AsyncContext type, whose methods are
+        coroutines as well, e.g.
+
+            entries = yield from context.get_state([address])
+        """
+        pass
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: sawtooth_sdk/protobuf/network.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'sawtooth_sdk/protobuf/network.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#sawtooth_sdk/protobuf/network.proto\"\x13\n\x11\x44isconnectMessage\"A\n\x13PeerRegisterRequest\x12\x10\n\x08\x65ndpoint\x18\x01 \x01(\t\x12\x18\n\x10protocol_version\x18\x02 \x01(\r\"\x17\n\x15PeerUnregisterRequest\"\x11\n\x0fGetPeersRequest\"*\n\x10GetPeersResponse\x12\x16\n\x0epeer_endpoints\x18\x01 \x03(\t\"\r\n\x0bPingRequest\"\x0e\n\x0cPingResponse\"\xa5\x01\n\rGossipMessage\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x30\n\x0c\x63ontent_type\x18\x02 \x01(\x0e\x32\x1a.GossipMessage.ContentType\x12\x14\n\x0ctime_to_live\x18\x03 \x01(\r\";\n\x0b\x43ontentType\x12\x16\n\x12\x43ONTENT_TYPE_UNSET\x10\x00\x12\t\n\x05\x42LOCK\x10\x01\x12\t\n\x05\x42\x41TCH\x10\x02\"w\n\x16NetworkAcknowledgement\x12.\n\x06status\x18\x01 \x01(\x0e\x32\x1e.NetworkAcknowledgement.Status\"-\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\t\n\x05\x45RROR\x10\x02\"K\n\x12GossipBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\t\x12\r\n\x05nonce\x18\x02 \x01(\t\x12\x14\n\x0ctime_to_live\x18\x03 \x01(\r\"&\n\x13GossipBlockResponse\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\"&\n\x13GossipBatchResponse\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\"N\n\x1bGossipBatchByBatchIdRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05nonce\x18\x02 \x01(\t\x12\x14\n\x0ctime_to_live\x18\x03 \x01(\r\"U\n!GossipBatchByTransactionIdRequest\x12\x0b\n\x03ids\x18\x01 \x03(\t\x12\r\n\x05nonce\x18\x02 \x01(\t\x12\x14\n\x0ctime_to_live\x18\x03 \x01(\r\"R\n\x16GossipConsensusMessage\x12\x0f\n\x07message\x18\x01 \x01(\x0c\x12\x11\n\tsender_id\x18\x02 \x01(\x0c\x12\x14\n\x0ctime_to_live\x18\x03 \x01(\rB&\n\x15sawtooth.sdk.protobufP\x01Z\x0bnetwork_pb2b\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_sdk.protobuf.network_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\025sawtooth.sdk.protobufP\001Z\013network_pb2'
+  _globals['_DISCONNECTMESSAGE']._serialized_start=39
+  _globals['_DISCONNECTMESSAGE']._serialized_end=58
+  _globals['_PEERREGISTERREQUEST']._serialized_start=60
+  _globals['_PEERREGISTERREQUEST']._serialized_end=125
+  _globals['_PEERUNREGISTERREQUEST']._serialized_start=127
+  _globals['_PEERUNREGISTERREQUEST']._serialized_end=150
+  _globals['_GETPEERSREQUEST']._serialized_start=152
+  _globals['_GETPEERSREQUEST']._serialized_end=169
+  _globals['_GETPEERSRESPONSE']._serialized_start=171
+  _globals['_GETPEERSRESPONSE']._serialized_end=213
+  _globals['_PINGREQUEST']._serialized_start=215
+  _globals['_PINGREQUEST']._serialized_end=228
+  _globals['_PINGRESPONSE']._serialized_start=230
+  _globals['_PINGRESPONSE']._serialized_end=244
+  _globals['_GOSSIPMESSAGE']._serialized_start=247
+  _globals['_GOSSIPMESSAGE']._serialized_end=412
+  _globals['_GOSSIPMESSAGE_CONTENTTYPE']._serialized_start=353
+  _globals['_GOSSIPMESSAGE_CONTENTTYPE']._serialized_end=412
+  _globals['_NETWORKACKNOWLEDGEMENT']._serialized_start=414
+  _globals['_NETWORKACKNOWLEDGEMENT']._serialized_end=533
+  _globals['_NETWORKACKNOWLEDGEMENT_STATUS']._serialized_start=488
+  _globals['_NETWORKACKNOWLEDGEMENT_STATUS']._serialized_end=533
+  _globals['_GOSSIPBLOCKREQUEST']._serialized_start=535
+  _globals['_GOSSIPBLOCKREQUEST']._serialized_end=610
+  _globals['_GOSSIPBLOCKRESPONSE']._serialized_start=612
+  _globals['_GOSSIPBLOCKRESPONSE']._serialized_end=650
+  _globals['_GOSSIPBATCHRESPONSE']._serialized_start=652
+  _globals['_GOSSIPBATCHRESPONSE']._serialized_end=690
+  _globals['_GOSSIPBATCHBYBATCHIDREQUEST']._serialized_start=692
+  _globals['_GOSSIPBATCHBYBATCHIDREQUEST']._serialized_end=770
+  _globals['_GOSSIPBATCHBYTRANSACTIONIDREQUEST']._serialized_start=772
+  _globals['_GOSSIPBATCHBYTRANSACTIONIDREQUEST']._serialized_end=857
+  _globals['_GOSSIPCONSENSUSMESSAGE']._serialized_start=859
+  _globals['_GOSSIPCONSENSUSMESSAGE']._serialized_end=941
+# @@protoc_insertion_point(module_scope)
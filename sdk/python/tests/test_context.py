@@ -13,11 +13,13 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+import asyncio
 import unittest
 from unittest.mock import Mock
 
 from collections import OrderedDict
 
+from sawtooth_sdk.processor.context import AsyncContext
 from sawtooth_sdk.processor.context import Context
 from sawtooth_sdk.messaging.future import Future
 from sawtooth_sdk.messaging.future import FutureResult
@@ -144,3 +146,126 @@ class ContextTest(unittest.TestCase):
                     event_type="test",
                     attributes=[Event.Attribute(key="test", value="test")],
                     data=b"test")).SerializeToString())
+
+    def test_buffered_state_get(self):
+        """Tests that a buffered Context fetches each address from the
+        validator only once, and reads back the state it has set or deleted.
+        """
+        context = Context(self.mock_stream, self.context_id, buffered=True)
+        self.mock_stream.send.return_value = self._make_future(
+            message_type=Message.TP_STATE_GET_RESPONSE,
+            content=TpStateGetResponse(
+                status=TpStateGetResponse.OK,
+                entries=self._make_entries()[:2]).SerializeToString())
+
+        self.assertEqual(
+            self._make_entries()[:2], context.get_state(self.addresses))
+        self.assertEqual(
+            self._make_entries()[1:2], context.get_state(["b", "c"]))
+        self.assertEqual(1, self.mock_stream.send.call_count)
+
+        context.set_state({"c": b"new"})
+        context.delete_state(["a"])
+        self.assertEqual(
+            [TpStateEntry(address="b", data=b"b"),
+             TpStateEntry(address="c", data=b"new")],
+            context.get_state(self.addresses))
+        self.assertEqual(1, self.mock_stream.send.call_count)
+
+    def test_buffered_state_flush(self):
+        """Tests that a buffered Context sends its sets and deletes to the
+        validator, coalesced into one request each, only when flushed.
+        """
+        context = Context(self.mock_stream, self.context_id, buffered=True)
+
+        context.set_state({"a": b"a0", "b": b"b"})
+        context.set_state({"a": b"a", "c": b"c"})
+        context.delete_state(["c", "d"])
+        self.mock_stream.send.assert_not_called()
+
+        self.mock_stream.send.side_effect = [
+            self._make_future(
+                message_type=Message.TP_STATE_SET_RESPONSE,
+                content=TpStateSetResponse(
+                    status=TpStateSetResponse.OK,
+                    addresses=["a", "b"]).SerializeToString()),
+            self._make_future(
+                message_type=Message.TP_STATE_DELETE_RESPONSE,
+                content=TpStateDeleteResponse(
+                    status=TpStateDeleteResponse.OK,
+                    addresses=["c", "d"]).SerializeToString()),
+        ]
+
+        context.flush()
+
+        self.assertEqual(2, self.mock_stream.send.call_count)
+        self.mock_stream.send.assert_any_call(
+            Message.TP_STATE_SET_REQUEST,
+            TpStateSetRequest(
+                context_id=self.context_id,
+                entries=self._make_entries()[:2]).SerializeToString())
+        self.mock_stream.send.assert_any_call(
+            Message.TP_STATE_DELETE_REQUEST,
+            TpStateDeleteRequest(
+                context_id=self.context_id,
+                addresses=["c", "d"]).SerializeToString())
+
+        # Nothing is left to flush
+        context.flush()
+        self.assertEqual(2, self.mock_stream.send.call_count)
+
+    def test_async_state_get_and_set(self):
+        """Tests that an AsyncContext gets and sets addresses on the event
+        loop, without blocking on the validator's responses.
+        """
+        context = AsyncContext(self.mock_stream, self.context_id)
+        get_future = Future(self.context_id)
+        set_future = Future(self.context_id)
+        self.mock_stream.send.side_effect = [get_future, set_future]
+
+        @asyncio.coroutine
+        def apply():
+            entries = yield from context.get_state(self.addresses)
+            addresses = yield from context.set_state(
+                self._make_entries(protobuf=False))
+            return entries, addresses
+
+        @asyncio.coroutine
+        def respond():
+            # the responses arrive while apply is waiting on them
+            get_future.set_result(FutureResult(
+                message_type=Message.TP_STATE_GET_RESPONSE,
+                content=TpStateGetResponse(
+                    status=TpStateGetResponse.OK,
+                    entries=self._make_entries()).SerializeToString()))
+            while self.mock_stream.send.call_count < 2:
+                yield from asyncio.sleep(0)
+            set_future.set_result(FutureResult(
+                message_type=Message.TP_STATE_SET_RESPONSE,
+                content=TpStateSetResponse(
+                    status=TpStateSetResponse.OK,
+                    addresses=self.addresses).SerializeToString()))
+
+        @asyncio.coroutine
+        def run():
+            results = yield from asyncio.gather(apply(), respond())
+            return results[0]
+
+        loop = asyncio.new_event_loop()
+        try:
+            entries, addresses = loop.run_until_complete(run())
+        finally:
+            loop.close()
+
+        self.assertEqual(self._make_entries(), entries)
+        self.assertEqual(self.addresses, addresses)
+        self.mock_stream.send.assert_any_call(
+            Message.TP_STATE_GET_REQUEST,
+            TpStateGetRequest(
+                context_id=self.context_id,
+                addresses=self.addresses).SerializeToString())
+        self.mock_stream.send.assert_any_call(
+            Message.TP_STATE_SET_REQUEST,
+            TpStateSetRequest(
+                context_id=self.context_id,
+                entries=self._make_entries()).SerializeToString())
@@ -0,0 +1,241 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+# pylint: disable=protected-access
+
+import asyncio
+import concurrent.futures
+from threading import Barrier
+import unittest
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from sawtooth_sdk.processor.core import TransactionProcessor
+from sawtooth_sdk.processor.exceptions import InternalError
+from sawtooth_sdk.processor.exceptions import InvalidTransaction
+from sawtooth_sdk.processor.handler import AsyncTransactionHandler
+from sawtooth_sdk.processor.handler import TransactionHandler
+from sawtooth_sdk.protobuf.processor_pb2 import TpProcessRequest
+from sawtooth_sdk.protobuf.processor_pb2 import TpProcessResponse
+from sawtooth_sdk.protobuf.transaction_pb2 import TransactionHeader
+from sawtooth_sdk.protobuf.validator_pb2 import Message
+
+
+class BarrierHandler(TransactionHandler):
+    """Waits in apply until `parties` transactions are being applied."""
+
+    def __init__(self, parties):
+        self._barrier = Barrier(parties, timeout=5)
+
+    @property
+    def family_name(self):
+        return 'test'
+
+    @property
+    def family_versions(self):
+        return ['1.0']
+
+    @property
+    def namespaces(self):
+        return ['abcdef']
+
+    def apply(self, transaction, context):
+        self._barrier.wait()
+
+
+class FailingHandler(BarrierHandler):
+    """Raises an error that is not a transaction processing error."""
+
+    def __init__(self):
+        super().__init__(1)
+
+    def apply(self, transaction, context):
+        raise KeyError('unexpected')
+
+
+class AsyncErrorHandler(AsyncTransactionHandler):
+    """Raises the given error from apply, or completes if it is None."""
+
+    def __init__(self, error=None):
+        self._error = error
+
+    @property
+    def family_name(self):
+        return 'test'
+
+    @property
+    def family_versions(self):
+        return ['1.0']
+
+    @property
+    def namespaces(self):
+        return ['abcdef']
+
+    @asyncio.coroutine
+    def apply(self, transaction, context):
+        yield from asyncio.sleep(0)
+        if self._error is not None:
+            raise self._error
+
+
+def _run_coroutine(coro):
+    """Runs the coroutine to completion, in place of the stream's event
+    loop, returning its concurrent.futures.Future.
+    """
+    future = concurrent.futures.Future()
+    loop = asyncio.new_event_loop()
+    try:
+        future.set_result(loop.run_until_complete(coro))
+    except Exception as err:  # pylint: disable=broad-except
+        future.set_exception(err)
+    finally:
+        loop.close()
+    return future
+
+
+@patch('sawtooth_sdk.processor.core.Stream')
+class TransactionProcessorTest(unittest.TestCase):
+    def _make_message(self, correlation_id):
+        return Message(
+            message_type=Message.TP_PROCESS_REQUEST,
+            correlation_id=correlation_id,
+            content=TpProcessRequest(
+                header=TransactionHeader(
+                    family_name='test',
+                    family_version='1.0'),
+                context_id='context').SerializeToString())
+
+    def test_register_max_occupancy(self, _):
+        """Tests that the processor asks the validator for as many
+        transactions at once as it has workers.
+        """
+        processor = TransactionProcessor('tcp://validator', max_workers=4)
+        processor.add_handler(BarrierHandler(1))
+
+        requests = list(processor._register_requests())
+        self.assertEqual(1, len(requests))
+        self.assertEqual(4, requests[0].max_occupancy)
+
+        processor = TransactionProcessor('tcp://validator')
+        processor.add_handler(BarrierHandler(1))
+
+        requests = list(processor._register_requests())
+        self.assertEqual(0, requests[0].max_occupancy)
+
+    def test_concurrent_apply(self, stream_cls):
+        """Tests that with a pool of workers, transactions are applied
+        concurrently, and each is responded to.
+        """
+        stream = stream_cls.return_value
+        stream.is_ready.return_value = True
+
+        processor = TransactionProcessor('tcp://validator', max_workers=3)
+        # Each apply only returns once all 3 are being applied
+        processor.add_handler(BarrierHandler(3))
+
+        for correlation_id in ['a', 'b', 'c']:
+            future = Mock()
+            future.result.return_value = self._make_message(correlation_id)
+            processor._process_future(future)
+
+        processor._executor.shutdown(wait=True)
+
+        self.assertEqual(3, stream.send_back.call_count)
+        responded = set()
+        for call in stream.send_back.call_args_list:
+            response = TpProcessResponse()
+            response.ParseFromString(call[1]['content'])
+            self.assertEqual(TpProcessResponse.OK, response.status)
+            responded.add(call[1]['correlation_id'])
+        self.assertEqual({'a', 'b', 'c'}, responded)
+
+    def test_concurrent_apply_unexpected_error(self, stream_cls):
+        """Tests that with a pool of workers, an unexpected error raised by
+        a handler's apply is responded to with an internal error.
+        """
+        stream = stream_cls.return_value
+        stream.is_ready.return_value = True
+
+        processor = TransactionProcessor('tcp://validator', max_workers=2)
+        processor.add_handler(FailingHandler())
+
+        future = Mock()
+        future.result.return_value = self._make_message('a')
+        with self.assertLogs('sawtooth_sdk.processor.core', level='ERROR'):
+            processor._process_future(future)
+            processor._executor.shutdown(wait=True)
+
+        stream.send_back.assert_called_once()
+        self.assertEqual('a', stream.send_back.call_args[1]['correlation_id'])
+        response = TpProcessResponse()
+        response.ParseFromString(stream.send_back.call_args[1]['content'])
+        self.assertEqual(TpProcessResponse.INTERNAL_ERROR, response.status)
+
+    def _apply_async(self, stream_cls, error):
+        """Processes a request with an AsyncErrorHandler raising the given
+        error, and returns the response sent back.
+        """
+        stream = stream_cls.return_value
+        stream.is_ready.return_value = True
+        stream.run_coroutine.side_effect = _run_coroutine
+
+        processor = TransactionProcessor('tcp://validator', max_occupancy=2)
+        processor.add_handler(AsyncErrorHandler(error))
+
+        future = Mock()
+        future.result.return_value = self._make_message('a')
+        processor._process_future(future)
+
+        stream.run_coroutine.assert_called_once()
+        self.assertEqual(set(), processor._in_flight)
+
+        stream.send_back.assert_called_once()
+        self.assertEqual('a', stream.send_back.call_args[1]['correlation_id'])
+        response = TpProcessResponse()
+        response.ParseFromString(stream.send_back.call_args[1]['content'])
+        return response
+
+    def test_async_apply(self, stream_cls):
+        """Tests that an AsyncTransactionHandler's apply is run on the
+        stream's event loop, and responded to once it completes.
+        """
+        response = self._apply_async(stream_cls, None)
+        self.assertEqual(TpProcessResponse.OK, response.status)
+
+    def test_async_apply_invalid_transaction(self, stream_cls):
+        """Tests that an InvalidTransaction raised by an
+        AsyncTransactionHandler's apply is responded to as an invalid
+        transaction.
+        """
+        response = self._apply_async(stream_cls, InvalidTransaction('bad'))
+        self.assertEqual(
+            TpProcessResponse.INVALID_TRANSACTION, response.status)
+        self.assertEqual('bad', response.message)
+
+    def test_async_apply_internal_error(self, stream_cls):
+        """Tests that an InternalError raised by an AsyncTransactionHandler's
+        apply is responded to as an internal error.
+        """
+        response = self._apply_async(stream_cls, InternalError('failed'))
+        self.assertEqual(TpProcessResponse.INTERNAL_ERROR, response.status)
+        self.assertEqual('failed', response.message)
+
+    def test_async_apply_unexpected_error(self, stream_cls):
+        """Tests that an unexpected error raised by an
+        AsyncTransactionHandler's apply is responded to as an internal error.
+        """
+        with self.assertLogs('sawtooth_sdk.processor.core', level='ERROR'):
+            response = self._apply_async(stream_cls, KeyError('unexpected'))
+        self.assertEqual(TpProcessResponse.INTERNAL_ERROR, response.status)
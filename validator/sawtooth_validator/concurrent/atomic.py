@@ -15,6 +15,7 @@
 
 from threading import Lock
 from threading import RLock
+import time
 
 
 class Counter:
@@ -128,3 +129,42 @@ class ConcurrentMultiMap:
                 return self._dict[key].copy()
             except KeyError:
                 return default
+
+
+class MovingAverage:
+    """An exponentially weighted moving average of a series of samples.
+
+    The average also decays towards 0 while no samples are added, halving
+    every HALF_LIFE seconds, so that an average raised by a period of slow
+    samples does not stay high once the samples stop.
+
+    Args:
+        weight (float): The weight, between 0 and 1, given to each new
+            sample.
+        half_life (float, optional): The time, in seconds, taken for the
+            average to halve without new samples. If None, the average does
+            not decay.
+    """
+    def __init__(self, weight=0.2, half_life=10.0):
+        self._weight = weight
+        self._half_life = half_life
+        self._value = 0.0
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def _decay(self, now):
+        if now is None:
+            now = time.monotonic()
+        if self._half_life is not None and now > self._updated:
+            self._value *= 0.5 ** ((now - self._updated) / self._half_life)
+        self._updated = max(self._updated, now)
+
+    def update(self, sample, now=None):
+        with self._lock:
+            self._decay(now)
+            self._value += self._weight * (sample - self._value)
+
+    def get(self, now=None):
+        with self._lock:
+            self._decay(now)
+            return self._value
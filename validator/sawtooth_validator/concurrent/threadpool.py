@@ -15,10 +15,12 @@
 
 import logging
 import os
+import time
 
 from concurrent.futures import ThreadPoolExecutor
 
 from sawtooth_validator import metrics
+from sawtooth_validator.concurrent.atomic import MovingAverage
 
 
 LOGGER = logging.getLogger(__name__)
@@ -54,9 +56,20 @@ class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
             "task_time_in_queue",
             instance=self,
             tags={"name": self._name})
+        # Unlike the timer, which is a no-op unless metrics are reported,
+        # this is always kept so that load can be measured at runtime.
+        self._task_time_in_queue_average = MovingAverage()
+
+    @property
+    def task_time_in_queue(self):
+        """The moving average, in seconds, of how long tasks wait in the
+        queue before running.
+        """
+        return self._task_time_in_queue_average.get()
 
     def submit(self, fn, *args, **kwargs):
         time_in_queue_ctx = self._task_time_in_queue_timer.time()
+        submit_time = time.monotonic()
 
         try:
             task_name = fn.__qualname__
@@ -70,6 +83,8 @@ class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
 
         def wrapper():
             time_in_queue_ctx.stop()
+            self._task_time_in_queue_average.update(
+                time.monotonic() - submit_time)
 
             self._workers_in_use.inc()
 
@@ -37,7 +37,10 @@ def load_default_validator_config():
         scheduler='serial',
         minimum_peer_connectivity=3,
         maximum_peer_connectivity=10,
-        state_pruning_block_depth=100)
+        state_pruning_block_depth=100,
+        batch_submission_rate=100.0,
+        batch_submission_burst=1000,
+        gossip_queue_limit=5000)
 
 
 def load_toml_validator_config(filename):
@@ -65,7 +68,9 @@ def load_toml_validator_config(filename):
          'network_private_key', 'scheduler', 'permissions', 'roles',
          'opentsdb_url', 'opentsdb_db', 'opentsdb_username',
          'opentsdb_password', 'minimum_peer_connectivity',
-         'maximum_peer_connectivity', 'state_pruning_block_depth'])
+         'maximum_peer_connectivity', 'state_pruning_block_depth',
+         'max_execution_latency', 'batch_submission_rate',
+         'batch_submission_burst', 'gossip_queue_limit'])
     if invalid_keys:
         raise LocalConfigurationError(
             "Invalid keys in validator config: "
@@ -112,7 +117,15 @@ def load_toml_validator_config(filename):
         maximum_peer_connectivity=toml_config.get(
             "maximum_peer_connectivity", None),
         state_pruning_block_depth=toml_config.get(
-            "state_pruning_block_depth", None)
+            "state_pruning_block_depth", None),
+        max_execution_latency=toml_config.get(
+            "max_execution_latency", None),
+        batch_submission_rate=toml_config.get(
+            "batch_submission_rate", None),
+        batch_submission_burst=toml_config.get(
+            "batch_submission_burst", None),
+        gossip_queue_limit=toml_config.get(
+            "gossip_queue_limit", None)
     )
 
     return config
@@ -143,6 +156,10 @@ def merge_validator_config(configs):
     minimum_peer_connectivity = None
     maximum_peer_connectivity = None
     state_pruning_block_depth = None
+    max_execution_latency = None
+    batch_submission_rate = None
+    batch_submission_burst = None
+    gossip_queue_limit = None
 
     for config in reversed(configs):
         if config.bind_network is not None:
@@ -183,6 +200,14 @@ def merge_validator_config(configs):
             maximum_peer_connectivity = config.maximum_peer_connectivity
         if config.state_pruning_block_depth is not None:
             state_pruning_block_depth = config.state_pruning_block_depth
+        if config.max_execution_latency is not None:
+            max_execution_latency = config.max_execution_latency
+        if config.batch_submission_rate is not None:
+            batch_submission_rate = config.batch_submission_rate
+        if config.batch_submission_burst is not None:
+            batch_submission_burst = config.batch_submission_burst
+        if config.gossip_queue_limit is not None:
+            gossip_queue_limit = config.gossip_queue_limit
 
     return ValidatorConfig(
         bind_network=bind_network,
@@ -203,7 +228,11 @@ def merge_validator_config(configs):
         opentsdb_password=opentsdb_password,
         minimum_peer_connectivity=minimum_peer_connectivity,
         maximum_peer_connectivity=maximum_peer_connectivity,
-        state_pruning_block_depth=state_pruning_block_depth)
+        state_pruning_block_depth=state_pruning_block_depth,
+        max_execution_latency=max_execution_latency,
+        batch_submission_rate=batch_submission_rate,
+        batch_submission_burst=batch_submission_burst,
+        gossip_queue_limit=gossip_queue_limit)
 
 
 def parse_permissions(permissions):
@@ -253,7 +282,11 @@ class ValidatorConfig:
                  opentsdb_username=None, opentsdb_password=None,
                  minimum_peer_connectivity=None,
                  maximum_peer_connectivity=None,
-                 state_pruning_block_depth=None):
+                 state_pruning_block_depth=None,
+                 max_execution_latency=None,
+                 batch_submission_rate=None,
+                 batch_submission_burst=None,
+                 gossip_queue_limit=None):
 
         self._bind_network = bind_network
         self._bind_component = bind_component
@@ -274,6 +307,10 @@ class ValidatorConfig:
         self._minimum_peer_connectivity = minimum_peer_connectivity
         self._maximum_peer_connectivity = maximum_peer_connectivity
         self._state_pruning_block_depth = state_pruning_block_depth
+        self._max_execution_latency = max_execution_latency
+        self._batch_submission_rate = batch_submission_rate
+        self._batch_submission_burst = batch_submission_burst
+        self._gossip_queue_limit = gossip_queue_limit
 
     @property
     def bind_network(self):
@@ -351,6 +388,22 @@ class ValidatorConfig:
     def state_pruning_block_depth(self):
         return self._state_pruning_block_depth
 
+    @property
+    def max_execution_latency(self):
+        return self._max_execution_latency
+
+    @property
+    def batch_submission_rate(self):
+        return self._batch_submission_rate
+
+    @property
+    def batch_submission_burst(self):
+        return self._batch_submission_burst
+
+    @property
+    def gossip_queue_limit(self):
+        return self._gossip_queue_limit
+
     def __repr__(self):
         # not including  password for opentsdb
         return (
@@ -360,7 +413,9 @@ class ValidatorConfig:
             "scheduler={}, permissions={}, roles={} "
             "opentsdb_url={}, opentsdb_db={}, opentsdb_username={}, "
             "minimum_peer_connectivity={}, maximum_peer_connectivity={}, "
-            "state_pruning_block_depth={})"
+            "state_pruning_block_depth={}, max_execution_latency={}, "
+            "batch_submission_rate={}, batch_submission_burst={}, "
+            "gossip_queue_limit={})"
         ).format(
             self.__class__.__name__,
             repr(self._bind_network),
@@ -380,7 +435,11 @@ class ValidatorConfig:
             repr(self._opentsdb_username),
             repr(self._minimum_peer_connectivity),
             repr(self._maximum_peer_connectivity),
-            repr(self._state_pruning_block_depth))
+            repr(self._state_pruning_block_depth),
+            repr(self._max_execution_latency),
+            repr(self._batch_submission_rate),
+            repr(self._batch_submission_burst),
+            repr(self._gossip_queue_limit))
 
     def to_dict(self):
         return collections.OrderedDict([
@@ -402,7 +461,11 @@ class ValidatorConfig:
             ('opentsdb_password', self._opentsdb_password),
             ('minimum_peer_connectivity', self._minimum_peer_connectivity),
             ('maximum_peer_connectivity', self._maximum_peer_connectivity),
-            ('state_pruning_block_depth', self._state_pruning_block_depth)
+            ('state_pruning_block_depth', self._state_pruning_block_depth),
+            ('max_execution_latency', self._max_execution_latency),
+            ('batch_submission_rate', self._batch_submission_rate),
+            ('batch_submission_burst', self._batch_submission_burst),
+            ('gossip_queue_limit', self._gossip_queue_limit)
         ])
 
     def to_toml_string(self):
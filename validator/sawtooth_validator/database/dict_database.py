@@ -25,13 +25,19 @@ class DictDatabase(database.Database):
     def __init__(self, data=None, indexes=None):
         super(DictDatabase, self).__init__()
 
-        if indexes:
-            self._indexes = {
-                name: ({}, key_fn)
-                for name, key_fn in indexes.items()
-            }
-        else:
-            self._indexes = {}
+        if indexes is None:
+            indexes = {}
+
+        self._indexes = {}
+        # index name -> (index key -> reference value, reference function)
+        self._index_refs = {}
+        for name, index_info in indexes.items():
+            if isinstance(index_info, dict):
+                self._indexes[name] = ({}, index_info['key_fn'])
+                if index_info.get('ref_fn') is not None:
+                    self._index_refs[name] = ({}, index_info['ref_fn'])
+            else:
+                self._indexes[name] = ({}, index_info)
 
         self._data = {}
         if data is not None:
@@ -72,6 +78,41 @@ class DictDatabase(database.Database):
                 continue
         return out
 
+    def scan_index(self, index, start_key=None, reverse=False, limit=None):
+        if index not in self._indexes:
+            raise ValueError('Index {} does not exist'.format(index))
+
+        entries = sorted(self._indexes[index][0].items(),
+                         key=lambda item: item[0])
+        if start_key is not None:
+            start_key = start_key.encode()
+            if reverse:
+                entries = [entry for entry in entries
+                           if entry[0] <= start_key]
+            else:
+                entries = [entry for entry in entries
+                           if entry[0] >= start_key]
+
+        if reverse:
+            entries.reverse()
+
+        return [(idx_key.decode(), key) for idx_key, key in entries[:limit]]
+
+    def get_index_refs(self, keys, index):
+        if index not in self._indexes:
+            raise ValueError('Index {} does not exist'.format(index))
+
+        index_data = self._indexes[index][0]
+        ref_data = self._index_refs[index][0] \
+            if index in self._index_refs else {}
+
+        out = []
+        for key in keys:
+            idx_key = key.encode()
+            if idx_key in index_data:
+                out.append((key, index_data[idx_key], ref_data.get(idx_key)))
+        return out
+
     def cursor(self, index=None):
         if index is not None and index not in self._indexes:
             raise ValueError('Index {} does not exist'.format(index))
@@ -92,6 +133,11 @@ class DictDatabase(database.Database):
                 for idx_key in index_keys:
                     index_data[idx_key] = key
 
+            for name, (ref_data, ref_fn) in self._index_refs.items():
+                ref = ref_fn(val)
+                for idx_key in self._indexes[name][1](val):
+                    ref_data[idx_key] = ref
+
         for k in deletes:
             if k not in self._data:
                 continue
@@ -103,6 +149,10 @@ class DictDatabase(database.Database):
                 for idx_key in index_keys:
                     del index_data[idx_key]
 
+            for name, (ref_data, _) in self._index_refs.items():
+                for idx_key in self._indexes[name][1](old_value):
+                    ref_data.pop(idx_key, None)
+
     def keys(self, index=None):
         return self._data.keys()
 
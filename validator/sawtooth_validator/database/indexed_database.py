@@ -13,6 +13,7 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+import itertools
 import logging
 import os
 import lmdb
@@ -24,6 +25,12 @@ LOGGER = logging.getLogger(__name__)
 
 DEFAULT_SIZE = 1024**4
 
+# Separates the primary key from the reference value in an index entry
+_REF_SEPARATOR = b'\x00'
+
+# The value of an index's marker key, once the index has been built
+_INDEX_BUILT = b'built'
+
 
 class IndexOutOfSyncError(Exception):
     pass
@@ -40,6 +47,7 @@ class IndexedDatabase(database.Database):
     def __init__(self, filename, serializer, deserializer,
                  indexes=None,
                  flag=None,
+                 zero_copy=False,
                  _size=DEFAULT_SIZE):
         """Constructor for the IndexedDatabase class.
 
@@ -50,10 +58,17 @@ class IndexedDatabase(database.Database):
             indexes (dict:(str,function):optional): dict of index names to key
                 functions.  The key functions use the deserialized value and
                 produce n index keys, that will reference the items primary
-                key. Defaults to None
+                key. An index may instead be defined by a dict with a
+                'key_fn', and optionally 'integerkey', or a 'ref_fn', which
+                produces a compact reference value (bytes) that is stored
+                with the primary key in each index entry. Defaults to None
             flag (str:optional): a flag indicating the mode for opening the
                 database.  Refer to the documentation for anydbm.open().
                 Defaults to None.
+            zero_copy (bool:optional): pass values to the deserializer as
+                memoryviews into the database, rather than as copies. The
+                deserializer must not retain the memoryview. Defaults to
+                False.
         """
         super(IndexedDatabase, self).__init__()
 
@@ -69,6 +84,7 @@ class IndexedDatabase(database.Database):
 
         self._serializer = serializer
         self._deserializer = deserializer
+        self._zero_copy = zero_copy
 
         self._lmdb = lmdb.Environment(
             path=filename,
@@ -78,23 +94,71 @@ class IndexedDatabase(database.Database):
             readahead=False,
             subdir=False,
             create=create,
-            max_dbs=len(indexes) + 1,
+            max_dbs=len(indexes) + 2,
             lock=True)
 
         self._main_db = self._lmdb.open_db('main'.encode())
+        # Marks the indexes that have been built, by name
+        self._index_meta_db = self._lmdb.open_db('index_meta'.encode())
 
         self._indexes = \
             {name: self._make_index_tuple(name, index_info)
              for name, index_info in indexes.items()}
 
+        self._build_empty_indexes()
+
+    def _build_empty_indexes(self):
+        """Populates any index that has not been built yet, such as an index
+        that has been added to an existing database, and marks it as built so
+        the database is not scanned again the next time it is opened.
+        """
+        with self._lmdb.begin(db=self._index_meta_db) as txn:
+            unbuilt = [name for name in self._indexes
+                       if txn.get(name.encode()) != _INDEX_BUILT]
+
+        if not unbuilt:
+            return
+
+        with self._lmdb.begin(write=True, buffers=True) as txn:
+            # An index that already has entries was kept up to date by
+            # earlier writes, and only needs to be marked
+            empty_indexes = []
+            if txn.stat(self._main_db)['entries'] > 0:
+                empty_indexes = [
+                    (name,) + self._indexes[name]
+                    for name in unbuilt
+                    if txn.stat(self._indexes[name][0])['entries'] == 0]
+
+            if empty_indexes:
+                LOGGER.info(
+                    'Building indexes: %s',
+                    ', '.join(name for name, _, _, _ in empty_indexes))
+
+                cursor = txn.cursor(self._main_db)
+                for key, packed in cursor.iternext():
+                    key = bytes(key)
+                    value = self._deserializer(bytes(packed))
+                    for (_, index_db, index_key_fn, index_ref_fn) \
+                            in empty_indexes:
+                        index_cursor = txn.cursor(index_db)
+                        index_value = _pack_index_value(
+                            key, value, index_ref_fn)
+                        for idx_key in index_key_fn(value):
+                            index_cursor.put(idx_key, index_value)
+
+            for name in unbuilt:
+                txn.put(name.encode(), _INDEX_BUILT, db=self._index_meta_db)
+
     def _make_index_tuple(self, name, index_info):
         if callable(index_info):
             key_fn = index_info
             integerkey = False
+            ref_fn = None
         elif isinstance(index_info, dict):
             key_fn = index_info['key_fn']
             integerkey = index_info['integerkey'] \
                 if 'integerkey' in index_info else False
+            ref_fn = index_info.get('ref_fn')
         else:
             raise ValueError(
                 'Index {} must be defined as a function or a dict'.format(
@@ -102,7 +166,8 @@ class IndexedDatabase(database.Database):
 
         return (self._lmdb.open_db('index_{}'.format(name).encode(),
                                    integerkey=integerkey),
-                key_fn)
+                key_fn,
+                ref_fn)
 
     # pylint: disable=no-value-for-parameter
     def __len__(self):
@@ -135,7 +200,7 @@ class IndexedDatabase(database.Database):
         if index is not None and index not in self._indexes:
             raise ValueError('Index {} does not exist'.format(index))
 
-        with self._lmdb.begin() as txn:
+        with self._lmdb.begin(buffers=self._zero_copy) as txn:
             result = []
             cursor = txn.cursor(self._main_db)
             index_cursor = None
@@ -143,6 +208,10 @@ class IndexedDatabase(database.Database):
                 index_db = self._indexes[index][0]
                 index_cursor = txn.cursor(index_db)
 
+            # Many index keys may reference the same primary key, such as the
+            # transactions of a block, so each value is only deserialized once
+            values = {}
+
             for key in keys:
                 read_key = key.encode()
                 # If we're looking at an index, check the index first
@@ -153,6 +222,11 @@ class IndexedDatabase(database.Database):
                         raise KeyError("Invalid key: %s" % read_key)
                     if not read_key:
                         continue
+                    read_key, _ = _unpack_index_value(bytes(read_key))
+
+                if read_key in values:
+                    result.append((read_key.decode(), values[read_key]))
+                    continue
 
                 try:
                     packed = cursor.get(read_key)
@@ -160,14 +234,87 @@ class IndexedDatabase(database.Database):
                     raise KeyError("Invalid key: %s" % read_key)
 
                 if packed is not None:
-                    result.append((read_key.decode(),
-                                   self._deserializer(packed)))
+                    value = self._deserializer(packed)
+                    values[read_key] = value
+                    result.append((read_key.decode(), value))
                 elif index_cursor:
                     raise IndexOutOfSyncError(
                         'Index is out of sync for key {}'.format(key))
 
         return result
 
+    def scan_index(self, index, start_key=None, reverse=False, limit=None):
+        """Returns the index entries in index key order, beginning at the
+        given start key, without reading the referenced values.
+
+        Args:
+            index (str): the index name
+            start_key (str): the first index key to return; if it is not in
+                the index, the scan begins at the next key in the direction
+                of the scan. Defaults to the first (or last) key.
+            reverse (bool): scan in descending key order
+            limit (int): the maximum number of entries to return
+
+        Returns:
+            list: a list of (index key, primary key) pairs
+        """
+        if index not in self._indexes:
+            raise ValueError('Index {} does not exist'.format(index))
+
+        with self._lmdb.begin(db=self._indexes[index][0]) as txn:
+            cursor = txn.cursor()
+            if start_key is None:
+                positioned = cursor.last() if reverse else cursor.first()
+            else:
+                start_key = start_key.encode()
+                positioned = cursor.set_range(start_key)
+                if reverse:
+                    if not positioned:
+                        positioned = cursor.last()
+                    elif cursor.key() != start_key:
+                        positioned = cursor.prev()
+
+            if not positioned:
+                return []
+
+            iterator = cursor.iterprev() if reverse else cursor.iternext()
+            return [(key.decode(), _unpack_index_value(value)[0].decode())
+                    for key, value in itertools.islice(iterator, limit)]
+
+    def get_index_refs(self, keys, index):
+        """Retrieves the primary keys and reference values for the given
+        index keys, without reading the values from the main database.
+
+        Any index key not found will not be in the resulting list.
+
+        Args:
+            keys (:iterable:str:): an iterable of index keys
+            index (str): the index name
+
+        Returns:
+            list: a list of (index key, primary key, reference value) tuples;
+                the reference value is None if the index does not have a
+                'ref_fn', or if the entry was written without one
+        """
+        if index not in self._indexes:
+            raise ValueError('Index {} does not exist'.format(index))
+
+        with self._lmdb.begin(db=self._indexes[index][0]) as txn:
+            cursor = txn.cursor()
+            result = []
+            for key in keys:
+                try:
+                    index_value = cursor.get(key.encode())
+                except lmdb.BadValsizeError:
+                    raise KeyError("Invalid key: %s" % key)
+                if not index_value:
+                    continue
+
+                primary_key, ref = _unpack_index_value(index_value)
+                result.append((key, primary_key.decode(), ref))
+
+        return result
+
     def cursor(self, index=None):
         if index is not None and index not in self._indexes:
             raise ValueError('Index {} does not exist'.format(index))
@@ -177,7 +324,8 @@ class IndexedDatabase(database.Database):
             db_chain.append(self._indexes[index][0])
 
         db_chain.append(self._main_db)
-        return ReferenceChainCursor(self._lmdb, db_chain, self._deserializer)
+        return ReferenceChainCursor(self._lmdb, db_chain, self._deserializer,
+                                    buffers=self._zero_copy)
 
     def update(self, puts, deletes):
         """Applies the given puts and deletes atomically.
@@ -198,7 +346,7 @@ class IndexedDatabase(database.Database):
                 value = self._deserializer(bytes(cursor.value()))
                 cursor.delete()
 
-                for (index_db, index_key_fn) in self._indexes.values():
+                for (index_db, index_key_fn, _) in self._indexes.values():
                     index_keys = index_key_fn(value)
                     index_cursor = txn.cursor(index_db)
                     for idx_key in index_keys:
@@ -211,11 +359,14 @@ class IndexedDatabase(database.Database):
 
                 cursor.put(key.encode(), packed, overwrite=True)
 
-                for (index_db, index_key_fn) in self._indexes.values():
+                for (index_db, index_key_fn, index_ref_fn) \
+                        in self._indexes.values():
                     index_keys = index_key_fn(value)
                     index_cursor = txn.cursor(index_db)
+                    index_value = _pack_index_value(
+                        key.encode(), value, index_ref_fn)
                     for idx_key in index_keys:
-                        index_cursor.put(idx_key, key.encode())
+                        index_cursor.put(idx_key, index_value)
 
         self.sync()
 
@@ -249,9 +400,11 @@ class ReferenceChainCursor(database.Cursor):
     chain being key_n -> value.
     """
 
-    def __init__(self, lmdb_env, reference_chain, deserializer):
+    def __init__(self, lmdb_env, reference_chain, deserializer,
+                 buffers=False):
         self._lmdb_env = lmdb_env
         self._deserializer = deserializer
+        self._buffers = buffers
 
         self._lmdb_txn = None
 
@@ -263,7 +416,7 @@ class ReferenceChainCursor(database.Cursor):
         self._lmdb_cursors = []
 
     def open(self):
-        self._lmdb_txn = self._lmdb_env.begin()
+        self._lmdb_txn = self._lmdb_env.begin(buffers=self._buffers)
 
         self._lmdb_cursors = [self._lmdb_txn.cursor(db)
                               for db in self._reference_chain]
@@ -303,7 +456,7 @@ class ReferenceChainCursor(database.Cursor):
     def key(self):
         key = self._seek_curs().key()
         if key is not None:
-            return key.decode()
+            return bytes(key).decode()
 
         return None
 
@@ -339,6 +492,7 @@ def _read(initial_key, cursor_chain, deserializer):
     key = initial_key
     packed = key
     for curs in cursor_chain:
+        key, _ = _unpack_index_value(bytes(key))
         packed = curs.get(key)
         if not packed:
             raise IndexOutOfSyncError(
@@ -346,3 +500,16 @@ def _read(initial_key, cursor_chain, deserializer):
         key = packed
 
     return deserializer(packed)
+
+
+def _pack_index_value(key, value, ref_fn):
+    if ref_fn is None:
+        return key
+    return key + _REF_SEPARATOR + ref_fn(value)
+
+
+def _unpack_index_value(index_value):
+    key, separator, ref = index_value.partition(_REF_SEPARATOR)
+    if not separator:
+        return key, None
+    return key, ref
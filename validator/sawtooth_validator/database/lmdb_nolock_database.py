@@ -69,6 +69,9 @@ class LMDBNoLockDatabase(database.Database):
         with self._lmdb.begin() as txn:
             packed = txn.get(key.encode())
 
+        if packed is None:
+            return None
+
         try:
             return cbor.loads(packed)
         except ValueError:
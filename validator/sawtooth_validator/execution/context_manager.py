@@ -313,16 +313,7 @@ class ContextManager:
 
             if reads:
                 tree = MerkleDatabase(self._database, context.merkle_root)
-                add_values = []
-                for add in reads:
-                    value = None
-                    try:
-                        value = tree.get(add)
-                    except KeyError:
-                        # The address is not in the radix tree/merkle tree
-                        pass
-                    add_values.append((add, value))
-                values_list.extend(add_values)
+                values_list.extend(tree.get_multi(reads))
 
             values_list.sort(key=lambda x: address_list.index(x[0]))
 
@@ -491,14 +482,7 @@ class _ContextReader(InstrumentedThread):
                 break
             c_id, state_hash, address_list = context_state_addresslist_tuple
             tree = MerkleDatabase(self._database, state_hash)
-            return_values = []
-            for address in address_list:
-                value = None
-                try:
-                    value = tree.get(address)
-                except KeyError:
-                    pass
-                return_values.append((address, value))
+            return_values = tree.get_multi(address_list)
             self._inflated_addresses.put((c_id, return_values))
 
 
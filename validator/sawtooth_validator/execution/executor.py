@@ -25,6 +25,7 @@ from sawtooth_validator.protobuf import validator_pb2
 from sawtooth_validator.protobuf import transaction_receipt_pb2
 from sawtooth_validator.exceptions import WaitCancelledException
 
+from sawtooth_validator.concurrent.atomic import MovingAverage
 from sawtooth_validator.concurrent.threadpool import \
     InstrumentedThreadPoolExecutor
 from sawtooth_validator.execution.context_manager import \
@@ -55,7 +56,8 @@ class TransactionExecutorThread:
                  scheduler,
                  processor_manager,
                  settings_view_factory,
-                 invalid_observers):
+                 invalid_observers,
+                 execution_latency=None):
         """
         Args:
             service (Interconnect): The zmq internal interface
@@ -66,6 +68,9 @@ class TransactionExecutorThread:
                 transaction processor to send to.
             settings_view_factory (SettingsViewFactory): Read the configuration
                 state
+            execution_latency (MovingAverage, optional): Updated with the
+                time taken by transaction processors to process each
+                transaction
         Attributes:
             _tp_settings_key (str): the key used to reference the part of state
                 where the list of required transaction processors are.
@@ -79,7 +84,10 @@ class TransactionExecutorThread:
         self._tp_settings_key = "sawtooth.validator.transaction_families"
         self._done = False
         self._invalid_observers = invalid_observers
+        self._execution_latency = execution_latency
         self._open_futures = {}
+        # state root hash -> _TransactionFamilyPolicy
+        self._family_policies = {}
 
         self._tp_process_response_counters = {}
         self._transaction_execution_count = COLLECTOR.counter(
@@ -119,7 +127,9 @@ class TransactionExecutorThread:
 
         if result.connection_id in self._open_futures and \
                 req.signature in self._open_futures[result.connection_id]:
-            del self._open_futures[result.connection_id][req.signature]
+            fut = self._open_futures[result.connection_id].pop(req.signature)
+            if self._execution_latency is not None:
+                self._execution_latency.update(fut.get_duration())
 
         if response.status == processor_pb2.TpProcessResponse.OK:
             state_sets, state_deletes, events, data = \
@@ -191,33 +201,12 @@ class TransactionExecutorThread:
                 header.family_name,
                 header.family_version)
 
-            config = self._settings_view_factory.create_settings_view(
-                txn_info.state_hash)
-
-            transaction_families = config.get_setting(
-                key=self._tp_settings_key,
-                default_value="[]")
-
-            # After reading the transaction families required in configuration
-            # try to json.loads them into a python object
-            # If there is a misconfiguration, proceed as if there is no
-            # configuration.
-            try:
-                transaction_families = json.loads(transaction_families)
-                required_transaction_processors = [
-                    ProcessorType(
-                        d.get('family'),
-                        d.get('version')) for d in transaction_families]
-            except ValueError:
-                LOGGER.error("sawtooth.validator.transaction_families "
-                             "misconfigured. Expecting a json array, found"
-                             " %s", transaction_families)
-                required_transaction_processors = []
+            policy = self._get_family_policy(txn_info.state_hash)
 
             # First check if the transaction should be failed
             # based on configuration
-            if required_transaction_processors and \
-                    processor_type not in required_transaction_processors:
+            if policy.is_restricted and \
+                    processor_type not in policy.namespaces:
                 # The txn processor type is not in the required
                 # transaction processors so
                 # failing transaction right away
@@ -231,27 +220,14 @@ class TransactionExecutorThread:
                 self._fail_transaction(txn.header_signature)
                 continue
 
-            if processor_type in required_transaction_processors:
+            if processor_type in policy.namespaces:
                 # The txn processor type is in the required
                 # transaction processors: check all the outputs of
                 # the transaction match one namespace listed
-                transaction_family = \
-                    next(t for t in transaction_families
-                         if t.get('family') == header.family_name
-                         and t.get('version') == header.family_version)
-
-                # if no namespaces are indicated, then the empty prefix is
-                # inserted by default
-                namespaces = transaction_family.get('namespaces', [''])
-                if not isinstance(namespaces, list):
-                    LOGGER.error("namespaces should be a list for "
-                                 "transaction family (name=%s, version=%s)",
-                                 processor_type.name,
-                                 processor_type.version)
-                prefixes = header.outputs
+                namespaces = policy.namespaces[processor_type]
                 bad_prefixes = [
-                    prefix for prefix in prefixes
-                    if not any(prefix.startswith(n) for n in namespaces)
+                    prefix for prefix in header.outputs
+                    if not namespaces.matches(prefix)
                 ]
                 for prefix in bad_prefixes:
                     # log each
@@ -307,6 +283,24 @@ class TransactionExecutorThread:
 
         self._done = True
 
+    def _get_family_policy(self, state_hash):
+        """Returns the transaction family policy configured in the given
+        state, which is read and compiled once per state root.
+        """
+        try:
+            return self._family_policies[state_hash]
+        except KeyError:
+            pass
+
+        config = self._settings_view_factory.create_settings_view(state_hash)
+        transaction_families = config.get_setting(
+            key=self._tp_settings_key,
+            default_value="[]")
+
+        policy = _TransactionFamilyPolicy(transaction_families)
+        self._family_policies[state_hash] = policy
+        return policy
+
     def _execute(self, processor_type, content, signature):
         try:
             processor = self._processor_manager.get_next_of_type(
@@ -378,6 +372,88 @@ class TransactionExecutorThread:
         self._scheduler.cancel()
 
 
+class _TransactionFamilyPolicy:
+    """The transaction families, and the namespaces they may write to, that
+    are required by the sawtooth.validator.transaction_families setting.
+
+    Attributes:
+        is_restricted (bool): whether only the listed transaction families
+            may be executed
+        namespaces (dict): _NamespaceTrie of the namespaces each listed
+            transaction family may write to, by ProcessorType
+    """
+
+    def __init__(self, transaction_families):
+        self.namespaces = {}
+
+        # After reading the transaction families required in configuration
+        # try to json.loads them into a python object
+        # If there is a misconfiguration, proceed as if there is no
+        # configuration.
+        try:
+            transaction_families = json.loads(transaction_families)
+            required_transaction_processors = [
+                (ProcessorType(d.get('family'), d.get('version')), d)
+                for d in transaction_families]
+        except (ValueError, TypeError, AttributeError):
+            LOGGER.error("sawtooth.validator.transaction_families "
+                         "misconfigured. Expecting a json array, found"
+                         " %s", transaction_families)
+            required_transaction_processors = []
+
+        self.is_restricted = bool(required_transaction_processors)
+
+        for processor_type, transaction_family in \
+                required_transaction_processors:
+            # The first listing of a transaction family applies
+            if processor_type in self.namespaces:
+                continue
+
+            # if no namespaces are indicated, then the empty prefix is
+            # inserted by default
+            namespaces = transaction_family.get('namespaces', [''])
+            if not isinstance(namespaces, list):
+                LOGGER.error("namespaces should be a list for "
+                             "transaction family (name=%s, version=%s)",
+                             processor_type.name,
+                             processor_type.version)
+
+            self.namespaces[processor_type] = _NamespaceTrie(namespaces)
+
+
+class _NamespaceTrie:
+    """A prefix trie of namespaces, which matches the addresses that start
+    with any of them.
+    """
+
+    def __init__(self, namespaces):
+        self._namespaces = namespaces
+        # char -> child node; a node containing None ends a namespace
+        self._root = {}
+        for namespace in namespaces:
+            node = self._root
+            for char in namespace:
+                node = node.setdefault(char, {})
+            node[None] = True
+
+    def matches(self, address):
+        node = self._root
+        if None in node:
+            return True
+
+        for char in address:
+            node = node.get(char)
+            if node is None:
+                return False
+            if None in node:
+                return True
+
+        return False
+
+    def __str__(self):
+        return str(self._namespaces)
+
+
 class TransactionExecutor:
     def __init__(self,
                  service,
@@ -410,6 +486,15 @@ class TransactionExecutor:
 
         self._scheduler_type = scheduler_type
 
+        self._execution_latency = MovingAverage()
+
+    @property
+    def execution_latency(self):
+        """The moving average, in seconds, of the time taken by transaction
+        processors to process a transaction.
+        """
+        return self._execution_latency.get()
+
     def create_scheduler(self,
                          first_state_root,
                          always_persist=False):
@@ -488,7 +573,8 @@ class TransactionExecutor:
             scheduler=scheduler,
             processor_manager=self.processor_manager,
             settings_view_factory=self._settings_view_factory,
-            invalid_observers=self._invalid_observers)
+            invalid_observers=self._invalid_observers,
+            execution_latency=self._execution_latency)
         self._executing_threadpool.submit(t.execute_thread)
         with self._lock:
             self._alive_threads.append(t)
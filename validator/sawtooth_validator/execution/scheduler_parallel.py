@@ -13,6 +13,8 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+import heapq
+import itertools
 from itertools import filterfalse
 from threading import Condition
 import logging
@@ -42,49 +44,100 @@ class AddressNotInTree(Exception):
         self.match = match
 
 
+# Addresses are hex strings, so each node keeps its children in a 16-slot
+# list indexed by the nibble following the node's address. Any other
+# character (which only shows up in tests and hand-written addresses)
+# falls back to a dict.
+_NIBBLES = {char: index for index, char in enumerate('0123456789abcdef')}
+
+
 class Node:
+    __slots__ = ('address', 'data', '_slots', '_others')
+
     def __init__(self, address, data=None):
         self.address = address
-        self.children = set()
         self.data = data
+        self._slots = None
+        self._others = None
+
+    def get_child(self, char):
+        '''
+        Returns the child whose address continues this node's address
+        with CHAR, or None.
+        '''
+        index = _NIBBLES.get(char)
+        if index is None:
+            if self._others is None:
+                return None
+            return self._others.get(char)
+
+        if self._slots is None:
+            return None
+        return self._slots[index]
+
+    def set_child(self, child):
+        char = child.address[len(self.address)]
+        index = _NIBBLES.get(char)
+        if index is None:
+            if self._others is None:
+                self._others = {}
+            self._others[char] = child
+            return
+
+        if self._slots is None:
+            self._slots = [None] * 16
+        self._slots[index] = child
+
+    def children(self):
+        if self._slots is not None:
+            for child in self._slots:
+                if child is not None:
+                    yield child
+
+        if self._others is not None:
+            yield from self._others.values()
+
+    def clear_children(self):
+        self._slots = None
+        self._others = None
 
 
 class Tree:
     '''
-    This tree is a prefix tree: a node's address is always a strict
-    prefix of the addresses of its children, and every node either has
-    data or has multiple children.
+    This tree is a path-compressed radix tree: a node's address is
+    always a strict prefix of the addresses of its children, and every
+    node either has data or has multiple children. A child is found by
+    indexing its parent with the first character following the parent's
+    address, so no level requires a scan over siblings.
     '''
     def __init__(self):
         self._root = Node('')
 
-    def _get_child(self, node, address):
-        for child in node.children:
-            if address.startswith(child.address):
-                return child
-
-        match = None
-
-        for child in node.children:
-            if child.address.startswith(address):
-                match = child.address
-
-        raise AddressNotInTree(match=match)
-
     def _walk_to_address(self, address):
         node = self._root
 
         yield node
 
         # A node's address is always a proper prefix of the addresses
-        # of its children, so we only need to check the ordering. A
-        # more explicit but also more verbose and probably slower
-        # check would be:
-        #
-        # while address != node.address and address.startswith(node.address):
-        #
-        while node.address < address:
-            node = self._get_child(node, address)
+        # of its children, and only children whose addresses are
+        # prefixes of ADDRESS are followed, so comparing lengths is
+        # enough to know whether ADDRESS has been reached.
+        address_len = len(address)
+        node_len = 0
+
+        while node_len < address_len:
+            child = node.get_child(address[node_len])
+
+            if child is None:
+                raise AddressNotInTree()
+
+            if not address.startswith(child.address):
+                if child.address.startswith(address):
+                    raise AddressNotInTree(match=child.address)
+                raise AddressNotInTree()
+
+            node = child
+            node_len = len(node.address)
 
             yield node
 
@@ -102,7 +155,7 @@ class Tree:
         node.data = updater(node.data)
 
         if prune:
-            node.children.clear()
+            node.clear_children()
 
     def prune(self, address):
         '''
@@ -118,7 +171,7 @@ class Tree:
         except AddressNotInTree:
             return
 
-        node.children.clear()
+        node.clear_children()
 
     def walk(self, address):
         '''
@@ -137,84 +190,66 @@ class Tree:
             node = step
             yield node.address, node.data
 
-        to_process = deque()
-
-        to_process.extendleft(
-            node.children)
+        to_process = list(node.children())
 
         while to_process:
             node = to_process.pop()
 
             yield node.address, node.data
 
-            if node.children:
-                to_process.extendleft(
-                    node.children)
+            to_process.extend(node.children())
 
     def _get_or_create(self, address):
         # Walk as far down the tree as possible. If the desired
         # address is reached, return that node. Otherwise, add a new
         # one.
-        try:
-            for step in self._walk_to_address(address):
-                node = step
+        node = self._root
+        address_len = len(address)
+        prefix_len = 0
 
-            return node
+        while prefix_len < address_len:
+            match = node.get_child(address[prefix_len])
 
-        except AddressNotInTree:
-            # The rest of the function deals with adding a new node,
-            # but there's no sense adding a level of indentation, so
-            # just pass here.
-            pass
+            # There's no match, so just add the new address as a child.
+            if match is None:
+                new_node = Node(address)
+                node.set_child(new_node)
+                return new_node
 
-        # The address isn't in the tree, so a new node will be added
-        # one way or another.
-        new_node = Node(address)
+            if not address.startswith(match.address):
+                break
 
-        # Try to get the next child with a matching prefix.
-        try:
+            node = match
             prefix_len = len(node.address)
 
-            match = next(
-                child
-                for child in node.children
-                if child.address[prefix_len:].startswith(
-                    address[prefix_len:][0])
-            )
+        else:
+            return node
 
-        # There's no match, so just add the new address as a child.
-        except StopIteration:
-            node.children.add(new_node)
-            return new_node
+        # The address isn't in the tree, so a new node will be added
+        # between NODE and MATCH.
+        new_node = Node(address)
 
         # If node address is 'rustic' and the address being added is
         # 'rust', then 'rust' will be the intermediate node taking
         # 'rustic' as a child.
         if match.address.startswith(address):
-            node.children.add(new_node)
-            new_node.children.add(match)
-            node.children.remove(match)
+            new_node.set_child(match)
+            node.set_child(new_node)
             return new_node
 
         # The address and the match address share a common prefix, so
         # an intermediate node with the prefix as its address will
-        # take them both as children.
-
-        shorter = (
-            address
-            if len(address) < len(match.address)
-            else match.address
-        )
-
-        for i in range(1, len(shorter)):
-            if address[i] != match.address[i]:
-                prefix = shorter[:i]
-                break
-
-        intermediate_node = Node(prefix)
-        intermediate_node.children.update((new_node, match))
-        node.children.add(intermediate_node)
-        node.children.remove(match)
+        # take them both as children. Since neither address is a
+        # prefix of the other, they differ before either one ends.
+        match_address = match.address
+        i = prefix_len + 1
+        while address[i] == match_address[i]:
+            i += 1
+
+        intermediate_node = Node(address[:i])
+        intermediate_node.set_child(new_node)
+        intermediate_node.set_child(match)
+        node.set_child(intermediate_node)
         return new_node
 
 
@@ -502,6 +537,23 @@ class ParallelScheduler(Scheduler):
         self._txns_available = OrderedDict()
         self._transactions = {}
 
+        # The explicit dependencies of each transaction, from its header
+        self._txn_dependencies = {}
+
+        # The available transactions that may be ready to schedule, as a heap
+        # of (sequence number, txn id), in the order they became available.
+        # An entry is stale if its sequence number no longer matches the
+        # transaction's in self._available_sequence.
+        self._ready = []
+        self._available_sequence = {}
+        self._sequence_numbers = itertools.count()
+
+        # Available transactions that are blocked until another transaction
+        # has a result: txn id -> blocking txn id, and blocking txn id ->
+        # list of the txn ids it blocks
+        self._blocked = {}
+        self._blocked_by = {}
+
         self._cancelled = False
         self._final = False
 
@@ -551,8 +603,8 @@ class ParallelScheduler(Scheduler):
                 _AnnotatedBatch(batch, required=required, preserve=preserve)
             for txn in batch.transactions:
                 self._batches_by_txn_id[txn.header_signature] = batch
-                self._txns_available[txn.header_signature] = txn
                 self._transactions[txn.header_signature] = txn
+                self._make_available(txn.header_signature)
 
             if state_hash is not None:
                 b_id = batch.header_signature
@@ -573,6 +625,8 @@ class ParallelScheduler(Scheduler):
                     self._find_output_dependencies(header.outputs))
 
                 txn_id = txn.header_signature
+                self._txn_dependencies[txn_id] = tuple(header.dependencies)
+
                 # Update our internal state with the computed predecessors.
                 self._txn_predecessors[txn_id] = set(predecessors)
                 self._predecessor_chain.add_relationship(
@@ -786,16 +840,14 @@ class ParallelScheduler(Scheduler):
                     if self._txn_has_result(poss_successor):
                         del self._txn_results[poss_successor]
                         self._scheduled.remove(poss_successor)
-                        self._txns_available[poss_successor] = \
-                            self._transactions[poss_successor]
+                        self._make_available(poss_successor)
                     else:
                         self._outstanding.add(poss_successor)
                     seen.append(poss_successor)
 
     def _reschedule_if_outstanding(self, txn_signature):
         if txn_signature in self._outstanding:
-            self._txns_available[txn_signature] = \
-                self._transactions[txn_signature]
+            self._make_available(txn_signature)
             self._scheduled.remove(txn_signature)
             self._outstanding.discard(txn_signature)
             return True
@@ -875,6 +927,7 @@ class ParallelScheduler(Scheduler):
                     data=data,
                     error_message=error_message,
                     error_data=error_data)
+                self._unblock(txn_signature)
 
             self._condition.notify_all()
 
@@ -956,53 +1009,118 @@ class ParallelScheduler(Scheduler):
         batch_id = self._batches_by_txn_id[txn_id].header_signature
         return batch_id == self._least_batch_id_wo_results
 
+    def _make_available(self, txn_id):
+        """Adds the transaction to the available transactions, if it is not
+        already available, and queues it to be checked for readiness.
+        """
+        if txn_id in self._txns_available:
+            return
+
+        self._txns_available[txn_id] = self._transactions[txn_id]
+        sequence = next(self._sequence_numbers)
+        self._available_sequence[txn_id] = sequence
+        heapq.heappush(self._ready, (sequence, txn_id))
+
+    def _remove_available(self, txn_id):
+        del self._txns_available[txn_id]
+        del self._available_sequence[txn_id]
+        self._blocked.pop(txn_id, None)
+
+    def _block(self, txn_id, blocking_txn_id):
+        self._blocked[txn_id] = blocking_txn_id
+        self._blocked_by.setdefault(blocking_txn_id, []).append(txn_id)
+
+    def _unblock(self, blocking_txn_id):
+        """Queues the transactions blocked by the given transaction to be
+        checked for readiness again, as it now has a result or is no longer
+        scheduled.
+        """
+        for txn_id in self._blocked_by.pop(blocking_txn_id, ()):
+            if self._blocked.get(txn_id) == blocking_txn_id:
+                del self._blocked[txn_id]
+                heapq.heappush(
+                    self._ready,
+                    (self._available_sequence[txn_id], txn_id))
+
+    def _find_blocking_txn(self, txn_id):
+        """Returns the id of a transaction without a result that prevents the
+        given transaction from being scheduled, or None.
+        """
+        for predecessor_id in self._txn_predecessors[txn_id]:
+            if predecessor_id not in self._txn_results:
+                return predecessor_id
+            # Since get_initial_state_for_transaction gets context ids not
+            # just from predecessors but also in the case of an enclosing
+            # writer failing, predecessors of that predecessor, this extra
+            # check is needed.
+            for pre_pred_id in self._txn_predecessors[predecessor_id]:
+                if pre_pred_id not in self._txn_results:
+                    return pre_pred_id
+
+        # All of the transactions in the batch of an explicit dependency
+        # must have results
+        for dep in self._txn_dependencies[txn_id]:
+            if dep in self._batches_by_txn_id:
+                for txn in self._batches_by_txn_id[dep].transactions:
+                    if txn.header_signature not in self._txn_results:
+                        return txn.header_signature
+
+        return None
+
     def next_transaction(self):
         with self._condition:
             # We return the next transaction which hasn't been scheduled and
-            # is not blocked by a dependency.
+            # is not blocked by a dependency. Only the transactions that are
+            # not known to be blocked are checked; a blocked transaction is
+            # checked again once the transaction blocking it has a result.
 
             next_txn = None
 
-            no_longer_available = []
+            deferred = []
 
-            for txn_id, txn in self._txns_available.items():
-                if (self._has_predecessors(txn_id)
-                        or self._is_outstanding(txn_id)):
+            while self._ready:
+                sequence, txn_id = heapq.heappop(self._ready)
+                if self._available_sequence.get(txn_id) != sequence or \
+                        txn_id in self._blocked:
                     continue
 
-                header = TransactionHeader()
-                header.ParseFromString(txn.header)
-                deps = tuple(header.dependencies)
+                if self._is_outstanding(txn_id):
+                    deferred.append((sequence, txn_id))
+                    continue
 
-                if self._dependency_not_processed(deps):
+                blocking_txn_id = self._find_blocking_txn(txn_id)
+                if blocking_txn_id is not None:
+                    self._block(txn_id, blocking_txn_id)
                     continue
 
-                if self._txn_failed_by_dep(deps):
-                    no_longer_available.append(txn_id)
+                if self._txn_failed_by_dep(self._txn_dependencies[txn_id]):
+                    self._remove_available(txn_id)
                     self._txn_results[txn_id] = \
                         TxnExecutionResult(
                             signature=txn_id,
                             is_valid=False,
                             context_id=None,
                             state_hash=None)
+                    self._unblock(txn_id)
                     continue
 
                 if not self._txn_is_in_valid_batch(txn_id) and \
                         self._can_fail_fast(txn_id):
+                    self._remove_available(txn_id)
                     self._txn_results[txn_id] = \
                         TxnExecutionResult(
                             signature=txn_id,
                             is_valid=False,
                             context_id=None,
                             state_hash=None)
-                    no_longer_available.append(txn_id)
+                    self._unblock(txn_id)
                     continue
 
-                next_txn = txn
+                next_txn = self._txns_available[txn_id]
                 break
 
-            for txn_id in no_longer_available:
-                del self._txns_available[txn_id]
+            for entry in deferred:
+                heapq.heappush(self._ready, entry)
 
             if next_txn is not None:
                 bases = self._get_initial_state_for_transaction(next_txn)
@@ -1012,18 +1130,11 @@ class ParallelScheduler(Scheduler):
                     state_hash=self._first_state_hash,
                     base_context_ids=bases)
                 self._scheduled.append(next_txn.header_signature)
-                del self._txns_available[next_txn.header_signature]
+                self._remove_available(next_txn.header_signature)
                 self._scheduled_txn_info[next_txn.header_signature] = info
                 return info
             return None
 
-    def _dependency_not_processed(self, deps):
-        if any(not self._all_in_batch_have_results(d)
-               for d in deps
-               if d in self._batches_by_txn_id):
-            return True
-        return False
-
     def _txn_failed_by_dep(self, deps):
         if any(self._any_in_batch_are_invalid(d)
                for d in deps
@@ -1031,12 +1142,6 @@ class ParallelScheduler(Scheduler):
             return True
         return False
 
-    def _all_in_batch_have_results(self, txn_id):
-        batch = self._batches_by_txn_id[txn_id]
-        return all(
-            t.header_signature in self._txn_results
-            for t in list(batch.transactions))
-
     def _any_in_batch_are_invalid(self, txn_id):
         batch = self._batches_by_txn_id[txn_id]
         return any(not self._txn_results[t.header_signature].is_valid
@@ -1091,11 +1196,15 @@ class ParallelScheduler(Scheduler):
                         del self._txn_results[txn_id]
 
                     if txn_id in self._txns_available:
-                        del self._txns_available[txn_id]
+                        self._remove_available(txn_id)
 
                     if txn_id in self._outstanding:
                         self._outstanding.remove(txn_id)
 
+                    # Transactions with an explicit dependency in this batch
+                    # are no longer blocked by it
+                    self._unblock(txn_id)
+
             self._condition.notify_all()
 
         if incomplete_batches:
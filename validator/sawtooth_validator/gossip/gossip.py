@@ -379,18 +379,33 @@ class Gossip:
             exclude: A list of connection_ids that should be excluded from this
                 broadcast.
         """
+        if exclude is None:
+            exclude = []
+
         with self._lock:
-            if exclude is None:
-                exclude = []
-            for connection_id in self._peers.copy():
-                if connection_id not in exclude and \
-                        self._network.is_connection_handshake_complete(
-                            connection_id):
-                    self.send(
-                        message_type,
-                        gossip_message.SerializeToString(),
-                        connection_id,
-                        one_way=True)
+            peers = [connection_id for connection_id in self._peers
+                     if connection_id not in exclude]
+
+        connection_ids = [
+            connection_id for connection_id in peers
+            if self._network.is_connection_handshake_complete(connection_id)]
+        if not connection_ids:
+            return
+
+        # The message is serialized once for all of the peers, and the lock
+        # is not held while it is queued to be sent
+        invalid_connection_ids = self._network.broadcast(
+            message_type,
+            gossip_message.SerializeToString(),
+            connection_ids)
+
+        if invalid_connection_ids:
+            with self._lock:
+                for connection_id in invalid_connection_ids:
+                    LOGGER.debug("Connection %s is no longer valid. "
+                                 "Removing from list of peers.",
+                                 connection_id)
+                    self._peers.pop(connection_id, None)
 
     def connect_success(self, connection_id):
         """
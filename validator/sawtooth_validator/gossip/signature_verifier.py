@@ -13,6 +13,7 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+import functools
 import logging
 import hashlib
 
@@ -35,79 +36,235 @@ from sawtooth_validator.journal.timed_cache import TimedCache
 LOGGER = logging.getLogger(__name__)
 COLLECTOR = metrics.get_collector(__name__)
 
+_CONTEXT = create_context('secp256k1')
+
+# The headers of recently verified transactions, by transaction id, so that
+# a block arriving after its batches does not verify them again
+_VERIFIED_TRANSACTIONS = TimedCache(keep_time=300, purge_frequency=30)
+
+
+class VerifiedBatchRegistry:
+    """Recently verified batches, by batch id. Batches that arrive on their
+    own, whether submitted by a client or gossiped, are recorded here. The
+    gossip signature verifiers drop batches that are already recorded, and
+    blocks skip verifying the batches they contain that are recorded.
+
+    Each entry records a digest of the header and transactions that were
+    verified, so a batch that reuses a verified batch's id with different
+    contents is not considered verified.
+
+    Args:
+        keep_time (float): Time in seconds to keep an entry after it was
+            last accessed.
+        purge_frequency (float): Time in seconds between purges of expired
+            entries.
+    """
+
+    def __init__(self, keep_time=300, purge_frequency=30):
+        # batch id -> digest of the verified batch
+        self._digests = TimedCache(keep_time, purge_frequency)
+
+    def __len__(self):
+        return len(self._digests)
+
+    def is_verified(self, batch):
+        """Returns whether this batch, with these contents, was verified."""
+        digest = self._digests.get(batch.header_signature)
+        return digest is not None and digest == _batch_digest(batch)
+
+    def add(self, batch):
+        """Records that the batch was verified."""
+        self._digests[batch.header_signature] = _batch_digest(batch)
+
+
+def _batch_digest(batch):
+    digest = hashlib.sha256(batch.header)
+    for txn in batch.transactions:
+        digest.update(txn.header_signature.encode())
+        digest.update(txn.header)
+        digest.update(txn.payload)
+    return digest.digest()
+
+
+_VERIFIED_BATCHES = VerifiedBatchRegistry()
+
+DEFAULT_VERIFICATION_CHUNK_SIZE = 64
+
+
+class _VerificationPool:
+    """The executor used to verify the transactions of large blocks and
+    batches, and the number of transactions verified by each of its tasks.
+    """
+
+    def __init__(self):
+        self.executor = None
+        self.chunk_size = DEFAULT_VERIFICATION_CHUNK_SIZE
+
+
+_VERIFICATION_POOL = _VerificationPool()
+
+
+def set_verification_pool(pool, chunk_size=None):
+    """Sets the executor used to verify transaction signatures in parallel.
+
+    A process pool allows transactions to be verified without contention for
+    the GIL. Only groups of more than `chunk_size` transactions are sent to
+    the pool.
+
+    Args:
+        pool (:obj:`concurrent.futures.Executor`): the executor, or None to
+            verify all transactions on the calling thread
+        chunk_size (int): the number of transactions verified by each task,
+            DEFAULT_VERIFICATION_CHUNK_SIZE if None
+    """
+    if chunk_size is None:
+        chunk_size = DEFAULT_VERIFICATION_CHUNK_SIZE
+
+    _VERIFICATION_POOL.executor = pool
+    _VERIFICATION_POOL.chunk_size = chunk_size
+
+
+@functools.lru_cache(maxsize=1024)
+def _public_key(public_key_hex):
+    return Secp256k1PublicKey.from_hex(public_key_hex)
+
+
+def _verify(signature, message, public_key_hex):
+    return _CONTEXT.verify(signature, message, _public_key(public_key_hex))
+
 
 def is_valid_block(block):
     # validate block signature
     header = BlockHeader()
     header.ParseFromString(block.header)
 
-    context = create_context('secp256k1')
-    public_key = Secp256k1PublicKey.from_hex(header.signer_public_key)
-    if not context.verify(block.header_signature,
-                          block.header,
-                          public_key):
+    if not _verify(block.header_signature,
+                   block.header,
+                   header.signer_public_key):
         LOGGER.debug("block failed signature validation: %s",
                      block.header_signature)
         return False
 
     # validate all batches in block. These are not all batches in the
     # batch_ids stored in the block header, only those sent with the block.
-    if not all(map(is_valid_batch, block.batches)):
+    # They are not recorded as verified batches, so that the batches still
+    # pass the gossip signature verifiers if they later arrive on their own.
+    return _are_valid_batches(block.batches, record=False)
+
+
+def is_valid_batch(batch):
+    return _are_valid_batches([batch])
+
+
+def is_verified_batch(batch):
+    """Returns whether the batch, with its current contents, has already
+    passed signature verification.
+    """
+    return _VERIFIED_BATCHES.is_verified(batch)
+
+
+def _are_valid_batches(batches, record=True):
+    # Batches that were already verified, for example on arrival ahead of
+    # the block that contains them, are not verified again
+    batches = [
+        batch for batch in batches if not _VERIFIED_BATCHES.is_verified(batch)
+    ]
+
+    # The transactions of all the batches are verified together, so that
+    # the transactions of a block can be spread across the verification pool
+    txn_args = []
+    for batch in batches:
+        # validate batch signature
+        header = BatchHeader()
+        header.ParseFromString(batch.header)
+
+        if not _verify(batch.header_signature,
+                       batch.header,
+                       header.signer_public_key):
+            LOGGER.debug("batch failed signature validation: %s",
+                         batch.header_signature)
+            return False
+
+        # validate all transactions in batch
+        txn_args.extend(
+            (txn.header_signature,
+             txn.header,
+             txn.payload,
+             header.signer_public_key,
+             not _is_verified(txn))
+            for txn in batch.transactions)
+
+    if not _are_valid_transactions(txn_args):
         return False
 
+    for batch in batches:
+        for txn in batch.transactions:
+            _VERIFIED_TRANSACTIONS[txn.header_signature] = txn.header
+        if record:
+            _VERIFIED_BATCHES.add(batch)
+
     return True
 
 
-def is_valid_batch(batch):
-    # validate batch signature
-    header = BatchHeader()
-    header.ParseFromString(batch.header)
-
-    context = create_context('secp256k1')
-    public_key = Secp256k1PublicKey.from_hex(header.signer_public_key)
-    if not context.verify(batch.header_signature,
-                          batch.header,
-                          public_key):
-        LOGGER.debug("batch failed signature validation: %s",
-                     batch.header_signature)
-        return False
+def _are_valid_transactions(txn_args):
+    executor = _VERIFICATION_POOL.executor
+    chunk_size = _VERIFICATION_POOL.chunk_size
+    if executor is None or len(txn_args) <= chunk_size:
+        return _check_transactions(txn_args)
 
-    # validate all transactions in batch
-    for txn in batch.transactions:
-        if not is_valid_transaction(txn):
-            return False
+    futures = [
+        executor.submit(
+            _check_transactions, txn_args[i:i + chunk_size])
+        for i in range(0, len(txn_args), chunk_size)
+    ]
 
-        txn_header = TransactionHeader()
-        txn_header.ParseFromString(txn.header)
-        if txn_header.batcher_public_key != header.signer_public_key:
-            LOGGER.debug("txn batcher public_key does not match signer"
-                         "public_key for batch: %s txn: %s",
-                         batch.header_signature,
-                         txn.header_signature)
-            return False
+    return all(future.result() for future in futures)
+
+
+def is_valid_transaction(txn):
+    if not _check_transaction(txn.header_signature,
+                              txn.header,
+                              txn.payload,
+                              verify_signature=not _is_verified(txn)):
+        return False
 
+    _VERIFIED_TRANSACTIONS[txn.header_signature] = txn.header
     return True
 
 
-def is_valid_transaction(txn):
+def _is_verified(txn):
+    return _VERIFIED_TRANSACTIONS.get(txn.header_signature) == txn.header
+
+
+def _check_transactions(txn_args):
+    return all(_check_transaction(*args) for args in txn_args)
+
+
+def _check_transaction(header_signature, header_bytes, payload,
+                       batcher_public_key=None, verify_signature=True):
     # validate transactions signature
     header = TransactionHeader()
-    header.ParseFromString(txn.header)
+    header.ParseFromString(header_bytes)
 
-    context = create_context('secp256k1')
-    public_key = Secp256k1PublicKey.from_hex(header.signer_public_key)
-    if not context.verify(txn.header_signature,
-                          txn.header,
-                          public_key):
+    if verify_signature and not _verify(header_signature,
+                                        header_bytes,
+                                        header.signer_public_key):
         LOGGER.debug("transaction signature invalid for txn: %s",
-                     txn.header_signature)
+                     header_signature)
         return False
 
     # verify the payload field matches the header
-    txn_payload_sha512 = hashlib.sha512(txn.payload).hexdigest()
+    txn_payload_sha512 = hashlib.sha512(payload).hexdigest()
     if txn_payload_sha512 != header.payload_sha512:
         LOGGER.debug("payload doesn't match payload_sha512 of the header"
-                     "for txn: %s", txn.header_signature)
+                     "for txn: %s", header_signature)
+        return False
+
+    if batcher_public_key is not None and \
+            header.batcher_public_key != batcher_public_key:
+        LOGGER.debug("txn batcher public_key does not match signer"
+                     "public_key for txn: %s",
+                     header_signature)
         return False
 
     return True
@@ -138,7 +295,7 @@ class GossipMessageSignatureVerifier(Handler):
             return HandlerResult(status=HandlerStatus.PASS)
 
         if tag == GossipMessage.BATCH:
-            if obj.header_signature in self._seen_cache:
+            if is_verified_batch(obj):
                 self._batch_dropped_count.inc()
                 return HandlerResult(status=HandlerStatus.DROP)
 
@@ -147,7 +304,6 @@ class GossipMessageSignatureVerifier(Handler):
                              obj.header_signature)
                 return HandlerResult(status=HandlerStatus.DROP)
 
-            self._seen_cache[obj.header_signature] = None
             return HandlerResult(status=HandlerStatus.PASS)
 
         # should drop the message if it does not have a valid content_type
@@ -177,24 +333,17 @@ class GossipBlockResponseSignatureVerifier(Handler):
 
 
 class GossipBatchResponseSignatureVerifier(Handler):
-    def __init__(self):
-        self._seen_cache = TimedCache()
-        self._batch_dropped_count = COLLECTOR.counter(
-            'already_validated_batch_dropped_count', instance=self)
-
     def handle(self, connection_id, message_content):
         batch, _ = message_content
 
-        if batch.header_signature in self._seen_cache:
-            self._batch_dropped_count.inc()
-            return HandlerResult(status=HandlerStatus.DROP)
-
+        # A requested batch is passed on even if it was already verified, as
+        # the requester is still waiting for it; only its signatures are not
+        # verified again.
         if not is_valid_batch(batch):
             LOGGER.debug("requested batch's signature is invalid: %s",
                          batch.header_signature)
             return HandlerResult(status=HandlerStatus.DROP)
 
-        self._seen_cache[batch.header_signature] = None
         return HandlerResult(status=HandlerStatus.PASS)
 
 
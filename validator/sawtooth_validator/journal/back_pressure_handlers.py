@@ -14,6 +14,9 @@
 # ------------------------------------------------------------------------------
 
 import logging
+import math
+from threading import Lock
+import time
 
 from sawtooth_validator.protobuf.client_batch_submit_pb2 \
     import ClientBatchSubmitResponse
@@ -29,15 +32,197 @@ from sawtooth_validator.networking.dispatch import HandlerStatus
 LOGGER = logging.getLogger(__name__)
 COLLECTOR = metrics.get_collector(__name__)
 
+DEFAULT_MAX_DISPATCHER_QUEUE = 1000
+# The maximum average time, in seconds, tasks may wait in a thread pool
+DEFAULT_MAX_TIME_IN_QUEUE = 1.0
+# The maximum average time, in seconds, to execute a transaction; by default,
+# execution latency is not considered
+DEFAULT_MAX_EXECUTION_LATENCY = None
+# Per connection limits, in batches per second and batches, applied once the
+# load reaches DEFAULT_SOFT_LOAD
+DEFAULT_CONNECTION_RATE = 100.0
+DEFAULT_CONNECTION_BURST = 1000
+DEFAULT_SOFT_LOAD = 0.5
+DEFAULT_RETRY_AFTER = 1
+MAX_RETRY_AFTER = 60
+
+# The number of connection token buckets kept before idle ones are dropped
+_MAX_IDLE_BUCKETS = 1000
+
+
+class AdmissionController:
+    """Decides whether batches submitted by clients should be accepted, based
+    on the load of the validator.
+
+    The load is the largest ratio of a measurement to its limit, among:
+        * the publisher's pending batches to its queue limit
+        * the messages in flight in the dispatcher
+        * the average time tasks wait in the given thread pools
+        * the average time taken to execute a transaction, if a maximum is
+          given
+
+    At a load of 1 or more, all submissions are rejected. At or above the
+    soft load, each connection is also limited by a token bucket, so that a
+    few busy clients are paced before everyone is rejected. Rejections come
+    with the number of seconds a client should wait before retrying.
+
+    Args:
+        queue_info_fn (fn() -> (int, int)): Returns the number of pending
+            batches and the pending batch limit
+        dispatcher (Dispatcher, optional): The dispatcher receiving
+            submissions
+        thread_pools (list of InstrumentedThreadPoolExecutor): The thread
+            pools handling submissions
+        execution_latency_fn (fn() -> float, optional): Returns the average
+            time, in seconds, to execute a transaction
+    """
+
+    def __init__(self,
+                 queue_info_fn,
+                 dispatcher=None,
+                 thread_pools=(),
+                 execution_latency_fn=None,
+                 max_dispatcher_queue=DEFAULT_MAX_DISPATCHER_QUEUE,
+                 max_time_in_queue=DEFAULT_MAX_TIME_IN_QUEUE,
+                 max_execution_latency=DEFAULT_MAX_EXECUTION_LATENCY,
+                 connection_rate=DEFAULT_CONNECTION_RATE,
+                 connection_burst=DEFAULT_CONNECTION_BURST,
+                 soft_load=DEFAULT_SOFT_LOAD,
+                 retry_after=DEFAULT_RETRY_AFTER):
+        self._queue_info = queue_info_fn
+        self._dispatcher = dispatcher
+        self._thread_pools = list(thread_pools)
+        self._execution_latency = execution_latency_fn
+        self._max_dispatcher_queue = max_dispatcher_queue
+        self._max_time_in_queue = max_time_in_queue
+        self._max_execution_latency = max_execution_latency
+        self._connection_rate = connection_rate
+        self._connection_burst = connection_burst
+        self._soft_load = soft_load
+        self._retry_after = retry_after
+
+        self._lock = Lock()
+        # connection id -> _TokenBucket
+        self._buckets = {}
+
+        self._load_gauge = COLLECTOR.gauge('load', instance=self)
+        self._load_gauge.set_value(0)
+
+    def load(self):
+        """Returns the current load, where 1 or more means the validator
+        cannot accept any more batches.
+        """
+        pending, limit = self._queue_info()
+        load = pending / limit if limit > 0 else 0.0
+
+        if self._dispatcher is not None:
+            load = max(
+                load,
+                self._dispatcher.queue_size() / self._max_dispatcher_queue)
+
+        for pool in self._thread_pools:
+            load = max(
+                load, pool.task_time_in_queue / self._max_time_in_queue)
+
+        if self._execution_latency is not None \
+                and self._max_execution_latency is not None:
+            load = max(
+                load,
+                self._execution_latency() / self._max_execution_latency)
+
+        self._load_gauge.set_value(load)
+
+        return load
+
+    def admit(self, connection_id, batch_count=1):
+        """Checks whether a connection may submit the given number of
+        batches.
+
+        Args:
+            connection_id (str): The connection submitting the batches
+            batch_count (int): The number of batches being submitted
+
+        Returns:
+            int: 0 if the batches are accepted, otherwise the number of
+                seconds to wait before submitting them again
+        """
+        load = self.load()
+        if load >= 1:
+            return self._clamp_retry_after(self._retry_after * load)
+
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(connection_id)
+            if bucket is None:
+                if len(self._buckets) >= _MAX_IDLE_BUCKETS:
+                    self._drop_idle_buckets(now)
+                bucket = _TokenBucket(
+                    self._connection_rate, self._connection_burst, now)
+                self._buckets[connection_id] = bucket
+
+            wait = bucket.consume(
+                batch_count, now, enforce=load >= self._soft_load)
+
+        if wait > 0:
+            return self._clamp_retry_after(wait)
+
+        return 0
+
+    def _drop_idle_buckets(self, now):
+        for connection_id, bucket in list(self._buckets.items()):
+            if bucket.is_full(now):
+                del self._buckets[connection_id]
+
+    @staticmethod
+    def _clamp_retry_after(seconds):
+        return min(MAX_RETRY_AFTER, max(1, math.ceil(seconds)))
+
+
+class _TokenBucket:
+    """Allows up to BURST batches at once, refilled at RATE batches per
+    second.
+    """
+
+    def __init__(self, rate, burst, now):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._updated = now
+
+    def _refill(self, now):
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def is_full(self, now):
+        self._refill(now)
+        return self._tokens >= self._burst
+
+    def consume(self, count, now, enforce=True):
+        """Takes COUNT tokens from the bucket. If ENFORCE is set and there
+        are not enough tokens, none are taken and the number of seconds
+        until there will be is returned; otherwise returns 0.
+        """
+        self._refill(now)
+
+        # Submissions larger than the bucket only need a full bucket
+        needed = min(count, self._burst)
+        if self._tokens >= needed or not enforce:
+            self._tokens = max(0, self._tokens - count)
+            return 0
+
+        return (needed - self._tokens) / self._rate
+
 
 class ClientBatchSubmitBackpressureHandler(Handler):
     """This handler receives a batch list, and accepts it if the system is
-    able.  Otherwise it returns a QUEUE_FULL response.
+    able.  Otherwise it returns a QUEUE_FULL response, with the number of
+    seconds the client should wait before retrying.
     """
 
-    def __init__(self, whitelist_public_key, queue_info_fn):
+    def __init__(self, whitelist_public_key, admission_controller):
         self._whitelist_public_key = whitelist_public_key
-        self._queue_info = queue_info_fn
+        self._admission_controller = admission_controller
         self._applying_backpressure = False
 
         self._batches_rejected_count = COLLECTOR.counter(
@@ -56,21 +241,23 @@ class ClientBatchSubmitBackpressureHandler(Handler):
 
             batch_header.Clear()
 
-        pending, limit = self._queue_info()
-        if pending >= limit:
+        retry_after = self._admission_controller.admit(
+            connection_id, len(message_content.batches))
+        if retry_after:
             if not self._applying_backpressure:
                 self._applying_backpressure = True
                 LOGGER.info(
                     'Applying back pressure on client submitted batches: '
-                    'current depth: %s, limit: %s',
-                    pending, limit)
+                    'current load: %.2f, retry after: %ss',
+                    self._admission_controller.load(), retry_after)
 
             self._batches_rejected_count.inc()
             self._batches_rejected_gauge.set_value(
                 self._batches_rejected_gauge.get_value() + 1)
 
             response = ClientBatchSubmitResponse(
-                status=ClientBatchSubmitResponse.QUEUE_FULL)
+                status=ClientBatchSubmitResponse.QUEUE_FULL,
+                retry_after=retry_after)
             return HandlerResult(
                 status=HandlerStatus.RETURN,
                 message_out=response,
@@ -82,7 +269,7 @@ class ClientBatchSubmitBackpressureHandler(Handler):
             self._batches_rejected_gauge.set_value(0)
             LOGGER.info(
                 'Ending back pressure on client submitted batches: '
-                'current depth: %s, limit: %s',
-                pending, limit)
+                'current load: %.2f',
+                self._admission_controller.load())
 
         return HandlerResult(status=HandlerStatus.PASS)
@@ -65,9 +65,18 @@ class BlockStore(MutableMapping):
     @staticmethod
     def create_index_configuration():
         return {
-            'batch': BlockStore._batch_index_keys,
-            'transaction': BlockStore._transaction_index_keys,
+            'batch': {
+                'key_fn': BlockStore._batch_index_keys,
+                'ref_fn': BlockStore._block_num_ref,
+            },
+            'transaction': {
+                'key_fn': BlockStore._transaction_index_keys,
+                'ref_fn': BlockStore._block_num_ref,
+            },
             'block_num': BlockStore._block_num_index_keys,
+            'batch_sequence': BlockStore._batch_sequence_index_keys,
+            'transaction_sequence':
+                BlockStore._transaction_sequence_index_keys,
         }
 
     @staticmethod
@@ -76,7 +85,8 @@ class BlockStore(MutableMapping):
         Deserialize a byte string into a BlockWrapper
 
         Args:
-            value (bytes): the byte string to deserialze
+            value (bytes): the byte string to deserialze; it may also be a
+                memoryview, which is parsed without being copied
 
         Returns:
             BlockWrapper: a block wrapper instance
@@ -223,6 +233,43 @@ class BlockStore(MutableMapping):
         # Format the number to a 64bit hex value, for natural ordering
         return [BlockStore.block_num_to_hex(blkw.block_num).encode()]
 
+    @staticmethod
+    def _block_num_ref(block):
+        blkw = BlockWrapper.wrap(block)
+        return BlockStore.block_num_to_hex(blkw.block_num).encode()
+
+    @staticmethod
+    def _batch_sequence_index_keys(block):
+        blkw = BlockWrapper.wrap(block)
+        return [
+            BlockStore._sequence_key(blkw.block_num, position).encode()
+            for position in range(len(blkw.batches))
+        ]
+
+    @staticmethod
+    def _transaction_sequence_index_keys(block):
+        blkw = BlockWrapper.wrap(block)
+        txn_count = sum(len(batch.transactions) for batch in blkw.batches)
+        return [
+            BlockStore._sequence_key(blkw.block_num, position).encode()
+            for position in range(txn_count)
+        ]
+
+    @staticmethod
+    def _sequence_key(block_num, position):
+        """Creates the sequence index key for the item at the given position
+        within a block.
+
+        The position is inverted, so that a descending scan of the index
+        returns blocks from newest to oldest, with the items of each block in
+        their order within the block.
+        """
+        return "{:016x}{:08x}".format(block_num, 0xffffffff - position)
+
+    @staticmethod
+    def _parse_sequence_key(key):
+        return (int(key[:16], 16), 0xffffffff - int(key[16:], 16))
+
     @staticmethod
     def block_num_to_hex(block_num):
         """Converts a block number to a hex string.
@@ -295,6 +342,41 @@ class BlockStore(MutableMapping):
 
         return block
 
+    def get_block_refs_by_transaction_ids(self, txn_ids):
+        """Returns the ids and numbers of the blocks that contain the given
+        transaction ids, read from the transaction index alone, without
+        deserializing the blocks. Any transaction id that is not in the block
+        store is omitted.
+
+        Args:
+            txn_ids (:iterable:str): an iterable of transaction ids
+
+        Returns:
+            dict: the (block id, block number) tuple, by transaction id
+        """
+        return self._get_block_refs(
+            txn_ids, 'transaction',
+            lambda block: (txn.header_signature
+                           for batch in block.batches
+                           for txn in batch.transactions))
+
+    def get_block_nums_by_transaction_ids(self, txn_ids):
+        """Returns the numbers of the blocks that contain the given
+        transaction ids, using a single read of the block store. Any
+        transaction id that is not in the block store is omitted.
+
+        Args:
+            txn_ids (:iterable:str): an iterable of transaction ids
+
+        Returns:
+            dict: the containing block number, by transaction id
+        """
+        return {
+            txn_id: block_num
+            for txn_id, (_, block_num)
+            in self.get_block_refs_by_transaction_ids(txn_ids).items()
+        }
+
     def has_transaction(self, txn_id):
         """Returns True if the transaction is contained in a block in the
         block store.
@@ -339,6 +421,69 @@ class BlockStore(MutableMapping):
         """
         return self._block_store.get_multi(batch_ids, index='batch')
 
+    def get_block_refs_by_batch_ids(self, batch_ids):
+        """Returns the ids and numbers of the blocks that contain the given
+        batch ids, read from the batch index alone, without deserializing the
+        blocks. Any batch id that is not in the block store is omitted.
+
+        Args:
+            batch_ids (:iterable:str): an iterable of batch ids
+
+        Returns:
+            dict: the (block id, block number) tuple, by batch id
+        """
+        return self._get_block_refs(
+            batch_ids, 'batch',
+            lambda block: (batch.header_signature for batch in block.batches))
+
+    def get_block_nums_by_batch_ids(self, batch_ids):
+        """Returns the numbers of the blocks that contain the given batch ids,
+        using a single read of the block store. Any batch id that is not in
+        the block store is omitted.
+
+        Args:
+            batch_ids (:iterable:str): an iterable of batch ids
+
+        Returns:
+            dict: the containing block number, by batch id
+        """
+        return {
+            batch_id: block_num
+            for batch_id, (_, block_num)
+            in self.get_block_refs_by_batch_ids(batch_ids).items()
+        }
+
+    def _get_block_refs(self, item_ids, index, block_item_ids):
+        item_ids = set(item_ids)
+        if not item_ids:
+            return {}
+
+        block_refs = {}
+        unreferenced_ids = set()
+        for item_id, block_id, block_num in self._block_store.get_index_refs(
+                item_ids, index):
+            if block_num is not None:
+                block_refs[item_id] = (block_id, int(block_num, 16))
+            else:
+                unreferenced_ids.add(item_id)
+
+        # Index entries written before the block number was stored with them
+        # require the containing blocks to be read
+        if unreferenced_ids:
+            blocks = {
+                block.header_signature: block
+                for _, block in self._block_store.get_multi(
+                    unreferenced_ids, index=index)
+            }
+            block_refs.update({
+                item_id: (block.header_signature, block.block_num)
+                for block in blocks.values()
+                for item_id in block_item_ids(block)
+                if item_id in unreferenced_ids
+            })
+
+        return block_refs
+
     def has_batch(self, batch_id):
         """Returns True if the batch is contained in a block in the
         block store.
@@ -413,6 +558,108 @@ class BlockStore(MutableMapping):
             'Batch {} not in block {}: possible index mismatch'.format(
                 batch_id, block.identifier))
 
+    def get_batch_page(self, head_block, start_id=None, limit=None,
+                       reverse=False):
+        """Returns a page of the batches committed in the chain ending at the
+        given head block. By default, batches are listed from the newest
+        block to the oldest, in their order within each block.
+
+        Args:
+            head_block (:obj:`BlockWrapper`): the last block of the chain
+            start_id (str): the id of the first batch in the page; defaults
+                to the first batch of the listing
+            limit (int): the maximum number of batches in the page
+            reverse (bool): list the batches in the opposite order
+
+        Returns:
+            tuple: the list of batches, and the id of the batch that follows
+                the page, or None if there are no more batches
+
+        Raises:
+            ValueError: the start id is not a batch in the chain
+        """
+        return self._get_page(
+            'batch_sequence',
+            lambda block: block.batches,
+            self.get_block_by_batch_id,
+            head_block, start_id, limit, reverse)
+
+    def get_transaction_page(self, head_block, start_id=None, limit=None,
+                             reverse=False):
+        """Returns a page of the transactions committed in the chain ending at
+        the given head block. By default, transactions are listed from the
+        newest block to the oldest, in their order within each block.
+
+        Args:
+            head_block (:obj:`BlockWrapper`): the last block of the chain
+            start_id (str): the id of the first transaction in the page;
+                defaults to the first transaction of the listing
+            limit (int): the maximum number of transactions in the page
+            reverse (bool): list the transactions in the opposite order
+
+        Returns:
+            tuple: the list of transactions, and the id of the transaction
+                that follows the page, or None if there are no more
+                transactions
+
+        Raises:
+            ValueError: the start id is not a transaction in the chain
+        """
+        return self._get_page(
+            'transaction_sequence',
+            lambda block: [
+                txn for batch in block.batches for txn in batch.transactions],
+            self.get_block_by_transaction_id,
+            head_block, start_id, limit, reverse)
+
+    def _get_page(self, index, block_items, get_containing_block,
+                  head_block, start_id, limit, reverse):
+        # The natural listing order is a descending scan of the sequence
+        # index, so a reversed listing is an ascending scan.
+        descending = not reverse
+
+        if start_id:
+            block = get_containing_block(start_id)
+            if block.block_num > head_block.block_num:
+                raise ValueError(
+                    '{} is not in the chain ending at {}'.format(
+                        start_id, head_block.header_signature))
+            item_ids = [item.header_signature for item in block_items(block)]
+            start_key = BlockStore._sequence_key(
+                block.block_num, item_ids.index(start_id))
+        elif descending:
+            start_key = BlockStore._sequence_key(head_block.block_num, 0)
+        else:
+            start_key = None
+
+        entries = self._block_store.scan_index(
+            index,
+            start_key=start_key,
+            reverse=descending,
+            limit=limit + 1 if limit is not None else None)
+
+        positions = []
+        for index_key, block_id in entries:
+            block_num, position = BlockStore._parse_sequence_key(index_key)
+            if block_num > head_block.block_num:
+                break
+            positions.append((block_id, position))
+
+        # Blocks removed by a concurrent chain update are skipped
+        block_items_by_id = {
+            block_id: block_items(block)
+            for block_id, block in self._block_store.get_multi(
+                {block_id for block_id, _ in positions})
+        }
+        items = [block_items_by_id[block_id][position]
+                 for block_id, position in positions
+                 if block_id in block_items_by_id]
+
+        if limit is not None and len(items) > limit:
+            return items[:limit], items[limit].header_signature
+
+        return items, None
+
     def get_transaction(self, transaction_id):
         """Returns a Transaction object from the block store by its id.
 
@@ -25,6 +25,7 @@ from sawtooth_validator.journal.chain_commit_state import ChainCommitState
 from sawtooth_validator.journal.chain_commit_state import DuplicateTransaction
 from sawtooth_validator.journal.chain_commit_state import DuplicateBatch
 from sawtooth_validator.journal.chain_commit_state import MissingDependency
+from sawtooth_validator.journal.chain_commit_state import UncommittedIdCache
 from sawtooth_validator.journal.validation_rule_enforcer import \
     enforce_validation_rules
 from sawtooth_validator.state.settings_view import SettingsViewFactory
@@ -121,6 +122,9 @@ class BlockValidator:
 
         self._block_scheduler = BlockScheduler(block_cache)
 
+        self._uncommitted_id_cache = UncommittedIdCache(
+            block_cache, block_cache.block_store)
+
     def stop(self):
         self._thread_pool.shutdown(wait=True)
 
@@ -164,7 +168,8 @@ class BlockValidator:
                     chain_commit_state = ChainCommitState(
                         blkw.previous_block_id,
                         self._block_cache,
-                        self._block_cache.block_store)
+                        self._block_cache.block_store,
+                        uncommitted_id_cache=self._uncommitted_id_cache)
 
                     chain_commit_state.check_for_duplicate_batches(
                         blkw.block.batches)
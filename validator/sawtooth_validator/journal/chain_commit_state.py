@@ -13,6 +13,9 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+from collections import OrderedDict
+from threading import Lock
+
 from sawtooth_validator.journal.block_wrapper import NULL_BLOCK_IDENTIFIER
 from sawtooth_validator.protobuf.transaction_pb2 import TransactionHeader
 
@@ -44,59 +47,48 @@ class ChainCommitState:
     if that block were to be committed and only checking the batches and
     transactions contained within. ChainCommitState abstracts this process.
     """
-    def __init__(self, head_id, block_cache, block_store):
+    def __init__(self, head_id, block_cache, block_store,
+                 uncommitted_id_cache=None):
         """The constructor should be passed the previous block id of the block
-        being validated."""
-        uncommitted_block_ids = list()
-        uncommitted_batch_ids = set()
-        uncommitted_txn_ids = set()
-
-        # Find the most recent ancestor of this block that is in the block
-        # store. Batches and transactions that are in a block that is in the
-        # block store and that has a greater block number than this block must
-        # be ignored.
-        if head_id != NULL_BLOCK_IDENTIFIER:
-            head = block_cache[head_id]
-            ancestor = head
-            while ancestor.header_signature not in block_store:
-                # For every block not in the block store, we need to track all
-                # its batch ids and transaction ids separately to ensure there
-                # are no duplicates.
-                for batch in ancestor.batches:
-                    uncommitted_batch_ids.add(batch.header_signature)
-
-                    for txn in batch.transactions:
-                        uncommitted_txn_ids.add(txn.header_signature)
-
-                uncommitted_block_ids.append(ancestor.header_signature)
-
-                previous_block_id = ancestor.previous_block_id
-                if previous_block_id == NULL_BLOCK_IDENTIFIER:
-                    break
-
-                ancestor = block_cache[previous_block_id]
+        being validated. If an UncommittedIdCache is passed, the uncommitted
+        ids are taken from it rather than collected from the block cache."""
+        if uncommitted_id_cache is not None:
+            uncommitted = uncommitted_id_cache.get(head_id)
         else:
-            ancestor = None
+            uncommitted = _collect_uncommitted_ids(
+                head_id, block_cache, block_store)
 
         self.block_store = block_store
-        self.common_ancestor = ancestor
-        self.uncommitted_block_ids = uncommitted_block_ids
-        self.uncommitted_batch_ids = uncommitted_batch_ids
-        self.uncommitted_txn_ids = uncommitted_txn_ids
+        self.common_ancestor = uncommitted.common_ancestor
+        self._uncommitted = uncommitted
+
+    @property
+    def uncommitted_block_ids(self):
+        return self._uncommitted.block_ids
+
+    @property
+    def uncommitted_batch_ids(self):
+        return self._uncommitted.batch_ids
+
+    @property
+    def uncommitted_txn_ids(self):
+        return self._uncommitted.txn_ids
 
-    def _block_in_chain(self, block):
+    def _block_num_in_chain(self, block_num):
         if self.common_ancestor is not None:
-            return block.block_num <= self.common_ancestor.block_num
+            return block_num <= self.common_ancestor.block_num
         return False
 
     @staticmethod
     def _check_for_duplicates_within(key_fn, items):
         """Checks that for any two items in `items`, calling `key_fn` on both
         does not return equal values."""
-        for i, item_i in enumerate(items):
-            for item_j in items[i + 1:]:
-                if key_fn(item_i) == key_fn(item_j):
-                    return key_fn(item_i)
+        seen = set()
+        for item in items:
+            key = key_fn(item)
+            if key in seen:
+                return key
+            seen.add(key)
         return None
 
     def check_for_duplicate_transactions(self, transactions):
@@ -109,17 +101,19 @@ class ChainCommitState:
         if duplicate is not None:
             raise DuplicateTransaction(duplicate)
 
-        for txn in transactions:
-            txn_id = txn.header_signature
-            if txn_id in self.uncommitted_txn_ids:
-                raise DuplicateTransaction(txn_id)
+        txn_ids = [txn.header_signature for txn in transactions]
 
-            if self.block_store.has_transaction(txn_id):
-                committed_block =\
-                    self.block_store.get_block_by_transaction_id(txn_id)
+        uncommitted = self._uncommitted.find_txn_ids(txn_ids)
+        if uncommitted:
+            raise DuplicateTransaction(next(
+                txn_id for txn_id in txn_ids if txn_id in uncommitted))
 
-                if self._block_in_chain(committed_block):
-                    raise DuplicateTransaction(txn_id)
+        committed_block_nums = \
+            self.block_store.get_block_nums_by_transaction_ids(txn_ids)
+        for txn_id in txn_ids:
+            block_num = committed_block_nums.get(txn_id)
+            if block_num is not None and self._block_num_in_chain(block_num):
+                raise DuplicateTransaction(txn_id)
 
     def check_for_duplicate_batches(self, batches):
         """Check that none of the batches passed in have already been committed
@@ -131,57 +125,223 @@ class ChainCommitState:
         if duplicate is not None:
             raise DuplicateBatch(duplicate)
 
-        for batch in batches:
-            batch_id = batch.header_signature
-
-            # Make sure the batch isn't in one of the uncommitted block
-            if batch_id in self.uncommitted_batch_ids:
+        batch_ids = [batch.header_signature for batch in batches]
+
+        # Make sure the batch isn't in one of the uncommitted block
+        uncommitted = self._uncommitted.find_batch_ids(batch_ids)
+        if uncommitted:
+            raise DuplicateBatch(next(
+                batch_id for batch_id in batch_ids
+                if batch_id in uncommitted))
+
+        # Check if the batch is in one of the committed blocks. This is only
+        # a duplicate batch if the batch is in a block that would stay
+        # committed if this block were committed. This is equivalent to
+        # asking if the number of the block that this batch is in is less
+        # than or equal to the number of the common ancestor block.
+        committed_block_nums = \
+            self.block_store.get_block_nums_by_batch_ids(batch_ids)
+        for batch_id in batch_ids:
+            block_num = committed_block_nums.get(batch_id)
+            if block_num is not None and self._block_num_in_chain(block_num):
                 raise DuplicateBatch(batch_id)
 
-            # Check if the batch is in one of the committed blocks
-            if self.block_store.has_batch(batch_id):
-                committed_block =\
-                    self.block_store.get_block_by_batch_id(batch_id)
-
-                # This is only a duplicate batch if the batch is in a block
-                # that would stay committed if this block were committed. This
-                # is equivalent to asking if the number of the block that this
-                # batch is in is less than or equal to the number of the common
-                # ancestor block.
-                if self._block_in_chain(committed_block):
-                    raise DuplicateBatch(batch_id)
-
     def check_for_transaction_dependencies(self, transactions):
         """Check that all explicit dependencies in all transactions passed have
         been satisfied."""
         dependencies = []
-        txn_ids = []
+        txn_ids = set()
         for txn in transactions:
-            txn_ids.append(txn.header_signature)
+            txn_ids.add(txn.header_signature)
             txn_hdr = TransactionHeader()
             txn_hdr.ParseFromString(txn.header)
             dependencies.extend(txn_hdr.dependencies)
 
+        # Dependencies within the given block's batches, or in the
+        # uncommitted blocks, are satisfied
+        dependencies = [dep for dep in dependencies if dep not in txn_ids]
+        uncommitted = self._uncommitted.find_txn_ids(dependencies)
+        dependencies = [dep for dep in dependencies if dep not in uncommitted]
+        if not dependencies:
+            return
+
+        # Check for dependencies in the committed blocks, making sure the
+        # block wouldn't be uncommitted if the given block were committed
+        committed_block_nums = \
+            self.block_store.get_block_nums_by_transaction_ids(dependencies)
         for dep in dependencies:
-            # Check for dependency within the given block's batches
-            if dep in txn_ids:
-                continue
+            block_num = committed_block_nums.get(dep)
+            if block_num is None or not self._block_num_in_chain(block_num):
+                raise MissingDependency(dep)
 
-            # Check for dependency in the uncommitted blocks
-            if dep in self.uncommitted_txn_ids:
-                continue
 
-            # Check for dependency in the committe blocks
-            if self.block_store.has_transaction(dep):
-                committed_block =\
-                    self.block_store.get_block_by_transaction_id(dep)
+class _UncommittedIds:
+    """The ids of the blocks, batches and transactions between a block and
+    its most recent ancestor in the block store, inclusive of the block.
 
-                # Make sure the block wouldn't be uncomitted if the given block
-                # were uncommitted
-                if self._block_in_chain(committed_block):
-                    continue
+    Each instance only holds the ids in its own block, and links to the
+    instance of its parent; the ids of the whole fork are found by walking
+    the links, so that extending a fork does not copy the ids of every block
+    before it.
+    """
+    __slots__ = ['common_ancestor', 'parent', 'block_id',
+                 'own_batch_ids', 'own_txn_ids']
+
+    def __init__(self, common_ancestor, parent=None, block_id=None,
+                 own_batch_ids=frozenset(), own_txn_ids=frozenset()):
+        self.common_ancestor = common_ancestor
+        self.parent = parent
+        self.block_id = block_id
+        self.own_batch_ids = own_batch_ids
+        self.own_txn_ids = own_txn_ids
+
+    def extend(self, block):
+        """Returns the uncommitted ids of a child of this block."""
+        batch_ids = set()
+        txn_ids = set()
+        for batch in block.batches:
+            batch_ids.add(batch.header_signature)
+            for txn in batch.transactions:
+                txn_ids.add(txn.header_signature)
+
+        return _UncommittedIds(
+            self.common_ancestor,
+            parent=self,
+            block_id=block.header_signature,
+            own_batch_ids=frozenset(batch_ids),
+            own_txn_ids=frozenset(txn_ids))
+
+    def _walk(self):
+        """Yields the instances of this block and of its uncommitted
+        ancestors, newest first.
+        """
+        uncommitted = self
+        while uncommitted.block_id is not None:
+            yield uncommitted
+            uncommitted = uncommitted.parent
+
+    @property
+    def block_ids(self):
+        return [uncommitted.block_id for uncommitted in self._walk()]
+
+    @property
+    def batch_ids(self):
+        return frozenset().union(
+            *(uncommitted.own_batch_ids for uncommitted in self._walk()))
+
+    @property
+    def txn_ids(self):
+        return frozenset().union(
+            *(uncommitted.own_txn_ids for uncommitted in self._walk()))
+
+    def find_batch_ids(self, batch_ids):
+        """Returns the set of the given batch ids that are uncommitted."""
+        found = set()
+        for uncommitted in self._walk():
+            found.update(uncommitted.own_batch_ids.intersection(batch_ids))
+        return found
+
+    def find_txn_ids(self, txn_ids):
+        """Returns the set of the given transaction ids that are
+        uncommitted.
+        """
+        found = set()
+        for uncommitted in self._walk():
+            found.update(uncommitted.own_txn_ids.intersection(txn_ids))
+        return found
+
+
+def _find_uncommitted_blocks(head_id, block_cache, block_store, known=None):
+    """Walks back from head_id to the most recent ancestor in the block
+    store, or to an ancestor in `known`.
+
+    Returns:
+        tuple: The blocks walked, head first, and either the
+            _UncommittedIds of the ancestor found in `known`, or
+            _UncommittedIds with no ids for the most recent ancestor in the
+            block store.
+    """
+    blocks = []
+    block_id = head_id
+    while block_id != NULL_BLOCK_IDENTIFIER:
+        if known is not None and block_id in known:
+            return blocks, known[block_id]
+
+        block = block_cache[block_id]
+        if block.header_signature in block_store:
+            return blocks, _UncommittedIds(block)
+
+        blocks.append(block)
+        block_id = block.previous_block_id
+
+    # None of the ancestors are in the block store. The oldest of them is
+    # treated as the common ancestor.
+    return blocks, _UncommittedIds(blocks[-1] if blocks else None)
+
+
+def _collect_uncommitted_ids(head_id, block_cache, block_store):
+    blocks, uncommitted = _find_uncommitted_blocks(
+        head_id, block_cache, block_store)
+    for block in reversed(blocks):
+        uncommitted = uncommitted.extend(block)
+    return uncommitted
+
+
+class UncommittedIdCache:
+    """Caches, per block, the ids of the blocks, batches and transactions
+    between the block and its most recent ancestor in the block store, so
+    that validating sibling blocks, or retrying a validation, does not walk
+    the same uncommitted fork again. A block's entry only holds the ids in
+    the block itself, and links to its parent's entry.
+
+    The cached ids depend on which blocks are in the block store, so the
+    cache is cleared whenever the chain head moves.
+
+    Args:
+        block_cache (BlockCache): The blocks that are not in the block store.
+        block_store (BlockStore): The committed blocks.
+        max_entries (int): The maximum number of blocks to cache ids for.
+    """
 
-            raise MissingDependency(dep)
+    def __init__(self, block_cache, block_store, max_entries=256):
+        self._block_cache = block_cache
+        self._block_store = block_store
+        self._max_entries = max_entries
+        self._lock = Lock()
+        self._chain_head_id = None
+        # block id -> _UncommittedIds, least recently used first
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, head_id):
+        """Returns the _UncommittedIds of the block with the given id."""
+        chain_head = self._block_store.chain_head
+        chain_head_id = \
+            chain_head.header_signature if chain_head is not None else None
+
+        with self._lock:
+            if chain_head_id != self._chain_head_id:
+                self._entries.clear()
+                self._chain_head_id = chain_head_id
+
+            blocks, uncommitted = _find_uncommitted_blocks(
+                head_id, self._block_cache, self._block_store,
+                known=self._entries)
+
+            if not blocks and head_id in self._entries:
+                self._entries.move_to_end(head_id)
+
+            for block in reversed(blocks):
+                uncommitted = uncommitted.extend(block)
+                self._entries[block.header_signature] = uncommitted
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+            return uncommitted
 
 
 class _CommitCache:
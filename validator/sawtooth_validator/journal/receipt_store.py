@@ -65,14 +65,45 @@ class TransactionReceiptStore(ChainObserver):
         Raises:
             KeyError: if the transaction id is unknown.
         """
-        if txn_id not in self._receipt_db:
+        txn_receipt_bytes = self._receipt_db.get(txn_id)
+        if txn_receipt_bytes is None:
             raise KeyError('Unknown transaction id {}'.format(txn_id))
 
-        txn_receipt_bytes = self._receipt_db[txn_id]
         txn_receipt = TransactionReceipt()
         txn_receipt.ParseFromString(txn_receipt_bytes)
         return txn_receipt
 
+    def get_receipts(self, txn_ids):
+        """Returns the TransactionReceipts for the given transaction ids,
+        using a single read of the backing database.
+
+        Args:
+            txn_ids (:iterable:str): the ids of the transactions for which
+                the receipts should be retrieved.
+
+        Returns:
+            list of TransactionReceipt: The receipts, in the order of the
+                given transaction ids.
+
+        Raises:
+            KeyError: if any of the transaction ids are unknown.
+        """
+        txn_ids = list(txn_ids)
+        found = dict(self._receipt_db.get_multi(txn_ids))
+
+        receipts = []
+        for txn_id in txn_ids:
+            try:
+                txn_receipt_bytes = found[txn_id]
+            except KeyError:
+                raise KeyError('Unknown transaction id {}'.format(txn_id))
+
+            txn_receipt = TransactionReceipt()
+            txn_receipt.ParseFromString(txn_receipt_bytes)
+            receipts.append(txn_receipt)
+
+        return receipts
+
     def chain_update(self, block, receipts):
         for receipt in receipts:
             self.put(receipt.transaction_id, receipt)
@@ -91,10 +122,8 @@ class ClientReceiptGetRequestHandler(Handler):
 
         try:
             response = ClientReceiptGetResponse(
-                receipts=[
-                    self._txn_receipt_store.get(txn_id)
-                    for txn_id in request.transaction_ids
-                ],
+                receipts=self._txn_receipt_store.get_receipts(
+                    request.transaction_ids),
                 status=ClientReceiptGetResponse.OK)
 
         except KeyError:
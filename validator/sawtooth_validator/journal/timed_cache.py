@@ -13,6 +13,7 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 # pylint: disable=no-name-in-module
+from collections import OrderedDict
 from collections.abc import MutableMapping
 from threading import RLock
 import time
@@ -22,67 +23,80 @@ class TimedCache(MutableMapping):
     """
     A dict like interface that removes entries after sometime of no access.
 
+    Values are kept in a plain dict, alongside an ordered dict of the last
+    access time of each key, kept in order of access. Expired entries are
+    therefore always at the front of the access order, so a purge only
+    visits the entries it removes. Access times are rounded to a small
+    fraction of the keep time, so that entries accessed together share a
+    timestamp rather than each holding its own.
+
     Accesses are Thread safe.
 
     Args:
         keep_time (float): How long in seconds to hold a value for
         purge_frequency (float): How often to look for old values to purge
     """
-    class CachedValue:
-        def __init__(self, value):
-            self.value = value
-            self.timestamp = time.time()  # the time this State was created,
-            # used for house keeping, ie when to flush this from the cache.
-
-        def touch(self):
-            """
-            Mark this entry as accessed.
-            """
-            self.timestamp = time.time()
 
     def __init__(self, keep_time=30, purge_frequency=30):
         super(TimedCache, self).__init__()
         self._lock = RLock()
-        self._cache = {}
+        self._values = {}
+        # key -> time of last access, least recently accessed first
+        self._access_times = OrderedDict()
         self._keep_time = keep_time
         self._purge_frequency = purge_frequency
-        self._next_purge_time = time.time() + purge_frequency
+        self._next_purge_time = time.monotonic() + purge_frequency
+
+        self._resolution = keep_time / 100
+        self._now = time.monotonic()
 
     def __setitem__(self, key, value):
+        now = self._clock()
         with self._lock:
-            if time.time() > self._next_purge_time:
-                self._purge_expired()
-                self._next_purge_time = time.time() + self._purge_frequency
-            self._cache[key] = self.CachedValue(value)
+            if now > self._next_purge_time:
+                self._purge_expired(now)
+                self._next_purge_time = now + self._purge_frequency
+            self._values[key] = value
+            self._touch(key, now)
 
     def __getitem__(self, key):
         with self._lock:
-            value = self._cache[key]
-            value.touch()
-            return value.value
+            value = self._values[key]
+            self._touch(key, self._clock())
+            return value
 
     def __delitem__(self, key):
         with self._lock:
-            del self._cache[key]
+            del self._values[key]
+            del self._access_times[key]
+
+    def __contains__(self, key):
+        with self._lock:
+            if key not in self._values:
+                return False
+            self._touch(key, self._clock())
+            return True
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._values[key]
+            except KeyError:
+                return default
+            self._touch(key, self._clock())
+            return value
 
     def __iter__(self):
         with self._lock:
-            return iter(self._cache)
+            return iter(self._values)
 
     def __len__(self):
         with self._lock:
-            return len(self._cache)
+            return len(self._values)
 
     def __str__(self):
         with self._lock:
-            out = []
-            for v in self._cache.values():
-                out.append(str(v.value))
-            return ','.join(out)
-
-    @property
-    def cache(self):
-        return self._cache
+            return ','.join(str(v) for v in self._values.values())
 
     @property
     def keep_time(self):
@@ -92,13 +106,34 @@ class TimedCache(MutableMapping):
     def purge_frequency(self):
         return self._purge_frequency
 
-    def _purge_expired(self):
+    def _clock(self):
+        """
+        Returns the current time, rounded down to the cache's resolution.
+        """
+        now = time.monotonic()
+        if now - self._now >= self._resolution:
+            self._now = now
+        return self._now
+
+    def _touch(self, key, now):
+        """
+        Mark the entry as accessed at NOW, moving it to the end of the
+        access order.
+        """
+        access_times = self._access_times
+        access_times[key] = now
+        access_times.move_to_end(key)
+
+    def _purge_expired(self, now):
         """
         Remove all expired entries from the cache.
         """
-        time_horizon = time.time() - self._keep_time
-        new_cache = {}
-        for (k, v) in self._cache.items():
-            if v.timestamp > time_horizon:
-                new_cache[k] = v
-        self._cache = new_cache
+        time_horizon = now - self._keep_time
+        access_times = self._access_times
+        values = self._values
+        while access_times:
+            key, timestamp = next(iter(access_times.items()))
+            if timestamp > time_horizon:
+                break
+            del access_times[key]
+            del values[key]
@@ -16,8 +16,8 @@ import abc
 import enum
 import logging
 from threading import Condition
-import queue
 import uuid
+from collections import deque
 from collections import namedtuple
 
 # pylint: disable=import-error,no-name-in-module
@@ -39,6 +39,23 @@ class Priority(enum.IntEnum):
     LOW = 2
 
 
+class ShedPolicy(enum.Enum):
+    """What to do with a message arriving at a full queue."""
+    # Drop the arriving message
+    DROP_NEWEST = 0
+    # Drop the message that has waited longest, and queue the arriving one
+    DROP_OLDEST = 1
+
+
+# While several priorities have messages waiting, the number of messages
+# dequeued from each priority per round
+DEFAULT_PRIORITY_WEIGHTS = {
+    Priority.HIGH: 8,
+    Priority.MEDIUM: 4,
+    Priority.LOW: 1,
+}
+
+
 def _gen_message_id():
     return uuid.uuid4().hex.encode()
 
@@ -53,11 +70,25 @@ _MessageInformation = namedtuple('_MessageInformation', (
 
 
 class Dispatcher(InstrumentedThread):
-    def __init__(self, timeout=10):
+    """Dispatches incoming messages to their handlers.
+
+    Each message type has its own FIFO queue, belonging to the message
+    type's priority. Messages are dequeued in weighted rounds across the
+    priorities that have messages waiting, so that lower priorities are
+    slowed, but not starved, by higher ones, and round-robin across the
+    message types within a priority, so that a burst of one type does not
+    hold up the others.
+
+    Args:
+        timeout (int): Unused
+        priority_weights (dict of Priority: int, optional): The number of
+            messages dequeued from each priority per round
+    """
+
+    def __init__(self, timeout=10, priority_weights=None):
         super().__init__(name='Dispatcher')
         self._timeout = timeout
         self._msg_type_handlers = {}
-        self._in_queue = queue.PriorityQueue()
         self._send_message = {}
         self._send_last_message = {}
         self._message_information = {}
@@ -66,6 +97,22 @@ class Dispatcher(InstrumentedThread):
         self._priority = {}
         self._preprocessors = {}
 
+        self._priority_weights = dict(DEFAULT_PRIORITY_WEIGHTS)
+        if priority_weights is not None:
+            self._priority_weights.update(priority_weights)
+
+        self._queue_condition = Condition()
+        # message type -> _MessageQueue
+        self._queues = {}
+        # message type -> (max depth, shed policy)
+        self._queue_limits = {}
+        # priority -> deque of the non-empty _MessageQueues of that priority
+        self._ready = {priority: deque() for priority in Priority}
+        # priority -> messages left to dequeue from it in the current round
+        self._credits = dict(self._priority_weights)
+        self._queued = 0
+        self._stopped = False
+
     def _get_dispatch_timer(self, tag):
         if tag not in self._dispatch_timers:
             self._dispatch_timers[tag] = COLLECTOR.timer(
@@ -142,7 +189,6 @@ class Dispatcher(InstrumentedThread):
 
     def dispatch(self, connection, message, connection_id):
         if message.message_type in self._msg_type_handlers:
-            priority = self._priority.get(message.message_type, Priority.LOW)
             message_id = _gen_message_id()
 
             self._message_information[message_id] = \
@@ -155,9 +201,11 @@ class Dispatcher(InstrumentedThread):
                     collection=_ManagerCollection(
                         self._msg_type_handlers[message.message_type]))
 
-            self._in_queue.put_nowait((priority, message_id))
+            with self._queue_condition:
+                self._enqueue(message.message_type, message_id)
+                queue_size = self._queued
+                self._queue_condition.notify()
 
-            queue_size = self._in_queue.qsize()
             if queue_size > 10:
                 LOGGER.debug("Dispatch incoming queue size: %s", queue_size)
         else:
@@ -193,6 +241,92 @@ class Dispatcher(InstrumentedThread):
     def set_message_priority(self, message_type, priority):
         self._priority[message_type] = priority
 
+        with self._queue_condition:
+            if message_type in self._queues:
+                self._queues[message_type].priority = priority
+
+    def set_queue_limit(self, message_type, max_depth,
+                        shed_policy=ShedPolicy.DROP_NEWEST):
+        """Bounds the number of messages of MESSAGE_TYPE waiting to be
+        dispatched. Once MAX_DEPTH messages are waiting, arriving messages
+        are shed according to SHED_POLICY.
+        """
+        if max_depth < 1:
+            raise ValueError("max_depth must be at least 1")
+
+        with self._queue_condition:
+            self._queue_limits[message_type] = (max_depth, shed_policy)
+            if message_type in self._queues:
+                self._queues[message_type].set_limit(max_depth, shed_policy)
+
+    def _get_queue(self, message_type):
+        try:
+            return self._queues[message_type]
+        except KeyError:
+            pass
+
+        max_depth, shed_policy = self._queue_limits.get(
+            message_type, (None, ShedPolicy.DROP_NEWEST))
+        message_queue = _MessageQueue(
+            message_type,
+            self._priority.get(message_type, Priority.LOW),
+            max_depth,
+            shed_policy,
+            instance=self)
+        self._queues[message_type] = message_queue
+        return message_queue
+
+    def _enqueue(self, message_type, message_id):
+        message_queue = self._get_queue(message_type)
+        was_empty = not message_queue
+
+        if message_queue.is_full():
+            message_queue.dropped_count.inc()
+            if message_queue.shed_policy == ShedPolicy.DROP_NEWEST:
+                LOGGER.debug(
+                    "Dropping %s message, queue is full",
+                    get_enum_name(message_type))
+                del self._message_information[message_id]
+                return
+
+            LOGGER.debug(
+                "Dropping oldest %s message, queue is full",
+                get_enum_name(message_type))
+            del self._message_information[message_queue.pop()]
+            self._queued -= 1
+
+        message_queue.append(message_id)
+        self._queued += 1
+
+        if was_empty:
+            self._ready[message_queue.priority].append(message_queue)
+
+    def _dequeue(self):
+        """Returns the id of the next message to dispatch, or None if there
+        are no messages waiting.
+        """
+        waiting = [priority for priority in Priority if self._ready[priority]]
+        if not waiting:
+            return None
+
+        if all(self._credits[priority] <= 0 for priority in waiting):
+            self._credits = dict(self._priority_weights)
+
+        priority = next(
+            (p for p in waiting if self._credits[p] > 0), waiting[0])
+        self._credits[priority] -= 1
+
+        ready = self._ready[priority]
+        message_queue = ready.popleft()
+        message_id = message_queue.pop()
+        self._queued -= 1
+
+        if message_queue:
+            # The priority may have been changed while the queue was waiting
+            self._ready[message_queue.priority].append(message_queue)
+
+        return message_id
+
     def _process(self, message_id):
         message_info = self._message_information[message_id]
 
@@ -384,16 +518,30 @@ class Dispatcher(InstrumentedThread):
 
     def run(self):
         while True:
-            try:
-                _, msg_id = self._in_queue.get()
-                if msg_id == -1:
+            with self._queue_condition:
+                msg_id = self._dequeue()
+                while msg_id is None and not self._stopped:
+                    self._queue_condition.wait()
+                    msg_id = self._dequeue()
+
+                if self._stopped:
                     break
+
+            try:
                 self._process(msg_id)
             except Exception:  # pylint: disable=broad-except
                 LOGGER.exception("Unhandled exception while dispatching")
 
+    def queue_size(self):
+        """Returns the number of messages that have been dispatched but have
+        not finished being handled.
+        """
+        return len(self._message_information)
+
     def stop(self):
-        self._in_queue.put_nowait((Priority.HIGH, -1))
+        with self._queue_condition:
+            self._stopped = True
+            self._queue_condition.notify()
 
     def block_until_complete(self):
         """Blocks until no more messages are in flight,
@@ -404,6 +552,47 @@ class Dispatcher(InstrumentedThread):
                 self._condition.wait()
 
 
+class _MessageQueue:
+    """The messages of one type waiting to be dispatched, oldest first."""
+
+    def __init__(self, message_type, priority, max_depth, shed_policy,
+                 instance):
+        self.priority = priority
+        self.max_depth = max_depth
+        self.shed_policy = shed_policy
+        self._message_ids = deque()
+
+        tags = {"message_type": get_enum_name(message_type)}
+        self._depth_gauge = COLLECTOR.gauge(
+            'queue_depth', tags=tags, instance=instance)
+        self._depth_gauge.set_value(0)
+        self._wait_timer = COLLECTOR.timer(
+            'queue_wait_time', tags=tags, instance=instance)
+        self.dropped_count = COLLECTOR.counter(
+            'dropped_count', tags=tags, instance=instance)
+
+    def __len__(self):
+        return len(self._message_ids)
+
+    def set_limit(self, max_depth, shed_policy):
+        self.max_depth = max_depth
+        self.shed_policy = shed_policy
+
+    def is_full(self):
+        return self.max_depth is not None and \
+            len(self._message_ids) >= self.max_depth
+
+    def append(self, message_id):
+        self._message_ids.append((message_id, self._wait_timer.time()))
+        self._depth_gauge.set_value(len(self._message_ids))
+
+    def pop(self):
+        message_id, timer_ctx = self._message_ids.popleft()
+        timer_ctx.stop()
+        self._depth_gauge.set_value(len(self._message_ids))
+        return message_id
+
+
 class _PreprocessorManager:
     def __init__(self, executor, preprocessor):
         self._executor = executor
@@ -23,6 +23,7 @@ from threading import Event
 from threading import Lock
 import time
 import uuid
+from collections import deque
 from collections import namedtuple
 from enum import Enum
 
@@ -87,13 +88,25 @@ def get_enum_name(enum_value):
 
 _STARTUP_COMPLETE_SENTINEL = 1
 
+# The maximum number of messages received from the socket per wakeup, before
+# yielding to the other tasks on the event loop.
+_MAX_RECEIVE_BATCH = 1000
+
+# The maximum number of messages waiting to be written to a single
+# connection. Further messages to that connection are dropped.
+DEFAULT_MAX_PENDING_SENDS = 10000
+
+_PendingSend = namedtuple('_PendingSend',
+                          ['zmq_identity', 'message_bundle', 'is_last'])
+
 
 class _SendReceive:
     def __init__(self, connection, address, futures, connections,
                  zmq_identity=None, dispatcher=None, secured=False,
                  server_public_key=None, server_private_key=None,
                  heartbeat=False, heartbeat_interval=10,
-                 connection_timeout=60, monitor=False):
+                 connection_timeout=60, monitor=False,
+                 max_pending_sends=DEFAULT_MAX_PENDING_SENDS):
         """
         Constructor for _SendReceive.
 
@@ -122,6 +135,9 @@ class _SendReceive:
                 messages on an otherwise quiet connection.
             connection_timeout (int): Number of seconds after which a
                 connection is considered timed out.
+            max_pending_sends (int): The maximum number of messages waiting
+                to be written to a single connection, after which further
+                messages to it are dropped.
         """
         self._connection = connection
         self._dispatcher = dispatcher
@@ -159,7 +175,28 @@ class _SendReceive:
 
         self._queue_size_gauges = {}
         self._received_message_counters = {}
+        # Batches of (zmq_identity, msg_bytes) received together
         self._dispatcher_queue = None
+        # The number of messages in the batches on the dispatcher queue
+        self._dispatcher_queue_size = 0
+
+        # Messages waiting to be written to the socket, in the order they
+        # were sent, and the number waiting per zmq identity. Sends from any
+        # thread are appended here and written by a single writer task on
+        # the event loop, which is only scheduled when none is running.
+        self._max_pending_sends = max_pending_sends
+        self._send_lock = Lock()
+        self._pending_sends = deque()
+        self._pending_send_counts = {}
+        self._writer_scheduled = False
+
+        tags = {'connection': connection}
+        self._pending_sends_gauge = COLLECTOR.gauge(
+            'pending_sends', tags=tags, instance=self)
+        self._dropped_send_count = COLLECTOR.counter(
+            'dropped_send_count', tags=tags, instance=self)
+        self._delayed_send_count = COLLECTOR.counter(
+            'delayed_send_count', tags=tags, instance=self)
 
     @property
     def connection(self):
@@ -293,38 +330,21 @@ class _SendReceive:
     def _dispatch_message(self):
         while True:
             try:
-                zmq_identity, msg_bytes = \
-                    yield from self._dispatcher_queue.get()
+                batch = yield from self._dispatcher_queue.get()
+                self._dispatcher_queue_size -= len(batch)
                 self._get_queue_size_gauge(self.connection).set_value(
-                    self._dispatcher_queue.qsize())
-                message = validator_pb2.Message()
-                message.ParseFromString(msg_bytes)
+                    self._dispatcher_queue_size)
 
-                tag = get_enum_name(message.message_type)
-                self._get_received_message_counter(tag).inc()
+                received_counts = {}
+                for zmq_identity, msg_bytes in batch:
+                    message_type = self._route_message(zmq_identity, msg_bytes)
+                    if message_type is not None:
+                        received_counts[message_type] = \
+                            received_counts.get(message_type, 0) + 1
 
-                if zmq_identity is not None:
-                    connection_id = \
-                        self._identity_to_connection_id(zmq_identity)
-                else:
-                    connection_id = \
-                        self._identity_to_connection_id(
-                            self._connection.encode())
-                try:
-                    self._futures.set_result(
-                        message.correlation_id,
-                        future.FutureResult(
-                            message_type=message.message_type,
-                            content=message.content,
-                            connection_id=connection_id))
-                except future.FutureCollectionKeyError:
-                    self._dispatcher.dispatch(self._connection,
-                                              message,
-                                              connection_id)
-                else:
-                    my_future = self._futures.get(message.correlation_id)
-                    my_future.timer_stop()
-                    self._futures.remove(message.correlation_id)
+                for message_type, count in received_counts.items():
+                    self._get_received_message_counter(
+                        get_enum_name(message_type)).inc(count)
 
             except CancelledError:  # pylint: disable=try-except-raise
                 # The concurrent.futures.CancelledError is caught by asyncio
@@ -335,25 +355,76 @@ class _SendReceive:
                 LOGGER.exception("Received a message on address %s that "
                                  "caused an error: %s", self._address, e)
 
+    def _route_message(self, zmq_identity, msg_bytes):
+        """Resolves the future waiting on the message, or dispatches it if
+        there is none.
+
+        Returns:
+            int: The message type, or None if the message could not be
+                routed.
+        """
+        try:
+            message = validator_pb2.Message()
+            message.ParseFromString(msg_bytes)
+
+            if zmq_identity is not None:
+                connection_id = \
+                    self._identity_to_connection_id(zmq_identity)
+            else:
+                connection_id = \
+                    self._identity_to_connection_id(
+                        self._connection.encode())
+            try:
+                self._futures.set_result(
+                    message.correlation_id,
+                    future.FutureResult(
+                        message_type=message.message_type,
+                        content=message.content,
+                        connection_id=connection_id))
+            except future.FutureCollectionKeyError:
+                self._dispatcher.dispatch(self._connection,
+                                          message,
+                                          connection_id)
+            else:
+                my_future = self._futures.get(message.correlation_id)
+                my_future.timer_stop()
+                self._futures.remove(message.correlation_id)
+
+            return message.message_type
+
+        except Exception as e:  # pylint: disable=broad-except
+            LOGGER.exception("Received a message on address %s that "
+                             "caused an error: %s", self._address, e)
+            return None
+
     @asyncio.coroutine
     def _receive_message(self):
         """
-        Internal coroutine for receiving messages
+        Internal coroutine for receiving messages. Waits for a message, then
+        receives every message already available on the socket, up to
+        _MAX_RECEIVE_BATCH, and queues them for dispatch as a single batch.
         """
+        is_router = self._socket.getsockopt(zmq.TYPE) == zmq.ROUTER
         while True:
             try:
-                if self._socket.getsockopt(zmq.TYPE) == zmq.ROUTER:
-                    zmq_identity, msg_bytes = \
-                        yield from self._socket.recv_multipart()
-                    self._received_from_identity(zmq_identity)
-                    self._dispatcher_queue.put_nowait(
-                        (zmq_identity, msg_bytes))
+                batch = [(yield from self._receive_frame(is_router))]
+                while len(batch) < _MAX_RECEIVE_BATCH:
+                    try:
+                        batch.append((yield from self._receive_frame(
+                            is_router, flags=zmq.NOBLOCK)))
+                    except zmq.Again:
+                        break
+
+                if is_router:
+                    for zmq_identity in {ident for ident, _ in batch}:
+                        self._received_from_identity(zmq_identity)
                 else:
-                    msg_bytes = yield from self._socket.recv()
                     self._last_message_time = time.time()
-                    self._dispatcher_queue.put_nowait((None, msg_bytes))
+
+                self._dispatcher_queue.put_nowait(batch)
+                self._dispatcher_queue_size += len(batch)
                 self._get_queue_size_gauge(self.connection).set_value(
-                    self._dispatcher_queue.qsize())
+                    self._dispatcher_queue_size)
 
             except CancelledError:  # pylint: disable=try-except-raise
                 # The concurrent.futures.CancelledError is caught by asyncio
@@ -364,6 +435,26 @@ class _SendReceive:
                 LOGGER.exception("Received a message on address %s that "
                                  "caused an error: %s", self._address, e)
 
+    @asyncio.coroutine
+    def _receive_frame(self, is_router, flags=0):
+        """Receives a message from the socket.
+
+        Returns:
+            tuple: (zmq_identity, msg_bytes), where zmq_identity is None for
+                a DEALER socket.
+
+        Raises:
+            zmq.Again: If flags includes zmq.NOBLOCK and no message is
+                available.
+        """
+        if is_router:
+            zmq_identity, msg_bytes = \
+                yield from self._socket.recv_multipart(flags=flags)
+            return zmq_identity, msg_bytes
+
+        msg_bytes = yield from self._socket.recv(flags=flags)
+        return None, msg_bytes
+
     @asyncio.coroutine
     def _send_message_frame(self, message_frame):
         yield from self._socket.send_multipart(message_frame)
@@ -372,6 +463,13 @@ class _SendReceive:
         """
         :param msg: protobuf validator_pb2.Message
         """
+        self.send_serialized_message(msg.SerializeToString(), connection_id)
+
+    def send_serialized_message(self, message_bytes, connection_id=None):
+        """
+        :param message_bytes: bytes of a serialized validator_pb2.Message,
+            which may be shared by several sends
+        """
         zmq_identity = None
         if connection_id is not None and self._connections is not None:
             if connection_id in self._connections:
@@ -385,35 +483,108 @@ class _SendReceive:
 
         self._ready.wait()
 
+        self._queue_send(zmq_identity, message_bytes)
+
+    def _queue_send(self, zmq_identity, message_bytes, is_last=False):
+        """Queues a message to be written to the socket by the writer task,
+        scheduling the writer if it is not already running.
+
+        A message that is not the last message to the connection is dropped
+        if max_pending_sends messages are already waiting for it.
+        """
         if zmq_identity is None:
-            message_bundle = [msg.SerializeToString()]
+            message_bundle = [message_bytes]
         else:
-            message_bundle = [bytes(zmq_identity),
-                              msg.SerializeToString()]
+            zmq_identity = bytes(zmq_identity)
+            message_bundle = [zmq_identity, message_bytes]
+
+        with self._send_lock:
+            pending = self._pending_send_counts.get(zmq_identity, 0)
+            if pending >= self._max_pending_sends and not is_last:
+                self._dropped_send_count.inc()
+                LOGGER.debug(
+                    "Dropping message to %s, %s messages are already "
+                    "waiting to be sent",
+                    zmq_identity if zmq_identity else self._address,
+                    pending)
+                return
+
+            self._pending_send_counts[zmq_identity] = pending + 1
+            self._pending_sends.append(
+                _PendingSend(zmq_identity, message_bundle, is_last))
+            self._pending_sends_gauge.set_value(len(self._pending_sends))
+
+            if self._writer_scheduled:
+                return
+            self._writer_scheduled = True
 
         try:
-            asyncio.run_coroutine_threadsafe(
-                self._send_message_frame(message_bundle),
-                self._event_loop)
+            self._event_loop.call_soon_threadsafe(self._start_writer)
         except RuntimeError:
-            # run_coroutine_threadsafe will throw a RuntimeError if
+            # call_soon_threadsafe will throw a RuntimeError if
             # the eventloop is closed. This occurs on shutdown.
             pass
 
+    def _start_writer(self):
+        asyncio.ensure_future(self._write_pending_sends(),
+                              loop=self._event_loop)
+
     @asyncio.coroutine
-    def _send_last_message(self, identity, msg):
-        LOGGER.debug("%s sending last message %s to %s",
-                     self._connection,
-                     get_enum_name(msg.message_type),
-                     identity if identity else self._address)
+    def _write_pending_sends(self):
+        """Writes the queued messages to the socket until there are none
+        left.
 
-        if identity is None:
-            message_bundle = [msg.SerializeToString()]
+        Messages are written without blocking while the socket accepts them.
+        If the socket reaches its send high-water mark, the writer waits for
+        it to accept the message, and the message is counted as delayed.
+        """
+        while True:
+            with self._send_lock:
+                if not self._pending_sends:
+                    self._writer_scheduled = False
+                    self._pending_sends_gauge.set_value(0)
+                    return
+                pending_sends = self._pending_sends
+                self._pending_sends = deque()
+
+            for pending_send in pending_sends:
+                try:
+                    yield from self._write_pending_send(pending_send)
+                except CancelledError:  # pylint: disable=try-except-raise
+                    # The concurrent.futures.CancelledError is caught by
+                    # asyncio when the Task associated with the coroutine is
+                    # cancelled. The raise is required to stop this
+                    # component.
+                    raise
+                except Exception as e:  # pylint: disable=broad-except
+                    LOGGER.exception(
+                        "An error occurred while sending a message to %s: "
+                        "%s", self._address, e)
+                finally:
+                    with self._send_lock:
+                        self._release_pending_send(pending_send.zmq_identity)
+
+    def _release_pending_send(self, zmq_identity):
+        pending = self._pending_send_counts[zmq_identity] - 1
+        if pending:
+            self._pending_send_counts[zmq_identity] = pending
         else:
-            message_bundle = [bytes(identity),
-                              msg.SerializeToString()]
+            del self._pending_send_counts[zmq_identity]
+
+    @asyncio.coroutine
+    def _write_pending_send(self, pending_send):
+        try:
+            yield from self._socket.send_multipart(
+                pending_send.message_bundle, flags=zmq.NOBLOCK)
+        except zmq.Again:
+            self._delayed_send_count.inc()
+            yield from self._socket.send_multipart(
+                pending_send.message_bundle)
+
+        if pending_send.is_last:
+            self._close_after_last_message(pending_send.zmq_identity)
 
-        yield from self._socket.send_multipart(message_bundle)
+    def _close_after_last_message(self, identity):
         if identity is None:
             if self._connection != "ServerThread":
                 self.shutdown()
@@ -443,14 +614,12 @@ class _SendReceive:
 
         self._ready.wait()
 
-        try:
-            asyncio.run_coroutine_threadsafe(
-                self._send_last_message(zmq_identity, msg),
-                self._event_loop)
-        except RuntimeError:
-            # run_coroutine_threadsafe will throw a RuntimeError if
-            # the eventloop is closed. This occurs on shutdown.
-            pass
+        LOGGER.debug("%s sending last message %s to %s",
+                     self._connection,
+                     get_enum_name(msg.message_type),
+                     zmq_identity if zmq_identity else self._address)
+
+        self._queue_send(zmq_identity, msg.SerializeToString(), is_last=True)
 
     def setup(self, socket_type, complete_or_error_queue):
         """Setup the asyncio event loop.
@@ -1006,6 +1175,36 @@ class Interconnect:
                 futures.append(self.send(message_type, data, connection_id))
         return futures
 
+    def broadcast(self, message_type, data, connection_ids):
+        """
+        Send the same one-way message of message_type to each of the given
+        connections. The message is wrapped and serialized once, and the same
+        bytes are queued for every connection.
+        :param message_type: validator_pb2.Message.* enum value
+        :param data: bytes serialized protobuf
+        :param connection_ids: the identities of the connections to send to
+        :return: list of the connection ids that are no longer valid
+        """
+        message_bytes = validator_pb2.Message(
+            correlation_id=_generate_id(),
+            content=data,
+            message_type=message_type).SerializeToString()
+
+        invalid_connection_ids = []
+        for connection_id in connection_ids:
+            connection_info = self._connections.get(connection_id)
+            if connection_info is None:
+                invalid_connection_ids.append(connection_id)
+            elif connection_info.connection_type == \
+                    ConnectionType.ZMQ_IDENTITY:
+                self._send_receive_thread.send_serialized_message(
+                    message_bytes, connection_id=connection_id)
+            else:
+                connection_info.connection.send_serialized_message(
+                    message_bytes)
+
+        return invalid_connection_ids
+
     def send(self, message_type, data, connection_id, callback=None,
              one_way=False):
         """
@@ -1316,6 +1515,15 @@ class OutboundConnection:
         self._send_receive_thread.send_message(message)
         return fut
 
+    def send_serialized_message(self, message_bytes):
+        """Sends a serialized validator_pb2.Message, which expects no
+        response.
+
+        Args:
+            message_bytes (bytes): the serialized message
+        """
+        self._send_receive_thread.send_serialized_message(message_bytes)
+
     def send_last_message(self, message_type, data, callback=None,
                           one_way=False):
         """Sends a message of message_type and then close the connection.
@@ -105,6 +105,10 @@ def main(args):
             endpoint=args['endpoint'],
             maximum_peer_connectivity=args['maximum_peer_connectivity'],
             minimum_peer_connectivity=args['minimum_peer_connectivity'],
+            max_execution_latency=args['max_execution_latency'],
+            batch_submission_rate=args['batch_submission_rate'],
+            batch_submission_burst=args['batch_submission_burst'],
+            gossip_queue_limit=args['gossip_queue_limit'],
             roles=args['roles'],
             opentsdb_db=args['opentsdb_db'],
             opentsdb_url=args['opentsdb_url'],
@@ -267,7 +271,11 @@ def main(args):
         validator_config.state_pruning_block_depth,
         validator_config.network_public_key,
         validator_config.network_private_key,
-        roles=validator_config.roles)
+        roles=validator_config.roles,
+        max_execution_latency=validator_config.max_execution_latency,
+        batch_submission_rate=validator_config.batch_submission_rate,
+        batch_submission_burst=validator_config.batch_submission_burst,
+        gossip_queue_limit=validator_config.gossip_queue_limit)
 
     # pylint: disable=broad-except
     try:
@@ -19,8 +19,14 @@ from sawtooth_validator.execution import tp_state_handlers
 
 from sawtooth_validator.journal.completer import \
     CompleterBatchListBroadcastHandler
+from sawtooth_validator.journal.back_pressure_handlers import \
+    AdmissionController
 from sawtooth_validator.journal.back_pressure_handlers import \
     ClientBatchSubmitBackpressureHandler
+from sawtooth_validator.journal.back_pressure_handlers import \
+    DEFAULT_CONNECTION_BURST
+from sawtooth_validator.journal.back_pressure_handlers import \
+    DEFAULT_CONNECTION_RATE
 
 from sawtooth_validator.gossip import structure_verifier
 
@@ -65,6 +71,9 @@ def add(
         sig_pool,
         block_publisher,
         public_key,
+        max_execution_latency=None,
+        batch_submission_rate=DEFAULT_CONNECTION_RATE,
+        batch_submission_burst=DEFAULT_CONNECTION_BURST,
 ):
 
     # -- Transaction Processor -- #
@@ -123,7 +132,14 @@ def add(
         validator_pb2.Message.CLIENT_BATCH_SUBMIT_REQUEST,
         ClientBatchSubmitBackpressureHandler(
             public_key,
-            block_publisher.pending_batch_info),
+            AdmissionController(
+                block_publisher.pending_batch_info,
+                dispatcher=dispatcher,
+                thread_pools=[client_thread_pool, sig_pool],
+                execution_latency_fn=lambda: executor.execution_latency,
+                max_execution_latency=max_execution_latency,
+                connection_rate=batch_submission_rate,
+                connection_burst=batch_submission_burst)),
         client_thread_pool)
 
     dispatcher.add_handler(
@@ -13,6 +13,7 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+from concurrent.futures import ProcessPoolExecutor
 import hashlib
 import logging
 import os
@@ -55,6 +56,7 @@ from sawtooth_validator.gossip.permission_verifier import IdentityCache
 from sawtooth_validator.gossip.identity_observer import IdentityObserver
 from sawtooth_validator.networking.interconnect import Interconnect
 from sawtooth_validator.gossip.gossip import Gossip
+from sawtooth_validator.gossip import signature_verifier
 
 from sawtooth_validator.server.events.broadcaster import EventBroadcaster
 
@@ -86,7 +88,11 @@ class Validator:
                  state_pruning_block_depth,
                  network_public_key=None,
                  network_private_key=None,
-                 roles=None):
+                 roles=None,
+                 max_execution_latency=None,
+                 batch_submission_rate=None,
+                 batch_submission_burst=None,
+                 gossip_queue_limit=None):
         """Constructs a validator instance.
 
         Args:
@@ -111,6 +117,15 @@ class Validator:
             config_dir (str): path to the config directory
             identity_signer (str): cryptographic signer the validator uses for
                 signing
+            max_execution_latency (float): the average time, in seconds, to
+                execute a transaction above which client batches are
+                rejected; if None, execution latency is not considered
+            batch_submission_rate (float): the batches per second each
+                client may submit while the validator is busy
+            batch_submission_burst (int): the batches each client may
+                submit at once while the validator is busy
+            gossip_queue_limit (int): the maximum number of gossip messages
+                waiting to be handled; if None, the queue is unbounded
         """
         # -- Setup Global State Database and Factory -- #
         global_state_db_filename = os.path.join(
@@ -138,7 +153,8 @@ class Validator:
             BlockStore.serialize_block,
             BlockStore.deserialize_block,
             flag='c',
-            indexes=BlockStore.create_index_configuration())
+            indexes=BlockStore.create_index_configuration(),
+            zero_copy=True)
         block_store = BlockStore(block_db)
         # The cache keep time for the journal's block cache must be greater
         # than the cache keep time used by the completer.
@@ -161,6 +177,11 @@ class Validator:
         sig_pool = InstrumentedThreadPoolExecutor(
             max_workers=3,
             name='Signature')
+        sig_process_pool = ProcessPoolExecutor(max_workers=3)
+        # Start the worker processes now, rather than on the first
+        # submission, while the process is still mostly single threaded
+        sig_process_pool.submit(int).result()
+        signature_verifier.set_verification_pool(sig_process_pool)
 
         # -- Setup Dispatchers -- #
         component_dispatcher = Dispatcher()
@@ -365,7 +386,8 @@ class Validator:
             network_dispatcher, network_service, gossip, completer,
             responder, network_thread_pool, sig_pool,
             chain_controller.has_block, self.has_batch,
-            permission_verifier, block_publisher, consensus_notifier)
+            permission_verifier, block_publisher, consensus_notifier,
+            gossip_queue_limit=gossip_queue_limit)
 
         component_handlers.add(
             component_dispatcher, gossip, context_manager,
@@ -374,7 +396,10 @@ class Validator:
             receipt_store, event_broadcaster, permission_verifier,
             component_thread_pool, client_thread_pool,
             sig_pool, block_publisher,
-            identity_signer.get_public_key().as_hex())
+            identity_signer.get_public_key().as_hex(),
+            max_execution_latency=max_execution_latency,
+            batch_submission_rate=batch_submission_rate,
+            batch_submission_burst=batch_submission_burst)
 
         # -- Store Object References -- #
         self._component_dispatcher = component_dispatcher
@@ -406,6 +431,7 @@ class Validator:
 
         self._client_thread_pool = client_thread_pool
         self._sig_pool = sig_pool
+        self._sig_process_pool = sig_process_pool
 
         self._context_manager = context_manager
         self._transaction_executor = transaction_executor
@@ -459,6 +485,8 @@ class Validator:
         self._component_thread_pool.shutdown(wait=True)
         self._client_thread_pool.shutdown(wait=True)
         self._sig_pool.shutdown(wait=True)
+        signature_verifier.set_verification_pool(None)
+        self._sig_process_pool.shutdown(wait=True)
 
         self._transaction_executor.stop()
         self._context_manager.stop()
@@ -57,6 +57,7 @@ from sawtooth_validator.gossip.gossip_handlers import GetPeersResponseHandler
 from sawtooth_validator.gossip.gossip_handlers import \
     GossipConsensusMessageHandler
 from sawtooth_validator.networking.dispatch import Priority
+from sawtooth_validator.networking.dispatch import ShedPolicy
 from sawtooth_validator.networking.handlers import PingHandler
 from sawtooth_validator.networking.handlers import ConnectHandler
 from sawtooth_validator.networking.handlers import DisconnectHandler
@@ -85,6 +86,7 @@ def add(
         permission_verifier,
         block_publisher,
         consensus_notifier,
+        gossip_queue_limit=None,
 ):
 
     # -- Basic Networking -- #
@@ -199,6 +201,15 @@ def add(
         PeerUnregisterHandler(gossip=gossip),
         thread_pool)
 
+    # GOSSIP_MESSAGE ) Bound the messages waiting to be handled. Gossip is
+    # best effort, and anything missed is requested again by the completer,
+    # so the oldest messages are dropped when the validator falls behind.
+    if gossip_queue_limit is not None:
+        dispatcher.set_queue_limit(
+            validator_pb2.Message.GOSSIP_MESSAGE,
+            gossip_queue_limit,
+            shed_policy=ShedPolicy.DROP_OLDEST)
+
     # GOSSIP_MESSAGE ) Check if this is a block and if we already have it
 
     dispatcher.set_preprocessor(
@@ -68,7 +68,8 @@ def get_databases(bind_network, data_dir):
         BlockStore.serialize_block,
         BlockStore.deserialize_block,
         flag='c',
-        indexes=BlockStore.create_index_configuration())
+        indexes=BlockStore.create_index_configuration(),
+        zero_copy=True)
     blockstore = BlockStore(block_db)
 
     return global_state_db, blockstore
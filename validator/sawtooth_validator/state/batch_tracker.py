@@ -40,7 +40,8 @@ class BatchTracker(ChainObserver,
     relevant Observer class, and implemented here.
 
     Args:
-        batch_committed (fn() -> bool): For querying if a batch is committed
+        batch_committed (fn(str) -> bool): For querying if a batch is
+            committed, when its status is requested
         cache_keep_time (float): Time in seconds to keep values in TimedCaches
         cache_purge_frequency (float): Time between purging the TimedCaches
     """
@@ -50,20 +51,27 @@ class BatchTracker(ChainObserver,
                  cache_keep_time=600,
                  cache_purge_frequency=30):
         self._batch_committed = batch_committed
-        self._batch_info = TimedCache(cache_keep_time, cache_purge_frequency)
+        # txn id -> id of the batch containing it
+        self._batch_ids_by_txn = TimedCache(
+            cache_keep_time, cache_purge_frequency)
         self._invalid = TimedCache(cache_keep_time, cache_purge_frequency)
         self._pending = set()
 
         self._lock = RLock()
+        # observer -> statuses of the batches it is watching
         self._observers = {}
+        # batch id -> set of observers watching it
+        self._observers_by_batch = {}
 
     def chain_update(self, block, receipts):
-        """Removes batches from the pending cache if found in the block store,
-        and notifies any observers.
+        """Removes the batches in the committed block from the pending set,
+        and notifies any observers. Called once for each newly committed
+        block, in chain order.
         """
         with self._lock:
-            for batch_id in self._pending.copy():
-                if self._batch_committed(batch_id):
+            for batch in block.batches:
+                batch_id = batch.header_signature
+                if batch_id in self._pending:
                     self._pending.remove(batch_id)
                     self._update_observers(batch_id,
                                            ClientBatchStatus.COMMITTED)
@@ -86,15 +94,16 @@ class BatchTracker(ChainObserver,
             invalid_txn_info['extended_data'] = extended_data
 
         with self._lock:
-            for batch_id, txn_ids in self._batch_info.items():
-                if txn_id in txn_ids:
-                    if batch_id not in self._invalid:
-                        self._invalid[batch_id] = [invalid_txn_info]
-                    else:
-                        self._invalid[batch_id].append(invalid_txn_info)
-                    self._pending.discard(batch_id)
-                    self._update_observers(batch_id, ClientBatchStatus.INVALID)
-                    return
+            batch_id = self._batch_ids_by_txn.get(txn_id)
+            if batch_id is None:
+                return
+
+            if batch_id not in self._invalid:
+                self._invalid[batch_id] = [invalid_txn_info]
+            else:
+                self._invalid[batch_id].append(invalid_txn_info)
+            self._pending.discard(batch_id)
+            self._update_observers(batch_id, ClientBatchStatus.INVALID)
 
     def notify_batch_pending(self, batch):
         """Adds a Batch id to the pending cache, with its transaction ids.
@@ -102,10 +111,11 @@ class BatchTracker(ChainObserver,
         Args:
             batch (str): The id of the pending batch
         """
-        txn_ids = {t.header_signature for t in batch.transactions}
         with self._lock:
             self._pending.add(batch.header_signature)
-            self._batch_info[batch.header_signature] = txn_ids
+            for txn in batch.transactions:
+                self._batch_ids_by_txn[txn.header_signature] = \
+                    batch.header_signature
             self._update_observers(batch.header_signature,
                                    ClientBatchStatus.PENDING)
 
@@ -166,23 +176,42 @@ class BatchTracker(ChainObserver,
             batch_ids (list of str): The ids of the batches to watch
         """
         with self._lock:
+            if observer in self._observers:
+                self._remove_observer(observer)
+
             statuses = self.get_statuses(batch_ids)
             if self._has_no_pendings(statuses):
                 observer.notify_batches_finished(statuses)
             else:
                 self._observers[observer] = statuses
+                for batch_id in statuses:
+                    self._observers_by_batch.setdefault(
+                        batch_id, set()).add(observer)
 
     def _update_observers(self, batch_id, status):
         """Updates each observer tracking a particular batch with its new
         status. If all statuses are no longer pending, notifies the observer
         and removes it from the list.
         """
-        for observer, statuses in self._observers.copy().items():
-            if batch_id in statuses:
-                statuses[batch_id] = status
-                if self._has_no_pendings(statuses):
-                    observer.notify_batches_finished(statuses)
-                    self._observers.pop(observer)
+        if status == ClientBatchStatus.PENDING:
+            observers = self._observers_by_batch.get(batch_id, ())
+        else:
+            observers = self._observers_by_batch.pop(batch_id, ())
+
+        for observer in list(observers):
+            statuses = self._observers[observer]
+            statuses[batch_id] = status
+            if self._has_no_pendings(statuses):
+                observer.notify_batches_finished(statuses)
+                self._remove_observer(observer)
+
+    def _remove_observer(self, observer):
+        for batch_id in self._observers.pop(observer):
+            observers = self._observers_by_batch.get(batch_id)
+            if observers is not None:
+                observers.discard(observer)
+                if not observers:
+                    del self._observers_by_batch[batch_id]
 
     def _has_no_pendings(self, statuses):
         """Returns True if a statuses dict has no PENDING statuses.
@@ -43,7 +43,6 @@ from sawtooth_validator.protobuf import client_batch_submit_pb2
 from sawtooth_validator.protobuf import client_list_control_pb2
 from sawtooth_validator.protobuf import client_peers_pb2
 from sawtooth_validator.protobuf import client_status_pb2
-from sawtooth_validator.protobuf.block_pb2 import BlockHeader
 from sawtooth_validator.protobuf import validator_pb2
 from sawtooth_validator.protobuf.client_batch_submit_pb2 \
     import ClientBatchSubmitResponse
@@ -231,69 +230,96 @@ class _ClientRequestHandler(Handler, metaclass=abc.ABCMeta):
 
         return root
 
-    def _list_store_resources(self, request, head_id, filter_ids,
-                              resource_fetcher, block_xform):
-        """Builds a list of blocks or resources derived from blocks,
-        handling multiple possible filter requests:
-            - filtered by a set of ids
-            - filtered by head block
-            - filtered by both id and head block
-            - not filtered (all current resources)
+    def _list_store_resources(self, request, head_block, filter_ids,
+                              block_fetcher, block_xform):
+        """Builds a list of resources derived from blocks, filtered by a set
+        of ids, and optionally by head block.
 
         Note:
             This method will fail if `_block_store` has not been set
 
         Args:
             request (object): The parsed protobuf request object
-            head_id (str): Either request.head_id, or the current chain head
-            filter_ids (list of str): the resource ids (if any) to filter by
-            resource_fetcher (function): Fetches a resource by its id
+            head_block (BlockWrapper): Either the requested head block, or
+                the current chain head
+            filter_ids (list of str): the resource ids to filter by
+            block_fetcher (function): Fetches the block containing a resource
                 Expected args:
-                    resource_id: The id of the resource to be fetched
+                    resource_id: The id of the resource
                 Expected return:
-                    object: The resource to be appended to the results
+                    BlockWrapper: The block containing the resource
             block_xform (function): Transforms a block into a list of resources
                 Expected args:
                     block: A block object from the block store
                 Expected return:
-                    list: To be concatenated to the end of the results
+                    list: The resources in the block
 
         Returns:
-            list: List of blocks or data from blocks. If filtered by ids,
-                they will be listed in the same order as the id filters,
-                otherwise they will be ordered from newest to oldest
+            list: List of resources, in the same order as the id filters
         """
         resources = []
 
-        # Simply fetch by id if filtered by id but not by head block
-        if filter_ids and not request.head_id:
-            for resource_id in filter_ids:
-                try:
-                    resources.append(resource_fetcher(resource_id))
-                except (KeyError, ValueError, TypeError):
-                    # Invalid ids should be omitted, not raise an exception
-                    pass
+        for resource_id in filter_ids:
+            try:
+                block = block_fetcher(resource_id)
+            except (KeyError, ValueError, TypeError):
+                # Invalid ids should be omitted, not raise an exception
+                continue
 
-        # Traverse block chain to build results for most scenarios
-        else:
-            current_id = head_id
-            while current_id in self._block_store:
-                block = self._block_store[current_id].block
-                resources += block_xform(block)
-                header = BlockHeader()
-                header.ParseFromString(block.header)
-                current_id = header.previous_block_id
-
-        # If filtering by head AND ids, the traverse results must be winnowed
-        if request.head_id and filter_ids:
-            matches = {
-                r.header_signature: r
-                for r in resources if r.header_signature in filter_ids
-            }
-            resources = [matches[i] for i in filter_ids if i in matches]
+            # The block store only holds the current chain, so a resource is
+            # in the head block's chain if its block is no later than the head
+            if request.head_id and block.block_num > head_block.block_num:
+                continue
+
+            resources.extend(
+                resource for resource in block_xform(block)
+                if resource.header_signature == resource_id)
 
         return resources
 
+    def _page_store_resources(self, request, head_block, reverse,
+                              page_fetcher):
+        """Fetches a single page of resources committed in the chain ending
+        at the head block, based on the request's ClientPagingControls.
+
+        Note:
+            This method will fail if `_block_store` has not been set
+
+        Args:
+            request (object): The parsed protobuf request object
+            head_block (BlockWrapper): Either the requested head block, or
+                the current chain head
+            reverse (bool): Whether to list the resources in reverse order
+            page_fetcher (function): Fetches a page of resources from the
+                block store, such as BlockStore.get_batch_page
+
+        Returns:
+            list: The page of resources
+            object: The ClientPagingResponse to be sent back to the client
+
+        Raises:
+            ResponseFailed: The paging start is not a resource in the chain
+        """
+        paging = request.paging
+        limit = min(paging.limit, MAX_PAGE_SIZE) or DEFAULT_PAGE_SIZE
+
+        try:
+            resources, next_id = page_fetcher(
+                head_block,
+                start_id=paging.start or None,
+                limit=limit,
+                reverse=reverse)
+        except (KeyError, ValueError):
+            raise _ResponseFailed(self._status.INVALID_PAGING)
+
+        if not resources:
+            return (resources, client_list_control_pb2.ClientPagingResponse())
+
+        return resources, client_list_control_pb2.ClientPagingResponse(
+            next=next_id or '',
+            start=resources[0].header_signature,
+            limit=limit)
+
     def _validate_ids(self, resource_ids):
         """Validates a list of ids, raising a ResponseFailed error if invalid.
 
@@ -690,22 +716,37 @@ class StateListRequest(_ClientRequestHandler):
             self._validate_state_root(request.state_root)
         state_root = self._set_root(request)
 
-        # Fetch entries and encode as protobuf
         self._validate_namespace(request.address)
-        entries = [
-            client_state_pb2.ClientStateListResponse.Entry(address=a, data=v)
-            for a, v in self._tree.leaves(request.address or '')]
-
-        # Order entries, remove if tree.entries refactored to be ordered
-        entries.sort(key=lambda l: l.address)
+        reverse = self.is_reverse(request.sorting, self._status.INVALID_SORT)
+        prefix = request.address or ''
 
-        if self.is_reverse(request.sorting, self._status.INVALID_SORT):
-            entries.reverse()
+        paging = request.paging
+        limit = min(paging.limit, MAX_PAGE_SIZE) or DEFAULT_PAGE_SIZE
+        if paging.start and \
+                self._namespace_regex.fullmatch(paging.start) is None:
+            raise _ResponseFailed(self._status.INVALID_PAGING)
+
+        # The tree returns leaves in address order, starting at the paging
+        # start, so only the requested page (plus the next id) is read.
+        leaves = list(itertools.islice(
+            self._tree.leaves(prefix, start=paging.start, reverse=reverse),
+            limit + 1))
+
+        if not leaves:
+            if paging.start and next(iter(self._tree.leaves(prefix)), None):
+                raise _ResponseFailed(self._status.INVALID_PAGING)
+            paging = client_list_control_pb2.ClientPagingResponse()
+        elif paging.start and leaves[0][0] != paging.start:
+            raise _ResponseFailed(self._status.INVALID_PAGING)
+        else:
+            paging = client_list_control_pb2.ClientPagingResponse(
+                next=leaves[limit][0] if len(leaves) > limit else '',
+                start=leaves[0][0],
+                limit=limit)
 
-        entries, paging = _Pager.paginate_resources(
-            request,
-            entries,
-            self._status.INVALID_PAGING)
+        entries = [
+            client_state_pb2.ClientStateListResponse.Entry(address=a, data=v)
+            for a, v in leaves[:limit]]
 
         if not entries:
             return self._wrap_response(
@@ -945,23 +986,33 @@ class BatchListRequest(_ClientRequestHandler):
             block_store=block_store)
 
     def _respond(self, request):
-        head_id = self._get_head_block(request).header_signature
+        head_block = self._get_head_block(request)
+        head_id = head_block.header_signature
         self._validate_ids(request.batch_ids)
 
-        batches = self._list_store_resources(
-            request,
-            head_id,
-            request.batch_ids,
-            self._block_store.get_batch,
-            lambda block: [a for a in block.batches])
+        reverse = self.is_reverse(request.sorting, self._status.INVALID_SORT)
+
+        if request.batch_ids:
+            batches = self._list_store_resources(
+                request,
+                head_block,
+                request.batch_ids,
+                self._block_store.get_block_by_batch_id,
+                lambda block: block.batches)
 
-        if self.is_reverse(request.sorting, self._status.INVALID_SORT):
-            batches.reverse()
+            if reverse:
+                batches.reverse()
 
-        batches, paging = _Pager.paginate_resources(
-            request,
-            batches,
-            self._status.INVALID_PAGING)
+            batches, paging = _Pager.paginate_resources(
+                request,
+                batches,
+                self._status.INVALID_PAGING)
+        else:
+            batches, paging = self._page_store_resources(
+                request,
+                head_block,
+                reverse,
+                self._block_store.get_batch_page)
 
         if not batches:
             return self._wrap_response(
@@ -1014,23 +1065,34 @@ class TransactionListRequest(_ClientRequestHandler):
             block_store=block_store)
 
     def _respond(self, request):
-        head_id = self._get_head_block(request).header_signature
+        head_block = self._get_head_block(request)
+        head_id = head_block.header_signature
         self._validate_ids(request.transaction_ids)
 
-        transactions = self._list_store_resources(
-            request,
-            head_id,
-            request.transaction_ids,
-            self._block_store.get_transaction,
-            lambda block: [t for a in block.batches for t in a.transactions])
+        reverse = self.is_reverse(request.sorting, self._status.INVALID_SORT)
 
-        if self.is_reverse(request.sorting, self._status.INVALID_SORT):
-            transactions.reverse()
+        if request.transaction_ids:
+            transactions = self._list_store_resources(
+                request,
+                head_block,
+                request.transaction_ids,
+                self._block_store.get_block_by_transaction_id,
+                lambda block: [
+                    t for a in block.batches for t in a.transactions])
 
-        transactions, paging = _Pager.paginate_resources(
-            request,
-            transactions,
-            self._status.INVALID_PAGING)
+            if reverse:
+                transactions.reverse()
+
+            transactions, paging = _Pager.paginate_resources(
+                request,
+                transactions,
+                self._status.INVALID_PAGING)
+        else:
+            transactions, paging = self._page_store_resources(
+                request,
+                head_block,
+                reverse,
+                self._block_store.get_transaction_page)
 
         if not transactions:
             return self._wrap_response(
@@ -0,0 +1,208 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+from collections import OrderedDict
+import copy
+import sys
+from threading import Lock
+
+from sawtooth_validator import metrics
+
+
+COLLECTOR = metrics.get_collector(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_ROOTS = 1024
+DEFAULT_MAX_LINEAGE_DEPTH = 16
+
+# Approximate bookkeeping cost of a single cache entry: the key tuple, the
+# OrderedDict link and the entry tuple itself.
+_ENTRY_OVERHEAD = 200
+
+# Values of these types are shared with callers; any others are copied, so
+# that a caller modifying a value cannot change the cached one.
+_IMMUTABLE_TYPES = (bytes, str, int, float, bool, type(None))
+
+
+class LeafCache:
+    """A process-wide, size-bounded LRU cache of decoded merkle leaf values,
+    keyed by (state_root, address).
+
+    State roots are content hashes, so an entry is valid for any database that
+    contains that root. In addition, the cache records the lineage of roots
+    produced by updates: a root's parent and the set of addresses changed
+    between them. A lookup that misses on a root will follow that lineage, as
+    long as the address was not changed along the way, so a leaf that is
+    unchanged between blocks is only cached once.
+
+    Values that are not immutable, such as decoded dicts and lists, are
+    copied when they are put and when they are returned, so the cached value
+    is never shared with a caller.
+
+    Accesses are thread safe.
+
+    Args:
+        max_bytes (int): The approximate maximum size of the cached values.
+        max_roots (int): The maximum number of root lineage records to keep.
+        max_lineage_depth (int): The maximum number of ancestors to search
+            on a lookup.
+    """
+    __instance = None
+
+    @classmethod
+    def set_instance(cls, max_bytes=DEFAULT_MAX_BYTES, **kwargs):
+        cls.__instance = cls(max_bytes, **kwargs)
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.set_instance()
+        return cls.__instance
+
+    def __init__(self,
+                 max_bytes=DEFAULT_MAX_BYTES,
+                 max_roots=DEFAULT_MAX_ROOTS,
+                 max_lineage_depth=DEFAULT_MAX_LINEAGE_DEPTH):
+        self._lock = Lock()
+        self._max_bytes = max_bytes
+        self._max_roots = max_roots
+        self._max_lineage_depth = max_lineage_depth
+
+        # (state_root, address) -> (value, size)
+        self._entries = OrderedDict()
+        self._size = 0
+
+        # state_root -> (parent_state_root, frozenset of changed addresses)
+        self._lineage = OrderedDict()
+
+        self._hit_count = COLLECTOR.counter('hit_count', instance=self)
+        self._miss_count = COLLECTOR.counter('miss_count', instance=self)
+        self._eviction_count = COLLECTOR.counter(
+            'eviction_count', instance=self)
+        self._size_gauge = COLLECTOR.gauge('size_bytes', instance=self)
+        self._size_gauge.set_value(0)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def size(self):
+        """The approximate size, in bytes, of the cached entries."""
+        return self._size
+
+    def get(self, state_root, address):
+        """Returns the cached value at the address under the given root.
+
+        Args:
+            state_root (str): The state root hash.
+            address (str): The address.
+
+        Returns:
+            (tuple): (True, value) if the value is cached, (False, None)
+                otherwise. The value may be modified by the caller.
+        """
+        with self._lock:
+            entry = None
+            root = state_root
+            for _ in range(self._max_lineage_depth):
+                key = (root, address)
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    break
+
+                parent = self._lineage.get(root)
+                if parent is None or address in parent[1]:
+                    break
+                root = parent[0]
+
+        if entry is None:
+            self._miss_count.inc()
+            return False, None
+
+        self._hit_count.inc()
+        return True, _copy(entry[0])
+
+    def put(self, state_root, address, value):
+        """Caches the value at the address under the given root.
+
+        Args:
+            state_root (str): The state root hash.
+            address (str): The address.
+            value: The decoded leaf value, which the caller may go on to
+                modify.
+        """
+        value = _copy(value)
+        size = _sizeof(value) + len(address) + len(state_root) \
+            + _ENTRY_OVERHEAD
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            key = (state_root, address)
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+
+            self._entries[key] = (value, size)
+            self._size += size
+
+            while self._size > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._eviction_count.inc()
+
+            self._size_gauge.set_value(self._size)
+
+    def add_lineage(self, state_root, parent_state_root, changed_addresses):
+        """Records that the given state root was produced from its parent by
+        changing (setting or deleting) the given addresses.
+
+        Args:
+            state_root (str): The new state root hash.
+            parent_state_root (str): The state root hash it was derived from.
+            changed_addresses (iterable of str): The addresses that were set
+                or deleted.
+        """
+        if state_root == parent_state_root:
+            return
+
+        with self._lock:
+            self._lineage[state_root] = (
+                parent_state_root, frozenset(changed_addresses))
+            self._lineage.move_to_end(state_root)
+
+            while len(self._lineage) > self._max_roots:
+                self._lineage.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._lineage.clear()
+            self._size = 0
+            self._size_gauge.set_value(0)
+
+
+def _copy(value):
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    return copy.deepcopy(value)
+
+
+def _sizeof(value):
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return sys.getsizeof(value)
@@ -15,10 +15,12 @@
 
 import ctypes
 from enum import IntEnum
+import itertools
 
 import cbor
 
 from sawtooth_validator import ffi
+from sawtooth_validator.state.leaf_cache import LeafCache
 
 
 # This is included for legacy reasons.
@@ -46,6 +48,8 @@ class MerkleDatabase(ffi.OwnedPointer):
             _libexec('merkle_db_new', database.pointer,
                      ctypes.byref(self.pointer))
 
+        self._merkle_root = self._get_native_merkle_root()
+
     @staticmethod
     def create_index_configuration():
         return ['change_log', 'duplicate_log']
@@ -80,6 +84,9 @@ class MerkleDatabase(ffi.OwnedPointer):
         return c_result.value
 
     def get_merkle_root(self):
+        return self._merkle_root
+
+    def _get_native_merkle_root(self):
         (c_merkle_root, c_merkle_root_len) = ffi.prepare_byte_result()
         _libexec('merkle_db_get_merkle_root', self.pointer,
                  ctypes.byref(c_merkle_root), ctypes.byref(c_merkle_root_len))
@@ -90,18 +97,75 @@ class MerkleDatabase(ffi.OwnedPointer):
     def set_merkle_root(self, merkle_root):
         c_root = ctypes.c_char_p(merkle_root.encode())
         _libexec('merkle_db_set_merkle_root', self.pointer, c_root)
+        self._merkle_root = merkle_root
 
     def __getitem__(self, address):
         return self.get(address)
 
     def get(self, address):
+        leaf_cache = LeafCache.get_instance()
+        merkle_root = self.get_merkle_root()
+        (found, value) = leaf_cache.get(merkle_root, address)
+        if found:
+            return value
+
         c_address = ctypes.c_char_p(address.encode())
         (c_data, c_data_len) = ffi.prepare_byte_result()
 
         _libexec('merkle_db_get', self.pointer, c_address,
                  ctypes.byref(c_data), ctypes.byref(c_data_len))
 
-        return _decode(ffi.from_c_bytes(c_data, c_data_len))
+        value = _decode(ffi.from_c_bytes(c_data, c_data_len))
+        leaf_cache.put(merkle_root, address, value)
+
+        return value
+
+    def get_multi(self, addresses):
+        """Returns the values at the given addresses, resolved against the
+        current merkle root with a single native call.
+
+        Args:
+            addresses (list of str): The addresses to look up.
+
+        Returns:
+            (list of tuple): (address, value) pairs, in the order of the
+                given addresses. The value is None for any address that is
+                not in the tree.
+        """
+        if not addresses:
+            return []
+
+        leaf_cache = LeafCache.get_instance()
+        merkle_root = self.get_merkle_root()
+
+        values = {}
+        misses = []
+        for address in addresses:
+            (found, value) = leaf_cache.get(merkle_root, address)
+            if found:
+                values[address] = value
+            else:
+                misses.append(address)
+
+        if misses:
+            c_addresses = (ctypes.c_char_p * len(misses))()
+            for (i, address) in enumerate(misses):
+                c_addresses[i] = ctypes.c_char_p(address.encode())
+
+            (c_data, c_data_len) = ffi.prepare_byte_result()
+            _libexec('merkle_db_get_multi', self.pointer,
+                     c_addresses, ctypes.c_size_t(len(misses)),
+                     ctypes.byref(c_data), ctypes.byref(c_data_len))
+
+            # The values are returned as a single CBOR array, so the whole
+            # result is decoded at once.
+            for address, value in zip(
+                    misses, _decode(ffi.from_c_bytes(c_data, c_data_len))):
+                values[address] = value
+                if value is not None:
+                    leaf_cache.put(merkle_root, address, value)
+
+        return [(address, values[address]) for address in addresses]
 
     def __setitem__(self, address, value):
         return self.set(address, value)
@@ -117,8 +181,12 @@ class MerkleDatabase(ffi.OwnedPointer):
                  ctypes.byref(c_merkle_root),
                  ctypes.byref(c_merkle_root_len))
 
-        return ffi.from_c_bytes(
+        merkle_root = ffi.from_c_bytes(
             c_merkle_root, c_merkle_root_len).decode()
+        LeafCache.get_instance().add_lineage(
+            merkle_root, self.get_merkle_root(), [address])
+
+        return merkle_root
 
     def delete(self, address):
         c_address = ctypes.c_char_p(address.encode())
@@ -127,8 +195,12 @@ class MerkleDatabase(ffi.OwnedPointer):
                  ctypes.byref(c_merkle_root),
                  ctypes.byref(c_merkle_root_len))
 
-        return ffi.from_c_bytes(
+        merkle_root = ffi.from_c_bytes(
             c_merkle_root, c_merkle_root_len).decode()
+        LeafCache.get_instance().add_lineage(
+            merkle_root, self.get_merkle_root(), [address])
+
+        return merkle_root
 
     def update(self, set_items, delete_items=None, virtual=True):
         """
@@ -141,9 +213,11 @@ class MerkleDatabase(ffi.OwnedPointer):
         Returns:
             the state root after the operations
         """
-        c_set_items = (ctypes.POINTER(_Entry) * len(set_items))()
-        for (i, (key, value)) in enumerate(set_items.items()):
-            c_set_items[i] = ctypes.pointer(_Entry.new(key, _encode(value)))
+        encoded_items = [
+            (key, value, _encode(value)) for key, value in set_items.items()]
+        c_set_items = (ctypes.POINTER(_Entry) * len(encoded_items))()
+        for (i, (key, _, data)) in enumerate(encoded_items):
+            c_set_items[i] = ctypes.pointer(_Entry.new(key, data))
 
         if delete_items is None:
             delete_items = []
@@ -160,9 +234,25 @@ class MerkleDatabase(ffi.OwnedPointer):
                  ctypes.byref(c_merkle_root),
                  ctypes.byref(c_merkle_root_len))
 
-        return ffi.from_c_bytes(
+        merkle_root = ffi.from_c_bytes(
             c_merkle_root, c_merkle_root_len).decode()
 
+        if not virtual:
+            leaf_cache = LeafCache.get_instance()
+            leaf_cache.add_lineage(
+                merkle_root,
+                self.get_merkle_root(),
+                itertools.chain(set_items.keys(), delete_items))
+            for (address, value, data) in encoded_items:
+                # The cache is shared with other readers, so it holds the
+                # value a get would decode, rather than the caller's object,
+                # which may be mutable
+                if not isinstance(value, bytes):
+                    value = _decode(data)
+                leaf_cache.put(merkle_root, address, value)
+
+        return merkle_root
+
     def addresses(self):
         addresses = []
         for address, _ in self:
@@ -170,11 +260,19 @@ class MerkleDatabase(ffi.OwnedPointer):
 
         return addresses
 
-    def leaves(self, prefix=None):
-        """Returns an iterator which returns tuples of (address, data) values
+    def leaves(self, prefix=None, start=None, reverse=False):
+        """Returns an iterator which returns tuples of (address, data) values,
+        ordered by address.
+
+        Args:
+            prefix (str): Only return leaves under this address prefix.
+            start (str): Begin at the first leaf at or after this address
+                (at or before it, if reversed). Subtrees before the start are
+                not read.
+            reverse (bool): Return the leaves in descending address order.
         """
         try:
-            return _LeafIterator(self.pointer, prefix)
+            return _LeafIterator(self.pointer, prefix, start, reverse)
         except KeyError:
             # The prefix doesn't exist
             return iter([])
@@ -210,7 +308,7 @@ def _libexec(name, *args):
 
 
 class _LeafIterator:
-    def __init__(self, merkle_db_ptr, prefix=None):
+    def __init__(self, merkle_db_ptr, prefix=None, start=None, reverse=False):
         if prefix is None:
             prefix = ''
 
@@ -218,8 +316,14 @@ class _LeafIterator:
 
         self._c_iter_ptr = ctypes.c_void_p()
 
-        _libexec('merkle_db_leaf_iterator_new',
-                 merkle_db_ptr, c_prefix, ctypes.byref(self._c_iter_ptr))
+        if start or reverse:
+            c_start = ctypes.c_char_p((start or '').encode())
+            _libexec('merkle_db_leaf_iterator_new_from',
+                     merkle_db_ptr, c_prefix, c_start, ctypes.c_bool(reverse),
+                     ctypes.byref(self._c_iter_ptr))
+        else:
+            _libexec('merkle_db_leaf_iterator_new',
+                     merkle_db_ptr, c_prefix, ctypes.byref(self._c_iter_ptr))
 
     def __del__(self):
         if self._c_iter_ptr:
@@ -38,6 +38,34 @@ pub fn wrap_in_pydict(py: Python, matches: &ArgMatches) -> PyResult<PyDict> {
             .value_of("maximum_peer_connectivity")
             .and_then(|s| s.parse::<u32>().ok()),
     )?;
+    pydict.set_item(
+        py,
+        "max_execution_latency",
+        matches
+            .value_of("max_execution_latency")
+            .and_then(|s| s.parse::<f64>().ok()),
+    )?;
+    pydict.set_item(
+        py,
+        "batch_submission_rate",
+        matches
+            .value_of("batch_submission_rate")
+            .and_then(|s| s.parse::<f64>().ok()),
+    )?;
+    pydict.set_item(
+        py,
+        "batch_submission_burst",
+        matches
+            .value_of("batch_submission_burst")
+            .and_then(|s| s.parse::<u32>().ok()),
+    )?;
+    pydict.set_item(
+        py,
+        "gossip_queue_limit",
+        matches
+            .value_of("gossip_queue_limit")
+            .and_then(|s| s.parse::<u32>().ok()),
+    )?;
     pydict.set_item(
         py,
         "minimum_peer_connectivity",
@@ -200,6 +228,46 @@ pub fn parse_args<'a>() -> ArgMatches<'a> {
                     "set the block depth below which state roots are \
                      pruned from the global state database.",
                 ),
+        )
+        .arg(
+            Arg::with_name("max_execution_latency")
+                .long("max-execution-latency")
+                .takes_value(true)
+                .validator(is_positive_number)
+                .help(
+                    "set the average time, in seconds, to execute a \
+                     transaction above which client batches are rejected",
+                ),
+        )
+        .arg(
+            Arg::with_name("batch_submission_rate")
+                .long("batch-submission-rate")
+                .takes_value(true)
+                .validator(is_positive_number)
+                .help(
+                    "set the number of batches per second each client \
+                     may submit while the validator is busy",
+                ),
+        )
+        .arg(
+            Arg::with_name("batch_submission_burst")
+                .long("batch-submission-burst")
+                .takes_value(true)
+                .validator(is_positive_integer)
+                .help(
+                    "set the number of batches each client may submit at \
+                     once while the validator is busy",
+                ),
+        )
+        .arg(
+            Arg::with_name("gossip_queue_limit")
+                .long("gossip-queue-limit")
+                .takes_value(true)
+                .validator(is_positive_integer)
+                .help(
+                    "set the maximum number of gossip messages waiting to be \
+                     handled, beyond which the oldest are dropped",
+                ),
         );
 
     app.get_matches()
@@ -212,6 +280,13 @@ fn is_positive_integer(arg_value: String) -> Result<(), String> {
     }
 }
 
+fn is_positive_number(arg_value: String) -> Result<(), String> {
+    match arg_value.parse::<f64>() {
+        Ok(f) if f > 0.0 && f.is_finite() => Ok(()),
+        _ => Err("The value must be a positive number, greater than 0".into()),
+    }
+}
+
 fn parse_roles<'a>(matches: &'a ArgMatches, py: Python) -> Option<PyDict> {
     match matches.value_of("network_auth") {
         Some(network_auth) => {
@@ -384,6 +384,69 @@ impl MerkleDatabase {
         Ok(())
     }
 
+    /// Returns the data for each of the given addresses, in the order given,
+    /// resolved against the current merkle root.
+    ///
+    /// All of the lookups share a single read transaction, and nodes that lie
+    /// on the path of more than one address are only read and decoded once.
+    /// Addresses that are not in the tree, or that have no data, are returned
+    /// as None.  As with a single get, a node missing from the database only
+    /// fails the lookup of the addresses beneath it, which are also returned
+    /// as None.
+    pub fn get_multi(&self, addresses: &[&str]) -> Result<Vec<Option<Vec<u8>>>, StateDatabaseError> {
+        let reader = self.db.reader()?;
+
+        let mut nodes: HashMap<String, Node> = HashMap::new();
+        nodes.insert(String::new(), self.root_node.clone());
+
+        let mut values = Vec::with_capacity(addresses.len());
+        'addresses: for address in addresses {
+            let tokens = tokenize_address(address);
+            let mut path = String::with_capacity(address.len());
+
+            for token in tokens.iter() {
+                let child_hash = match nodes[&path].children.get(*token) {
+                    Some(child_hash) => child_hash.clone(),
+                    None => {
+                        values.push(None);
+                        continue 'addresses;
+                    }
+                };
+
+                path.push_str(token);
+                if !nodes.contains_key(&path) {
+                    match read_node_by_hash(&reader, &child_hash) {
+                        Ok(node) => {
+                            nodes.insert(path.clone(), node);
+                        }
+                        Err(StateDatabaseError::NotFound(_)) => {
+                            values.push(None);
+                            continue 'addresses;
+                        }
+                        Err(err) => return Err(err),
+                    }
+                }
+            }
+
+            values.push(nodes[&path].value.clone());
+        }
+
+        Ok(values)
+    }
+
+    /// Returns an iterator over the leaves under the given prefix, starting
+    /// at the first leaf at or after the given start address.  If `reverse`
+    /// is set, the leaves are returned in descending address order, starting
+    /// at the last leaf at or before the start address.
+    pub fn leaves_from(
+        &self,
+        prefix: Option<&str>,
+        start: Option<&str>,
+        reverse: bool,
+    ) -> Result<MerkleLeafIterator, StateDatabaseError> {
+        MerkleLeafIterator::new_from(self.clone(), prefix, start, reverse)
+    }
+
     fn get_by_address(&self, address: &str) -> Result<Node, StateDatabaseError> {
         let tokens = tokenize_address(address);
 
@@ -474,20 +537,80 @@ impl StateReader for MerkleDatabase {
 
 /// A MerkleLeafIterator is fixed to iterate over the state address/value pairs
 /// the merkle root hash at the time of its creation.
+///
+/// Leaves are returned in address order, or in reverse address order. The
+/// iterator may be positioned at a start address, in which case subtrees that
+/// lie entirely before the start (or after it, when reversed) are never read.
 pub struct MerkleLeafIterator {
     merkle_db: MerkleDatabase,
-    visited: VecDeque<(String, Node)>,
+    visited: VecDeque<(String, PendingNode)>,
+    start: Option<String>,
+    reverse: bool,
+}
+
+/// A node waiting to be visited by a MerkleLeafIterator.  Child nodes are only
+/// read from the database when they are visited.
+enum PendingNode {
+    Loaded(Node),
+    Unloaded(String),
 }
 
 impl MerkleLeafIterator {
     fn new(merkle_db: MerkleDatabase, prefix: Option<&str>) -> Result<Self, StateDatabaseError> {
+        MerkleLeafIterator::new_from(merkle_db, prefix, None, false)
+    }
+
+    fn new_from(
+        merkle_db: MerkleDatabase,
+        prefix: Option<&str>,
+        start: Option<&str>,
+        reverse: bool,
+    ) -> Result<Self, StateDatabaseError> {
         let path = prefix.unwrap_or("");
 
         let mut visited = VecDeque::new();
         let initial_node = merkle_db.get_by_address(path)?;
-        visited.push_front((path.to_string(), initial_node));
+        visited.push_front((path.to_string(), PendingNode::Loaded(initial_node)));
 
-        Ok(MerkleLeafIterator { merkle_db, visited })
+        Ok(MerkleLeafIterator {
+            merkle_db,
+            visited,
+            start: start.map(String::from),
+            reverse,
+        })
+    }
+
+    /// Returns true if the subtree at the given path may contain addresses at
+    /// or beyond the start address, in the direction of iteration.
+    fn may_contain_leaves_from(&self, path: &str) -> bool {
+        match self.start {
+            Some(ref start) => {
+                let len = ::std::cmp::min(path.len(), start.len());
+                let path_prefix = &path.as_bytes()[..len];
+                let start_prefix = &start.as_bytes()[..len];
+                if self.reverse {
+                    path_prefix <= start_prefix
+                } else {
+                    path_prefix >= start_prefix
+                }
+            }
+            None => true,
+        }
+    }
+
+    /// Returns true if the leaf at the given address is at or beyond the start
+    /// address, in the direction of iteration.
+    fn is_at_or_after_start(&self, address: &str) -> bool {
+        match self.start {
+            Some(ref start) => {
+                if self.reverse {
+                    address <= start.as_str()
+                } else {
+                    address >= start.as_str()
+                }
+            }
+            None => true,
+        }
     }
 }
 
@@ -495,29 +618,45 @@ impl Iterator for MerkleLeafIterator {
     type Item = Result<(String, Vec<u8>), StateDatabaseError>;
 
     fn next(&mut self) -> Option<Self::Item> {
-        if self.visited.is_empty() {
-            return None;
-        }
-
         loop {
-            if let Some((path, node)) = self.visited.pop_front() {
-                if node.value.is_some() {
-                    return Some(Ok((path, node.value.unwrap())));
-                }
+            let (path, pending_node) = match self.visited.pop_front() {
+                Some(entry) => entry,
+                None => return None,
+            };
 
-                // Reverse the list, such that we have an in-order traversal of the
-                // children, based on the natural path order.
-                for (child_path, hash_key) in node.children.iter().rev() {
-                    let child = match get_node_by_hash(&self.merkle_db.db, hash_key) {
+            let node = match pending_node {
+                PendingNode::Loaded(node) => node,
+                PendingNode::Unloaded(hash_key) => {
+                    match get_node_by_hash(&self.merkle_db.db, &hash_key) {
                         Ok(node) => node,
                         Err(err) => return Some(Err(err)),
-                    };
-                    let mut child_address = path.clone();
-                    child_address.push_str(child_path);
-                    self.visited.push_front((child_address, child));
+                    }
                 }
+            };
+
+            if let Some(value) = node.value {
+                if self.is_at_or_after_start(&path) {
+                    return Some(Ok((path, value)));
+                }
+                continue;
+            }
+
+            // Children are pushed to the front of the queue, so push them in
+            // the opposite of the iteration order, such that we have an
+            // in-order traversal of the children, based on the natural path
+            // order.
+            let children: Vec<(String, String)> = if self.reverse {
+                node.children.into_iter().collect()
             } else {
-                return None;
+                node.children.into_iter().rev().collect()
+            };
+            for (child_path, hash_key) in children {
+                let mut child_address = path.clone();
+                child_address.push_str(&child_path);
+                if self.may_contain_leaves_from(&child_address) {
+                    self.visited
+                        .push_front((child_address, PendingNode::Unloaded(hash_key)));
+                }
             }
         }
     }
@@ -675,7 +814,16 @@ fn tokenize_address(address: &str) -> Box<[&str]> {
 
 /// Fetch a node by its hash
 fn get_node_by_hash(db: &LmdbDatabase, hash: &str) -> Result<Node, StateDatabaseError> {
-    match db.reader()?.get(hash.as_bytes()) {
+    let reader = db.reader()?;
+    read_node_by_hash(&reader, hash)
+}
+
+/// Fetch a node by its hash, using an existing reader
+fn read_node_by_hash<R>(db_reader: &R, hash: &str) -> Result<Node, StateDatabaseError>
+where
+    R: DatabaseReader,
+{
+    match db_reader.get(hash.as_bytes()) {
         Some(bytes) => Node::from_bytes(&bytes),
         None => Err(StateDatabaseError::NotFound(hash.to_string())),
     }
@@ -1429,6 +1577,122 @@ mod tests {
         })
     }
 
+    #[test]
+    fn merkle_trie_get_multi() {
+        run_test(|merkle_path| {
+            let mut merkle_db = make_db(merkle_path);
+
+            let mut updates: HashMap<String, Vec<u8>> = HashMap::with_capacity(3);
+            updates.insert("ab0000".to_string(), "0001".as_bytes().to_vec());
+            updates.insert("ab0a01".to_string(), "0002".as_bytes().to_vec());
+            updates.insert("cdff00".to_string(), "0003".as_bytes().to_vec());
+
+            let new_root = merkle_db.update(&updates, &[], false).unwrap();
+            merkle_db.set_merkle_root(new_root).unwrap();
+
+            let values = merkle_db
+                .get_multi(&["cdff00", "ab0000", "ab0a02", "ef0000", "ab0a01"])
+                .unwrap();
+
+            assert_eq!(
+                vec![
+                    Some("0003".as_bytes().to_vec()),
+                    Some("0001".as_bytes().to_vec()),
+                    None,
+                    None,
+                    Some("0002".as_bytes().to_vec()),
+                ],
+                values
+            );
+
+            assert!(merkle_db.get_multi(&[]).unwrap().is_empty());
+        })
+    }
+
+    #[test]
+    fn merkle_trie_get_multi_missing_node() {
+        run_test(|merkle_path| {
+            let mut merkle_db = make_db(merkle_path);
+
+            let mut updates: HashMap<String, Vec<u8>> = HashMap::with_capacity(3);
+            updates.insert("ab0000".to_string(), "0001".as_bytes().to_vec());
+            updates.insert("ab0a01".to_string(), "0002".as_bytes().to_vec());
+            updates.insert("cdff00".to_string(), "0003".as_bytes().to_vec());
+
+            let new_root = merkle_db.update(&updates, &[], false).unwrap();
+            merkle_db.set_merkle_root(new_root).unwrap();
+
+            // Remove the node under "ab" from the database
+            let missing_hash = merkle_db.root_node.children["ab"].clone();
+            let mut db_writer = merkle_db.db.writer().unwrap();
+            db_writer.delete(missing_hash.as_bytes()).unwrap();
+            db_writer.commit().unwrap();
+
+            match merkle_db.get("ab0000") {
+                Err(StateDatabaseError::NotFound(_)) => (),
+                res => panic!("Expected NotFound, got {:?}", res),
+            }
+
+            let values = merkle_db
+                .get_multi(&["ab0000", "cdff00", "ab0a01"])
+                .unwrap();
+
+            assert_eq!(vec![None, Some("0003".as_bytes().to_vec()), None], values);
+        })
+    }
+
+    #[test]
+    fn leaf_iteration_from_start() {
+        run_test(|merkle_path| {
+            let mut merkle_db = make_db(merkle_path);
+
+            let addresses = vec!["ab0000", "aba001", "abff02", "cd0000"];
+            let mut updates: HashMap<String, Vec<u8>> = HashMap::new();
+            for (i, key) in addresses.iter().enumerate() {
+                updates.insert(key.to_string(), format!("{:04x}", i).into_bytes());
+            }
+            let new_root = merkle_db.update(&updates, &[], false).unwrap();
+            merkle_db.set_merkle_root(new_root).unwrap();
+
+            let collect_addresses = |iter: MerkleLeafIterator| -> Vec<String> {
+                iter.map(|entry| entry.unwrap().0).collect()
+            };
+
+            assert_eq!(
+                vec!["aba001", "abff02", "cd0000"],
+                collect_addresses(merkle_db.leaves_from(None, Some("aba001"), false).unwrap())
+            );
+
+            // a start that is not a leaf begins at the next leaf
+            assert_eq!(
+                vec!["abff02"],
+                collect_addresses(
+                    merkle_db
+                        .leaves_from(Some("ab"), Some("abb000"), false)
+                        .unwrap()
+                )
+            );
+
+            assert_eq!(
+                vec!["cd0000", "abff02", "aba001", "ab0000"],
+                collect_addresses(merkle_db.leaves_from(None, None, true).unwrap())
+            );
+
+            assert_eq!(
+                vec!["aba001", "ab0000"],
+                collect_addresses(merkle_db.leaves_from(None, Some("abb000"), true).unwrap())
+            );
+
+            assert!(
+                merkle_db
+                    .leaves_from(Some("ab"), Some("ac0000"), false)
+                    .unwrap()
+                    .next()
+                    .is_none()
+            );
+        })
+    }
+
     fn run_test<T>(test: T) -> ()
     where
         T: FnOnce(&str) -> () + panic::UnwindSafe,
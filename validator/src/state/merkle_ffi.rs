@@ -242,6 +242,114 @@ pub unsafe extern "C" fn merkle_db_get(
     }
 }
 
+#[no_mangle]
+/// Looks up the data at each of the given addresses.
+///
+/// The results are returned in a single buffer containing a CBOR array, in
+/// the same order as the addresses provided.  Each element is the stored
+/// value itself (which is already CBOR encoded), or CBOR null if the address
+/// is not in the tree.
+pub unsafe extern "C" fn merkle_db_get_multi(
+    merkle_db: *mut c_void,
+    addresses: *const *const c_char,
+    addresses_len: usize,
+    bytes: *mut *const u8,
+    bytes_len: *mut usize,
+) -> ErrorCode {
+    if merkle_db.is_null() {
+        return ErrorCode::NullPointerProvided;
+    }
+
+    if addresses_len > 0 && addresses.is_null() {
+        return ErrorCode::NullPointerProvided;
+    }
+
+    let addresses: Result<Vec<&str>, ErrorCode> = if addresses_len > 0 {
+        slice::from_raw_parts(addresses, addresses_len)
+            .iter()
+            .map(|c_str| {
+                if c_str.is_null() {
+                    return Err(ErrorCode::NullPointerProvided);
+                }
+                CStr::from_ptr(*c_str)
+                    .to_str()
+                    .map_err(|_| ErrorCode::InvalidAddress)
+            })
+            .collect()
+    } else {
+        Ok(Vec::with_capacity(0))
+    };
+
+    let addresses = match addresses {
+        Ok(addresses) => addresses,
+        Err(err) => return err,
+    };
+
+    match (*(merkle_db as *mut MerkleDatabase)).get_multi(&addresses) {
+        Ok(values) => {
+            let data = encode_raw_cbor_array(values).into_boxed_slice();
+            *bytes_len = data.len();
+            *bytes = data.as_ptr();
+
+            // It will be up to the callee to cleanup this memory
+            mem::forget(data);
+
+            ErrorCode::Success
+        }
+        Err(StateDatabaseError::DatabaseError(err)) => {
+            error!("A Database Error occurred: {}", err);
+            ErrorCode::DatabaseError
+        }
+        Err(StateDatabaseError::NotFound(_)) => ErrorCode::NotFound,
+        Err(err) => {
+            error!("Unknown Error!: {:?}", err);
+            ErrorCode::Unknown
+        }
+    }
+}
+
+/// Writes a CBOR array header followed by each of the given values, which are
+/// expected to be complete CBOR data items.  Missing values are written as
+/// CBOR null.
+fn encode_raw_cbor_array(values: Vec<Option<Vec<u8>>>) -> Vec<u8> {
+    const CBOR_ARRAY: u8 = 0x80;
+    const CBOR_NULL: u8 = 0xf6;
+
+    let values_len = values.len();
+    let mut buffer = Vec::with_capacity(
+        9 + values
+            .iter()
+            .map(|value| value.as_ref().map_or(1, |v| v.len()))
+            .sum::<usize>(),
+    );
+
+    let (additional_info, length_bytes) = if values_len < 24 {
+        (values_len as u8, 0)
+    } else if values_len <= 0xff {
+        (24, 1)
+    } else if values_len <= 0xffff {
+        (25, 2)
+    } else if values_len <= 0xffff_ffff {
+        (26, 4)
+    } else {
+        (27, 8)
+    };
+
+    buffer.push(CBOR_ARRAY | additional_info);
+    for i in (0..length_bytes).rev() {
+        buffer.push(((values_len as u64) >> (8 * i)) as u8);
+    }
+
+    for value in values {
+        match value {
+            Some(data) => buffer.extend_from_slice(&data),
+            None => buffer.push(CBOR_NULL),
+        }
+    }
+
+    buffer
+}
+
 #[no_mangle]
 pub unsafe extern "C" fn merkle_db_set(
     merkle_db: *mut c_void,
@@ -514,6 +622,57 @@ pub unsafe extern "C" fn merkle_db_leaf_iterator_new(
     }
 }
 
+#[no_mangle]
+/// Creates a leaf iterator positioned at the given start address.  An empty
+/// start address begins at the first leaf (or the last leaf, if reversed).
+pub unsafe extern "C" fn merkle_db_leaf_iterator_new_from(
+    merkle_db: *mut c_void,
+    prefix: *const c_char,
+    start: *const c_char,
+    reverse: bool,
+    iterator: *mut *const c_void,
+) -> ErrorCode {
+    if merkle_db.is_null() {
+        return ErrorCode::NullPointerProvided;
+    }
+
+    if prefix.is_null() {
+        return ErrorCode::NullPointerProvided;
+    }
+
+    if start.is_null() {
+        return ErrorCode::NullPointerProvided;
+    }
+
+    let prefix = match CStr::from_ptr(prefix).to_str() {
+        Ok(s) => s,
+        Err(_) => return ErrorCode::InvalidAddress,
+    };
+
+    let start = match CStr::from_ptr(start).to_str() {
+        Ok("") => None,
+        Ok(s) => Some(s),
+        Err(_) => return ErrorCode::InvalidAddress,
+    };
+
+    match (*(merkle_db as *mut MerkleDatabase)).leaves_from(Some(prefix), start, reverse) {
+        Ok(leaf_iterator) => {
+            *iterator = Box::into_raw(Box::new(leaf_iterator)) as *const c_void;
+
+            ErrorCode::Success
+        }
+        Err(StateDatabaseError::DatabaseError(err)) => {
+            error!("A Database Error occurred: {}", err);
+            ErrorCode::DatabaseError
+        }
+        Err(StateDatabaseError::NotFound(_)) => ErrorCode::NotFound,
+        Err(err) => {
+            error!("Unknown Error!: {:?}", err);
+            ErrorCode::Unknown
+        }
+    }
+}
+
 #[no_mangle]
 pub unsafe extern "C" fn merkle_db_leaf_iterator_drop(iterator: *mut c_void) -> ErrorCode {
     if iterator.is_null() {
@@ -0,0 +1,133 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import time
+import unittest
+
+from sawtooth_validator.concurrent.atomic import MovingAverage
+from sawtooth_validator.journal.back_pressure_handlers import \
+    AdmissionController
+
+
+class TestAdmissionController(unittest.TestCase):
+    def test_load(self):
+        """Test that the load is the largest ratio of a measurement to its
+        limit, and that submissions are rejected with a retry hint once it
+        reaches 1.
+        """
+        queue_info = [(10, 100)]
+        dispatcher = MockDispatcher(100)
+        thread_pool = MockThreadPool(0.1)
+        latency = [0.5]
+
+        controller = AdmissionController(
+            lambda: queue_info[0],
+            dispatcher=dispatcher,
+            thread_pools=[thread_pool],
+            execution_latency_fn=lambda: latency[0],
+            max_dispatcher_queue=1000,
+            max_time_in_queue=1.0,
+            max_execution_latency=5.0)
+
+        self.assertAlmostEqual(0.1, controller.load())
+        self.assertEqual(0, controller.admit('conn'))
+
+        dispatcher.size = 500
+        self.assertAlmostEqual(0.5, controller.load())
+
+        thread_pool.task_time_in_queue = 0.8
+        self.assertAlmostEqual(0.8, controller.load())
+
+        latency[0] = 15.0
+        self.assertAlmostEqual(3.0, controller.load())
+        self.assertEqual(3, controller.admit('conn'))
+
+        latency[0] = 0.5
+        queue_info[0] = (100, 100)
+        self.assertEqual(1, controller.admit('conn'))
+
+        queue_info[0] = (10, 100)
+        self.assertEqual(0, controller.admit('conn'))
+
+    def test_load_recovers_without_samples(self):
+        """Test that a load raised by slow transactions falls back below 1
+        once they stop, even if no faster transactions are executed after
+        them.
+        """
+        latency = MovingAverage(weight=1.0, half_life=10.0)
+        now = [time.monotonic()]
+        latency.update(15.0, now=now[0])
+
+        controller = AdmissionController(
+            lambda: (0, 100),
+            execution_latency_fn=lambda: latency.get(now=now[0]),
+            max_execution_latency=5.0)
+
+        self.assertAlmostEqual(3.0, controller.load())
+        self.assertEqual(3, controller.admit('conn'))
+
+        # No samples are added during the next 20 seconds
+        now[0] += 20.0
+        self.assertAlmostEqual(0.75, controller.load())
+        self.assertEqual(0, controller.admit('conn'))
+
+    def test_load_without_max_execution_latency(self):
+        """Test that the execution latency is not considered unless a
+        maximum is given.
+        """
+        controller = AdmissionController(
+            lambda: (10, 100),
+            execution_latency_fn=lambda: 15.0)
+
+        self.assertAlmostEqual(0.1, controller.load())
+        self.assertEqual(0, controller.admit('conn'))
+
+    def test_connection_rate(self):
+        """Test that each connection is limited by its own token bucket only
+        once the load reaches the soft limit.
+        """
+        queue_info = [(0, 100)]
+        controller = AdmissionController(
+            lambda: queue_info[0],
+            connection_rate=1.0,
+            connection_burst=10,
+            soft_load=0.5)
+
+        # Below the soft load, connections are not limited
+        for _ in range(20):
+            self.assertEqual(0, controller.admit('busy'))
+
+        queue_info[0] = (60, 100)
+
+        # The busy connection has used up its bucket, but others have not
+        self.assertGreater(controller.admit('busy'), 0)
+        self.assertEqual(0, controller.admit('quiet', 10))
+        self.assertGreater(controller.admit('quiet'), 0)
+
+        # Submissions larger than a bucket are let through on a full one
+        self.assertEqual(0, controller.admit('large', 50))
+
+
+class MockDispatcher:
+    def __init__(self, size):
+        self.size = size
+
+    def queue_size(self):
+        return self.size
+
+
+class MockThreadPool:
+    def __init__(self, task_time_in_queue):
+        self.task_time_in_queue = task_time_in_queue
@@ -14,8 +14,12 @@
 # ------------------------------------------------------------------------------
 import unittest
 
+from sawtooth_validator.journal.block_wrapper import BlockWrapper
 from sawtooth_validator.protobuf import batch_pb2
+from sawtooth_validator.protobuf import block_pb2
 from sawtooth_validator.protobuf import transaction_pb2
+from sawtooth_validator.protobuf.client_batch_submit_pb2 \
+    import ClientBatchStatus
 from sawtooth_validator.state.batch_tracker import BatchTracker
 
 
@@ -47,6 +51,62 @@ class BatchTrackerTest(unittest.TestCase):
         self.assertEqual(1, len(more_invalid_info))
         self.assertEqual("bad_txn", more_invalid_info[0]["id"])
 
+    def test_chain_update_notifies_observers(self):
+        """Test that observers are notified once all of the batches they are
+        watching are committed or invalid.
+
+        - Add three pending batches
+        - Watch two of them, and one of them separately
+        - Commit one watched batch in a block, along with an unknown batch
+        - Ensure that only the observer watching just that batch is notified
+        - Invalidate the other watched batch
+        - Ensure that the remaining observer is notified with both statuses
+        """
+        committed = set()
+        batch_tracker = BatchTracker(
+            batch_committed=lambda batch_id: batch_id in committed)
+
+        for i in range(3):
+            batch_tracker.notify_batch_pending(
+                make_batch("batch{}".format(i), "txn{}".format(i)))
+
+        both_observer = MockObserver()
+        single_observer = MockObserver()
+        batch_tracker.watch_statuses(both_observer, ["batch0", "batch1"])
+        batch_tracker.watch_statuses(single_observer, ["batch0"])
+
+        committed.add("batch0")
+        batch_tracker.chain_update(
+            make_block([make_batch("batch0", "txn0"),
+                        make_batch("other_batch", "other_txn")]),
+            [])
+
+        self.assertEqual(
+            [{"batch0": ClientBatchStatus.COMMITTED}],
+            single_observer.notifications)
+        self.assertEqual([], both_observer.notifications)
+
+        batch_tracker.notify_txn_invalid("txn1")
+
+        self.assertEqual(
+            [{"batch0": ClientBatchStatus.COMMITTED,
+              "batch1": ClientBatchStatus.INVALID}],
+            both_observer.notifications)
+        self.assertEqual(
+            ClientBatchStatus.PENDING, batch_tracker.get_status("batch2"))
+
+
+class MockObserver:
+    def __init__(self):
+        self.notifications = []
+
+    def notify_batches_finished(self, statuses):
+        self.notifications.append(statuses)
+
+
+def make_block(batches):
+    return BlockWrapper(block_pb2.Block(batches=batches))
+
 
 def make_batch(batch_id, txn_id):
     transaction = transaction_pb2.Transaction(header_signature=txn_id)
@@ -23,6 +23,7 @@ from sawtooth_validator.journal.block_store import BlockStore
 from sawtooth_validator.journal.block_wrapper import NULL_BLOCK_IDENTIFIER
 from sawtooth_validator.journal.block_wrapper import BlockWrapper
 
+from sawtooth_validator.protobuf.batch_pb2 import Batch
 from sawtooth_validator.protobuf.block_pb2 import Block
 from sawtooth_validator.protobuf.block_pb2 import BlockHeader
 
@@ -155,6 +156,36 @@ class BlockStoreTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             stored = block_store.get_block_by_transaction_id("bad")
 
+    def test_get_block_nums(self):
+        """ Test BlockStore retrieval of the numbers of the blocks that
+        contain many transactions and batches.
+        """
+        block = self.create_block()
+        block_store = self.create_block_store()
+        block_store.update_chain([block])
+
+        txn_ids = [txn.header_signature
+                   for batch in block.batches
+                   for txn in batch.transactions]
+        self.assertEqual(
+            {txn_id: block.block_num for txn_id in txn_ids},
+            block_store.get_block_nums_by_transaction_ids(
+                txn_ids + ['bad']))
+
+        batch_ids = [batch.header_signature for batch in block.batches]
+        self.assertEqual(
+            {batch_id: block.block_num for batch_id in batch_ids},
+            block_store.get_block_nums_by_batch_ids(batch_ids + ['bad']))
+
+        self.assertEqual({}, block_store.get_block_nums_by_batch_ids([]))
+
+        self.assertEqual(
+            {txn_ids[0]: (block.header_signature, block.block_num)},
+            block_store.get_block_refs_by_transaction_ids(txn_ids[:1]))
+        self.assertEqual(
+            {batch_ids[0]: (block.header_signature, block.block_num)},
+            block_store.get_block_refs_by_batch_ids(batch_ids[:1]))
+
     def test_get_batch(self):
         """ Test BlockStore retrieval of a batch by id.
         """
@@ -269,13 +300,56 @@ class BlockStorePredecessorIteratorTest(unittest.TestCase):
 
         self.assertEqual([], [b for b in block_store.get_predecessor_iter()])
 
-    def _create_chain(self, length):
+    def test_get_batch_page(self):
+        """Given a block store with a chain of blocks, each with two batches,
+        verify that batch pages are listed from the newest block to the
+        oldest, in block order, and that each page links to the next.
+        """
+        block_store = BlockStore(DictDatabase(
+            indexes=BlockStore.create_index_configuration()))
+        chain = self._create_chain(3, batches_per_block=2)
+        block_store.update_chain(chain)
+        head = block_store.chain_head
+
+        batches, next_id = block_store.get_batch_page(head, limit=3)
+        self.assertEqual(
+            ['batch2-0', 'batch2-1', 'batch1-0'],
+            [b.header_signature for b in batches])
+        self.assertEqual('batch1-1', next_id)
+
+        batches, next_id = block_store.get_batch_page(
+            head, start_id=next_id, limit=3)
+        self.assertEqual(
+            ['batch1-1', 'batch0-0', 'batch0-1'],
+            [b.header_signature for b in batches])
+        self.assertIsNone(next_id)
+
+        batches, next_id = block_store.get_batch_page(
+            head, limit=2, reverse=True)
+        self.assertEqual(
+            ['batch0-1', 'batch0-0'],
+            [b.header_signature for b in batches])
+        self.assertEqual('batch1-1', next_id)
+
+        batches, _ = block_store.get_batch_page(
+            block_store['abcd1'], start_id='batch1-0')
+        self.assertEqual(
+            ['batch1-0', 'batch1-1', 'batch0-0', 'batch0-1'],
+            [b.header_signature for b in batches])
+
+        with self.assertRaises(ValueError):
+            block_store.get_batch_page(
+                block_store['abcd1'], start_id='batch2-0')
+
+    def _create_chain(self, length, batches_per_block=0):
         chain = []
         previous_block_id = NULL_BLOCK_IDENTIFIER
         for i in range(length):
             block = BlockWrapper(
                 Block(header_signature='abcd{}'.format(i),
-                      batches=[],
+                      batches=[
+                          Batch(header_signature='batch{}-{}'.format(i, j))
+                          for j in range(batches_per_block)],
                       header=BlockHeader(
                           block_num=i,
                           previous_block_id=previous_block_id
@@ -263,7 +263,7 @@ class TestBatchStatusRequests(ClientHandlerTestCase):
         def delayed_add():
             sleep(1)
             self._store.add_block('e')
-            self._tracker.chain_update(None, [])
+            self._tracker.chain_update(self._store.chain_head, [])
 
         Thread(target=delayed_add).start()
 
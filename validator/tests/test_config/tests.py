@@ -158,6 +158,10 @@ class TestValidatorConfig(unittest.TestCase):
         self.assertEqual(config.scheduler, "serial")
         self.assertEqual(config.minimum_peer_connectivity, 3)
         self.assertEqual(config.maximum_peer_connectivity, 10)
+        self.assertEqual(config.max_execution_latency, None)
+        self.assertEqual(config.batch_submission_rate, 100.0)
+        self.assertEqual(config.batch_submission_burst, 1000)
+        self.assertEqual(config.gossip_queue_limit, 5000)
 
     def test_validator_config_load_from_file(self):
         """Tests loading config settings from a TOML configuration file.
@@ -204,6 +208,14 @@ class TestValidatorConfig(unittest.TestCase):
                 fd.write(os.linesep)
                 fd.write('maximum_peer_connectivity = 100')
                 fd.write(os.linesep)
+                fd.write('max_execution_latency = 2.5')
+                fd.write(os.linesep)
+                fd.write('batch_submission_rate = 10.0')
+                fd.write(os.linesep)
+                fd.write('batch_submission_burst = 50')
+                fd.write(os.linesep)
+                fd.write('gossip_queue_limit = 200')
+                fd.write(os.linesep)
                 fd.write('[roles]')
                 fd.write(os.linesep)
                 fd.write('network = "trust"')
@@ -224,6 +236,10 @@ class TestValidatorConfig(unittest.TestCase):
             self.assertEqual(config.opentsdb_password, "secret")
             self.assertEqual(config.minimum_peer_connectivity, 1)
             self.assertEqual(config.maximum_peer_connectivity, 100)
+            self.assertEqual(config.max_execution_latency, 2.5)
+            self.assertEqual(config.batch_submission_rate, 10.0)
+            self.assertEqual(config.batch_submission_burst, 50)
+            self.assertEqual(config.gossip_queue_limit, 200)
 
         finally:
             os.environ.clear()
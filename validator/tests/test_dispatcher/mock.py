@@ -57,3 +57,19 @@ class MockSendMessage:
             message.ParseFromString(msg.content)
             self.identities.append(self.connections[connection_id])
             self.message_ids.append(message.correlation_id)
+
+
+class MockRecordingHandler(dispatch.Handler):
+    """Appends the message type and correlation id of each message
+    handled to HANDLED, in order.
+    """
+
+    def __init__(self, message_type, handled):
+        self._message_type = message_type
+        self.handled = handled
+
+    def handle(self, connection_id, message_content):
+        request = validator_pb2.Message()
+        request.ParseFromString(message_content)
+        self.handled.append((self._message_type, request.correlation_id))
+        return dispatch.HandlerResult(dispatch.HandlerStatus.PASS)
@@ -22,6 +22,7 @@ from sawtooth_validator.protobuf import validator_pb2
 from test_dispatcher.mock import MockSendMessage
 from test_dispatcher.mock import MockHandler1
 from test_dispatcher.mock import MockHandler2
+from test_dispatcher.mock import MockRecordingHandler
 
 
 class TestDispatcherIdentityMessageMatch(unittest.TestCase):
@@ -76,3 +77,100 @@ class TestDispatcherIdentityMessageMatch(unittest.TestCase):
 
     def tearDown(self):
         self._dispatcher.stop()
+
+
+class TestDispatcherQueues(unittest.TestCase):
+    def setUp(self):
+        self._connection = "TestConnection"
+        self._dispatcher = dispatch.Dispatcher()
+        # A single worker, so that messages are handled in the order they
+        # are dequeued
+        self._thread_pool = ThreadPoolExecutor(max_workers=1)
+        self._handled = []
+
+        for message_type, priority in [
+                (validator_pb2.Message.PING_REQUEST, dispatch.Priority.HIGH),
+                (validator_pb2.Message.GOSSIP_MESSAGE,
+                 dispatch.Priority.LOW)]:
+            self._dispatcher.add_handler(
+                message_type,
+                MockRecordingHandler(message_type, self._handled),
+                self._thread_pool,
+                priority=priority)
+
+    def _dispatch(self, message_type, count):
+        for i in range(count):
+            self._dispatcher.dispatch(
+                self._connection,
+                validator_pb2.Message(
+                    content=validator_pb2.Message(
+                        correlation_id=str(i)).SerializeToString(),
+                    message_type=message_type),
+                "connection_id")
+
+    def _correlation_ids(self, message_type):
+        return [c for t, c in self._handled if t == message_type]
+
+    def test_weighted_fair_dequeue(self):
+        """Tests that messages of a lower priority are dispatched while
+        messages of a higher priority are waiting, according to the
+        priority weights, and that messages of one type are dispatched in
+        the order they arrived.
+        """
+        self._dispatch(validator_pb2.Message.GOSSIP_MESSAGE, 20)
+        self._dispatch(validator_pb2.Message.PING_REQUEST, 20)
+        self._dispatcher.start()
+        self._dispatcher.block_until_complete()
+        self._thread_pool.shutdown(wait=True)
+
+        high = validator_pb2.Message.PING_REQUEST
+        low = validator_pb2.Message.GOSSIP_MESSAGE
+
+        # With the default weights, each round dispatches 8 high priority
+        # messages and then 1 low priority message
+        self.assertEqual(
+            [high] * 8 + [low] + [high] * 8 + [low] + [high] * 4,
+            [t for t, _ in self._handled[:22]])
+
+        self.assertEqual(
+            [str(i) for i in range(20)], self._correlation_ids(high))
+        self.assertEqual(
+            [str(i) for i in range(20)], self._correlation_ids(low))
+
+    def test_drop_newest(self):
+        """Tests that once a message type's queue is full, arriving messages
+        of that type are dropped.
+        """
+        self._dispatcher.set_queue_limit(
+            validator_pb2.Message.GOSSIP_MESSAGE, 3)
+        self._dispatch(validator_pb2.Message.GOSSIP_MESSAGE, 10)
+        self.assertEqual(3, self._dispatcher.queue_size())
+
+        self._dispatcher.start()
+        self._dispatcher.block_until_complete()
+        self._thread_pool.shutdown(wait=True)
+
+        self.assertEqual(
+            ['0', '1', '2'],
+            self._correlation_ids(validator_pb2.Message.GOSSIP_MESSAGE))
+
+    def test_drop_oldest(self):
+        """Tests that once a message type's queue is full, the oldest
+        message of that type is dropped to make room for an arriving one.
+        """
+        self._dispatcher.set_queue_limit(
+            validator_pb2.Message.GOSSIP_MESSAGE, 3,
+            dispatch.ShedPolicy.DROP_OLDEST)
+        self._dispatch(validator_pb2.Message.GOSSIP_MESSAGE, 10)
+        self.assertEqual(3, self._dispatcher.queue_size())
+
+        self._dispatcher.start()
+        self._dispatcher.block_until_complete()
+        self._thread_pool.shutdown(wait=True)
+
+        self.assertEqual(
+            ['7', '8', '9'],
+            self._correlation_ids(validator_pb2.Message.GOSSIP_MESSAGE))
+
+    def tearDown(self):
+        self._dispatcher.stop()
@@ -0,0 +1,177 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+# pylint: disable=protected-access
+
+import json
+import unittest
+from unittest.mock import Mock
+
+from sawtooth_validator.execution.executor import TransactionExecutorThread
+from sawtooth_validator.execution.executor import _NamespaceTrie
+from sawtooth_validator.execution.executor import _TransactionFamilyPolicy
+from sawtooth_validator.execution.processor_manager import ProcessorType
+
+
+class TestNamespaceTrie(unittest.TestCase):
+    def test_prefix_matching(self):
+        """Tests that an address matches if it starts with any of the
+        namespaces, and only then.
+        """
+        trie = _NamespaceTrie(['000000', '1cf126', '1cf1'])
+
+        self.assertTrue(trie.matches('000000' + 'a' * 64))
+        self.assertTrue(trie.matches('1cf126' + 'a' * 64))
+        self.assertTrue(trie.matches('1cf1ff' + 'a' * 64))
+        self.assertTrue(trie.matches('1cf1'))
+        self.assertFalse(trie.matches('00000f' + 'a' * 64))
+        self.assertFalse(trie.matches('1cf'))
+        self.assertFalse(trie.matches(''))
+
+    def test_empty_namespace(self):
+        """Tests that the empty namespace matches every address, and that no
+        namespaces match none.
+        """
+        trie = _NamespaceTrie(['1cf126', ''])
+        self.assertTrue(trie.matches('000000' + 'a' * 64))
+        self.assertTrue(trie.matches(''))
+
+        trie = _NamespaceTrie([])
+        self.assertFalse(trie.matches('000000' + 'a' * 64))
+
+
+class TestTransactionFamilyPolicy(unittest.TestCase):
+    def test_unrestricted(self):
+        """Tests that without any transaction families listed, every
+        transaction family may be executed.
+        """
+        policy = _TransactionFamilyPolicy('[]')
+
+        self.assertFalse(policy.is_restricted)
+        self.assertEqual({}, policy.namespaces)
+
+    def test_listed_families(self):
+        """Tests that the listed transaction families are required, and may
+        write to their listed namespaces, or to any address if none are
+        listed.
+        """
+        policy = _TransactionFamilyPolicy(json.dumps([
+            {'family': 'intkey', 'version': '1.0',
+             'namespaces': ['1cf126']},
+            {'family': 'sawtooth_settings', 'version': '1.0'},
+        ]))
+
+        self.assertTrue(policy.is_restricted)
+        self.assertEqual(
+            {ProcessorType('intkey', '1.0'),
+             ProcessorType('sawtooth_settings', '1.0')},
+            set(policy.namespaces))
+
+        intkey = policy.namespaces[ProcessorType('intkey', '1.0')]
+        self.assertTrue(intkey.matches('1cf126' + 'a' * 64))
+        self.assertFalse(intkey.matches('000000' + 'a' * 64))
+
+        settings = policy.namespaces[ProcessorType('sawtooth_settings', '1.0')]
+        self.assertTrue(settings.matches('000000' + 'a' * 64))
+
+    def test_first_listing_applies(self):
+        """Tests that if a transaction family is listed more than once, the
+        namespaces of its first listing apply.
+        """
+        policy = _TransactionFamilyPolicy(json.dumps([
+            {'family': 'intkey', 'version': '1.0',
+             'namespaces': ['1cf126']},
+            {'family': 'intkey', 'version': '1.0',
+             'namespaces': ['000000']},
+        ]))
+
+        intkey = policy.namespaces[ProcessorType('intkey', '1.0')]
+        self.assertTrue(intkey.matches('1cf126' + 'a' * 64))
+        self.assertFalse(intkey.matches('000000' + 'a' * 64))
+
+    def test_namespaces_not_a_list(self):
+        """Tests that namespaces given as a string, rather than a list, are
+        logged as an error and used as a list of their characters.
+        """
+        with self.assertLogs(
+                'sawtooth_validator.execution.executor', level='ERROR'):
+            policy = _TransactionFamilyPolicy(json.dumps([
+                {'family': 'intkey', 'version': '1.0',
+                 'namespaces': '1c'},
+            ]))
+
+        intkey = policy.namespaces[ProcessorType('intkey', '1.0')]
+        self.assertTrue(intkey.matches('1cf126' + 'a' * 64))
+        self.assertTrue(intkey.matches('c00000' + 'a' * 64))
+        self.assertFalse(intkey.matches('000000' + 'a' * 64))
+
+    def test_misconfigured(self):
+        """Tests that a setting that is not a JSON array of transaction
+        families is logged as an error, and treated as if nothing is listed.
+        """
+        for setting in ['[{"family": "intkey"', '5', '{"family": "intkey"}']:
+            with self.assertLogs(
+                    'sawtooth_validator.execution.executor', level='ERROR'):
+                policy = _TransactionFamilyPolicy(setting)
+
+            self.assertFalse(policy.is_restricted)
+            self.assertEqual({}, policy.namespaces)
+
+
+class TestTransactionExecutorThreadFamilyPolicy(unittest.TestCase):
+    def setUp(self):
+        self.settings_view_factory = Mock()
+        self.settings_view_factory.create_settings_view.return_value \
+            .get_setting.return_value = json.dumps([
+                {'family': 'intkey', 'version': '1.0',
+                 'namespaces': ['1cf126']},
+            ])
+
+        self.executor_thread = TransactionExecutorThread(
+            service=Mock(),
+            context_manager=Mock(),
+            scheduler=Mock(),
+            processor_manager=Mock(),
+            settings_view_factory=self.settings_view_factory,
+            invalid_observers=[])
+
+    def test_policy_reused_per_state_root(self):
+        """Tests that the policy is read from the settings once per state
+        root, and reused for the transactions executed on that root.
+        """
+        policy = self.executor_thread._get_family_policy('state_root')
+
+        self.assertIs(
+            policy, self.executor_thread._get_family_policy('state_root'))
+        self.settings_view_factory.create_settings_view \
+            .assert_called_once_with('state_root')
+        self.assertTrue(policy.is_restricted)
+
+    def test_policy_reloaded_for_new_state_root(self):
+        """Tests that the policy is read from the settings again for a
+        different state root, in which the setting may have changed.
+        """
+        first = self.executor_thread._get_family_policy('state_root')
+
+        self.settings_view_factory.create_settings_view.return_value \
+            .get_setting.return_value = '[]'
+        second = self.executor_thread._get_family_policy('next_state_root')
+
+        self.assertIsNot(first, second)
+        self.assertFalse(second.is_restricted)
+        self.assertEqual(
+            2, self.settings_view_factory.create_settings_view.call_count)
+        self.settings_view_factory.create_settings_view \
+            .assert_called_with('next_state_root')
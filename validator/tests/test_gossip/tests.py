@@ -0,0 +1,98 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+# pylint: disable=protected-access
+
+import unittest
+from unittest.mock import Mock
+
+from sawtooth_validator.gossip.gossip import Gossip
+from sawtooth_validator.protobuf import validator_pb2
+
+
+class TestGossipBroadcast(unittest.TestCase):
+    def setUp(self):
+        self.network = Mock()
+        self.network.broadcast.return_value = []
+        self.network.connection_id_to_public_key.return_value = None
+
+        self.gossip = Gossip(
+            self.network,
+            settings_cache=Mock(),
+            current_chain_head_func=Mock(),
+            current_root_func=Mock(),
+            consensus_notifier=Mock())
+        self.gossip._topology = Mock()
+
+        for connection_id in ['peer-a', 'peer-b', 'peer-c', 'pending']:
+            self.gossip.register_peer(
+                connection_id, 'tcp://{}:8800'.format(connection_id))
+
+    def test_broadcast_serializes_once(self):
+        """Tests that a broadcast is serialized once and passed to the
+        network in a single call for all of the peers that have completed
+        their handshake and are not excluded.
+        """
+        self.network.is_connection_handshake_complete.side_effect = \
+            lambda connection_id: connection_id != 'pending'
+        gossip_message = Mock()
+        gossip_message.SerializeToString.return_value = b'gossip'
+
+        self.gossip.broadcast(
+            gossip_message,
+            validator_pb2.Message.GOSSIP_MESSAGE,
+            exclude=['peer-b'])
+
+        gossip_message.SerializeToString.assert_called_once_with()
+        self.network.broadcast.assert_called_once_with(
+            validator_pb2.Message.GOSSIP_MESSAGE,
+            b'gossip',
+            ['peer-a', 'peer-c'])
+        self.network.send.assert_not_called()
+
+    def test_broadcast_removes_closed_connections(self):
+        """Tests that peers whose connections the network reports as closed
+        are removed once the broadcast has been sent to the others, and that
+        peers still completing their handshake are kept.
+        """
+        self.network.is_connection_handshake_complete.side_effect = \
+            lambda connection_id: connection_id != 'pending'
+        self.network.broadcast.return_value = ['peer-b']
+        gossip_message = Mock()
+        gossip_message.SerializeToString.return_value = b'gossip'
+
+        self.gossip.broadcast(
+            gossip_message, validator_pb2.Message.GOSSIP_MESSAGE)
+
+        self.network.broadcast.assert_called_once_with(
+            validator_pb2.Message.GOSSIP_MESSAGE,
+            b'gossip',
+            ['peer-a', 'peer-b', 'peer-c'])
+        self.assertEqual(
+            {'peer-a', 'peer-c', 'pending'},
+            set(self.gossip.get_peers()))
+
+    def test_broadcast_without_peers(self):
+        """Tests that nothing is serialized or sent when no peer has
+        completed its handshake.
+        """
+        self.network.is_connection_handshake_complete.return_value = False
+        gossip_message = Mock()
+
+        self.gossip.broadcast(
+            gossip_message, validator_pb2.Message.GOSSIP_MESSAGE)
+
+        gossip_message.SerializeToString.assert_not_called()
+        self.network.broadcast.assert_not_called()
@@ -397,6 +397,72 @@ class IndexedDatabaseTest(unittest.TestCase):
              (2, "alice", "Alice's data")],
             ordered_values)
 
+    def test_scan_index(self):
+        """Test scanning the entries of an index, in both directions, from a
+        start key that may or may not be in the index.
+        """
+        db = IndexedDatabase(
+            os.path.join(self._temp_dir, 'test_db'),
+            _serialize_tuple,
+            _deserialize_tuple,
+            indexes={'name': lambda tup: [tup[1].encode()]},
+            flag='c',
+            _size=1024**2)
+
+        db.put('1', (1, "foo", "bar"))
+        db.put('2', (2, "alice", "Alice's data"))
+        db.put('3', (3, "bob", "Bob's data"))
+
+        self.assertEqual(
+            [('alice', '2'), ('bob', '3'), ('foo', '1')],
+            db.scan_index('name'))
+        self.assertEqual(
+            [('bob', '3'), ('foo', '1')],
+            db.scan_index('name', start_key='b'))
+        self.assertEqual(
+            [('foo', '1'), ('bob', '3')],
+            db.scan_index('name', reverse=True, limit=2))
+        self.assertEqual(
+            [('alice', '2')],
+            db.scan_index('name', start_key='b', reverse=True))
+        self.assertEqual(
+            [('bob', '3'), ('alice', '2')],
+            db.scan_index('name', start_key='bob', reverse=True))
+        self.assertEqual([], db.scan_index('name', start_key='g'))
+
+    def test_index_refs(self):
+        """Test that an index with a reference function stores the reference
+        value with each entry, and that it is returned with the primary key,
+        while reads through the index are unaffected.
+        """
+        db = IndexedDatabase(
+            os.path.join(self._temp_dir, 'test_db'),
+            _serialize_tuple,
+            _deserialize_tuple,
+            indexes={'name': {
+                'key_fn': lambda tup: [tup[1].encode()],
+                'ref_fn': lambda tup: str(tup[0] * 10).encode(),
+            }},
+            flag='c',
+            _size=1024**2)
+
+        db.put('1', (1, "foo", "bar"))
+        db.put('2', (2, "alice", "Alice's data"))
+
+        self.assertEqual(
+            [('alice', '2', b'20'), ('foo', '1', b'10')],
+            db.get_index_refs(['alice', 'bob', 'foo'], index='name'))
+
+        self.assertEqual(
+            [('1', (1, "foo", "bar"))],
+            db.get_multi(['foo'], index='name'))
+        self.assertEqual([('foo', '1')], db.scan_index('name', start_key='b'))
+
+        with db.cursor(index='name') as curs:
+            self.assertEqual(
+                [(2, "alice", "Alice's data"), (1, "foo", "bar")],
+                list(curs.iter()))
+
     def test_index_iteration_with_concurrent_mods(self):
         """Given a database with three items, and a cursor on the index keys,
         test that a concurrent update will:
@@ -565,6 +631,42 @@ class IndexedDatabaseTest(unittest.TestCase):
             (4, 'foo', "foo's data"),
             db.get('foo', index='name'))
 
+    def test_build_added_index(self):
+        """Test that an index added to an existing database is built when the
+        database is next opened, and that the database is only scanned for
+        it once, even if the index is empty.
+        """
+        filename = os.path.join(self._temp_dir, 'test_db')
+        db = IndexedDatabase(
+            filename, _serialize_tuple, _deserialize_tuple,
+            flag='c', _size=1024**2)
+        db.put('1', (1, "foo", "bar"))
+        db.put('2', (2, "alice", "Alice's data"))
+        db.close()
+
+        scanned = []
+
+        def name_key_fn(tup):
+            scanned.append(tup[0])
+            return [tup[1].encode()]
+
+        db = IndexedDatabase(
+            filename, _serialize_tuple, _deserialize_tuple,
+            indexes={'name': name_key_fn, 'none': lambda tup: []},
+            _size=1024**2)
+        self.assertEqual(
+            (2, "alice", "Alice's data"), db.get('alice', index='name'))
+        self.assertEqual(0, db.count(index='none'))
+        self.assertEqual(2, len(scanned))
+        db.close()
+
+        db = IndexedDatabase(
+            filename, _serialize_tuple, _deserialize_tuple,
+            indexes={'name': name_key_fn, 'none': lambda tup: []},
+            _size=1024**2)
+        self.assertEqual(2, len(scanned))
+        self.assertEqual(2, db.count(index='name'))
+
 
 def _serialize_tuple(tup):
     return "{}-{}-{}".format(*tup).encode()
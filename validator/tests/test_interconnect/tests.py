@@ -0,0 +1,425 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+# pylint: disable=protected-access
+
+import asyncio
+from collections import deque
+from concurrent.futures import CancelledError
+import unittest
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import zmq
+
+from sawtooth_validator.networking import future
+from sawtooth_validator.networking import interconnect
+from sawtooth_validator.networking.interconnect import ConnectionInfo
+from sawtooth_validator.networking.interconnect import ConnectionStatus
+from sawtooth_validator.networking.interconnect import ConnectionType
+from sawtooth_validator.networking.interconnect import Interconnect
+from sawtooth_validator.networking.interconnect import _SendReceive
+from sawtooth_validator.protobuf import validator_pb2
+
+
+class TestSendReceiveReceiving(unittest.TestCase):
+    """Tests that messages are received from the socket in batches, and
+    routed to their futures or the dispatcher.
+    """
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.dispatcher = Mock()
+        self.futures = future.FutureCollection()
+        self.connections = {}
+        self.send_receive = _SendReceive(
+            'ServerThread',
+            address='tcp://127.0.0.1:8800',
+            futures=self.futures,
+            connections=self.connections,
+            dispatcher=self.dispatcher)
+        self.send_receive._dispatcher_queue = MockQueue(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def _receive(self, socket):
+        """Receives from the socket until it has no more messages."""
+        self.send_receive._socket = socket
+        with self.assertRaises(CancelledError):
+            self.loop.run_until_complete(
+                self.send_receive._receive_message())
+
+    def _dispatch(self):
+        """Dispatches the queued batches until there are none left."""
+        with self.assertRaises(CancelledError):
+            self.loop.run_until_complete(
+                self.send_receive._dispatch_message())
+
+    def test_receive_in_batches(self):
+        """Tests that the messages available on the socket are received as
+        batches of at most _MAX_RECEIVE_BATCH messages, in order.
+        """
+        frames = [[b'identity', _make_message_bytes(str(i).encode())]
+                  for i in range(interconnect._MAX_RECEIVE_BATCH + 10)]
+
+        self._receive(MockSocket(self.loop, zmq.ROUTER, frames))
+
+        batches = self.send_receive._dispatcher_queue.batches
+        self.assertEqual(
+            [interconnect._MAX_RECEIVE_BATCH, 10],
+            [len(batch) for batch in batches])
+        self.assertEqual(
+            [tuple(frame) for frame in frames],
+            [message for batch in batches for message in batch])
+        self.assertEqual(
+            interconnect._MAX_RECEIVE_BATCH + 10,
+            self.send_receive._dispatcher_queue_size)
+
+    def test_receive_on_dealer(self):
+        """Tests that messages received on a DEALER socket are batched
+        without an identity.
+        """
+        messages = [_make_message_bytes(b'a'), _make_message_bytes(b'b')]
+
+        self._receive(MockSocket(self.loop, zmq.DEALER, messages))
+
+        self.assertEqual(
+            [[(None, messages[0]), (None, messages[1])]],
+            self.send_receive._dispatcher_queue.batches)
+        self.assertIsNotNone(self.send_receive._last_message_time)
+
+    def test_liveness_once_per_identity(self):
+        """Tests that the time a message was received from a ROUTER identity
+        is recorded once per batch for each identity in it.
+        """
+        frames = [[b'identity-a', _make_message_bytes(b'1')],
+                  [b'identity-b', _make_message_bytes(b'2')],
+                  [b'identity-a', _make_message_bytes(b'3')],
+                  [b'identity-a', _make_message_bytes(b'4')]]
+
+        with patch.object(self.send_receive, '_received_from_identity',
+                          wraps=self.send_receive._received_from_identity) \
+                as received_from_identity:
+            self._receive(MockSocket(self.loop, zmq.ROUTER, frames))
+
+        self.assertEqual(2, received_from_identity.call_count)
+        self.assertEqual(
+            {b'identity-a', b'identity-b'},
+            {call[0][0] for call in received_from_identity.call_args_list})
+        self.assertEqual(
+            {b'identity-a', b'identity-b'},
+            set(self.send_receive._last_message_times))
+        self.assertEqual(2, len(self.connections))
+
+    def test_dispatch_skips_bad_message(self):
+        """Tests that a message that cannot be routed is skipped, and that
+        the rest of its batch is still dispatched or resolves its futures.
+        """
+        fut = future.Future('waiting')
+        self.futures.put(fut)
+
+        self.send_receive._dispatcher_queue.put_nowait([
+            (b'identity', _make_message_bytes(b'first')),
+            (b'identity', b'\xff\xff\xff\xff'),
+            (b'identity', _make_message_bytes(b'reply', b'waiting')),
+            (b'identity', _make_message_bytes(b'last')),
+        ])
+        self.send_receive._dispatcher_queue_size = 4
+
+        self._dispatch()
+
+        self.assertEqual(
+            [b'first', b'last'],
+            [call[0][1].content
+             for call in self.dispatcher.dispatch.call_args_list])
+        self.assertEqual(b'reply', fut.result().content)
+        self.assertEqual(0, self.send_receive._dispatcher_queue_size)
+
+    def test_dispatch_continues_after_dispatcher_error(self):
+        """Tests that an error raised by the dispatcher for one message does
+        not stop the rest of its batch from being dispatched.
+        """
+        self.dispatcher.dispatch.side_effect = [ValueError(), None]
+
+        self.send_receive._dispatcher_queue.put_nowait([
+            (b'identity', _make_message_bytes(b'first')),
+            (b'identity', _make_message_bytes(b'second')),
+        ])
+
+        self._dispatch()
+
+        self.assertEqual(2, self.dispatcher.dispatch.call_count)
+
+
+class TestSendReceiveSending(unittest.TestCase):
+    """Tests that sent messages are queued, and written to the socket in
+    order by a single writer.
+    """
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.connections = {}
+        self.send_receive = _SendReceive(
+            'ServerThread',
+            address='tcp://127.0.0.1:8800',
+            futures=future.FutureCollection(),
+            connections=self.connections,
+            max_pending_sends=2)
+        self.send_receive._event_loop = Mock()
+        self.socket = MockSocket(self.loop, zmq.ROUTER)
+        self.send_receive._socket = self.socket
+
+    def tearDown(self):
+        self.loop.close()
+
+    def _write(self):
+        self.loop.run_until_complete(
+            self.send_receive._write_pending_sends())
+
+    def test_write_queue(self):
+        """Tests that queued messages are written in the order they were
+        sent, by a writer scheduled only once, and that the writer writes
+        messages queued while it is running.
+        """
+        self.send_receive._queue_send(b'identity-a', b'1')
+        self.send_receive._queue_send(b'identity-b', b'2')
+        self.send_receive._queue_send(None, b'3')
+
+        self.assertEqual(
+            1, self.send_receive._event_loop.call_soon_threadsafe.call_count)
+        self.assertEqual([], self.socket.sent)
+
+        def send_while_writing():
+            if not self.socket.sent:
+                self.send_receive._queue_send(b'identity-a', b'4')
+
+        self.socket.on_send = send_while_writing
+
+        self._write()
+
+        self.assertEqual(
+            [[b'identity-a', b'1'], [b'identity-b', b'2'], [b'3'],
+             [b'identity-a', b'4']],
+            self.socket.sent)
+        self.assertEqual(
+            1, self.send_receive._event_loop.call_soon_threadsafe.call_count)
+        self.assertFalse(self.send_receive._writer_scheduled)
+        self.assertEqual({}, self.send_receive._pending_send_counts)
+
+        # The writer is scheduled again for the next message
+        self.send_receive._queue_send(b'identity-a', b'5')
+        self.assertEqual(
+            2, self.send_receive._event_loop.call_soon_threadsafe.call_count)
+
+    def test_max_pending_sends(self):
+        """Tests that messages to an identity with max_pending_sends messages
+        waiting are dropped, unless they are the last message to it, and that
+        other identities are not affected.
+        """
+        self.send_receive._queue_send(b'identity-a', b'1')
+        self.send_receive._queue_send(b'identity-a', b'2')
+        self.send_receive._queue_send(b'identity-a', b'dropped')
+        self.send_receive._queue_send(b'identity-b', b'3')
+        self.send_receive._queue_send(b'identity-a', b'last', is_last=True)
+
+        self._write()
+
+        self.assertEqual(
+            [[b'identity-a', b'1'], [b'identity-a', b'2'],
+             [b'identity-b', b'3'], [b'identity-a', b'last']],
+            self.socket.sent)
+
+        # Once written, messages to the identity are no longer dropped
+        self.send_receive._queue_send(b'identity-b', b'4')
+        self.send_receive._queue_send(b'identity-b', b'5')
+        self._write()
+        self.assertEqual(
+            [[b'identity-b', b'4'], [b'identity-b', b'5']],
+            self.socket.sent[4:])
+
+    def test_delayed_send(self):
+        """Tests that a message the socket does not accept without blocking,
+        because it is at its high-water mark, is written by a blocking send,
+        and is counted as delayed.
+        """
+        self.send_receive._delayed_send_count = Mock()
+        self.socket.full = True
+
+        self.send_receive._queue_send(b'identity-a', b'1')
+        self.send_receive._queue_send(b'identity-a', b'2')
+        self._write()
+
+        self.assertEqual(
+            [([b'identity-a', b'1'], 0),
+             ([b'identity-a', b'2'], zmq.NOBLOCK)],
+            self.socket.sent_with_flags)
+        self.send_receive._delayed_send_count.inc.assert_called_once_with()
+
+    def test_last_message_after_earlier_sends(self):
+        """Tests that the last message to an identity is written after the
+        messages sent to it before, and that the identity is only removed
+        once the last message has been written.
+        """
+        identity = b'identity-a'
+        self.send_receive._received_from_identity(identity)
+        connection_id = self.send_receive._identity_to_connection_id(identity)
+
+        connected_at_send = []
+        self.socket.on_send = lambda: connected_at_send.append(
+            connection_id in self.connections)
+
+        self.send_receive._queue_send(identity, b'1')
+        self.send_receive._queue_send(identity, b'2')
+        self.send_receive._queue_send(identity, b'last', is_last=True)
+        self._write()
+
+        self.assertEqual(
+            [[identity, b'1'], [identity, b'2'], [identity, b'last']],
+            self.socket.sent)
+        self.assertEqual([True, True, True], connected_at_send)
+        self.assertNotIn(connection_id, self.connections)
+        self.assertNotIn(identity, self.send_receive._last_message_times)
+
+
+class TestInterconnectBroadcast(unittest.TestCase):
+    def test_broadcast(self):
+        """Tests that a broadcast message is serialized once, and the same
+        bytes are sent to every connection, and that connections that have
+        been closed are returned without stopping the broadcast.
+        """
+        network = Interconnect('tcp://127.0.0.1:8800', dispatcher=Mock())
+        send_receive = Mock()
+        network._send_receive_thread = send_receive
+        outbound = Mock()
+
+        network._connections['inbound-a'] = ConnectionInfo(
+            ConnectionType.ZMQ_IDENTITY, b'identity-a', None,
+            ConnectionStatus.CONNECTED, None)
+        network._connections['outbound'] = ConnectionInfo(
+            ConnectionType.OUTBOUND_CONNECTION, outbound, None,
+            ConnectionStatus.CONNECTED, None)
+        network._connections['inbound-b'] = ConnectionInfo(
+            ConnectionType.ZMQ_IDENTITY, b'identity-b', None,
+            ConnectionStatus.CONNECTED, None)
+
+        invalid_connection_ids = network.broadcast(
+            validator_pb2.Message.GOSSIP_MESSAGE,
+            b'gossip',
+            ['inbound-a', 'closed', 'outbound', 'inbound-b'])
+
+        self.assertEqual(['closed'], invalid_connection_ids)
+
+        self.assertEqual(
+            ['inbound-a', 'inbound-b'],
+            [call[1]['connection_id'] for call in
+             send_receive.send_serialized_message.call_args_list])
+        sent = [call[0][0] for call in
+                send_receive.send_serialized_message.call_args_list]
+        sent.append(outbound.send_serialized_message.call_args[0][0])
+
+        self.assertIs(sent[0], sent[1])
+        self.assertIs(sent[0], sent[2])
+
+        message = validator_pb2.Message()
+        message.ParseFromString(sent[0])
+        self.assertEqual(validator_pb2.Message.GOSSIP_MESSAGE,
+                         message.message_type)
+        self.assertEqual(b'gossip', message.content)
+
+
+class MockSocket:
+    """A socket with the interface of a zmq.asyncio socket, receiving the
+    given messages. Once they have all been received, a blocking receive
+    cancels the task, and a non-blocking one raises zmq.Again.
+
+    While `full` is set, the socket is at its send high-water mark:
+    non-blocking sends raise zmq.Again, and a blocking send clears it.
+    `on_send` is called before each message is recorded as sent.
+    """
+
+    def __init__(self, loop, socket_type, messages=()):
+        self._loop = loop
+        self._socket_type = socket_type
+        self._messages = deque(messages)
+        self.full = False
+        self.on_send = None
+        self.sent_with_flags = []
+
+    @property
+    def sent(self):
+        return [frames for frames, _ in self.sent_with_flags]
+
+    def send_multipart(self, frames, flags=0):
+        fut = self._loop.create_future()
+        if self.full and flags & zmq.NOBLOCK:
+            fut.set_exception(zmq.Again())
+            return fut
+
+        self.full = False
+        if self.on_send is not None:
+            self.on_send()
+        self.sent_with_flags.append((list(frames), flags))
+        fut.set_result(None)
+        return fut
+
+    def getsockopt(self, option):
+        if option == zmq.TYPE:
+            return self._socket_type
+        raise ValueError(option)
+
+    def recv_multipart(self, flags=0):
+        return self._recv(flags)
+
+    def recv(self, flags=0):
+        return self._recv(flags)
+
+    def _recv(self, flags):
+        fut = self._loop.create_future()
+        if self._messages:
+            fut.set_result(self._messages.popleft())
+        elif flags & zmq.NOBLOCK:
+            fut.set_exception(zmq.Again())
+        else:
+            fut.set_exception(CancelledError())
+        return fut
+
+
+class MockQueue:
+    """An asyncio.Queue of received batches, which cancels the task getting
+    from it once it is empty.
+    """
+
+    def __init__(self, loop):
+        self._loop = loop
+        self.batches = []
+
+    def put_nowait(self, batch):
+        self.batches.append(batch)
+
+    def get(self):
+        fut = self._loop.create_future()
+        if self.batches:
+            fut.set_result(self.batches.pop(0))
+        else:
+            fut.set_exception(CancelledError())
+        return fut
+
+
+def _make_message_bytes(content, correlation_id=None):
+    return validator_pb2.Message(
+        correlation_id=correlation_id or content,
+        content=content,
+        message_type=validator_pb2.Message.PING_REQUEST).SerializeToString()
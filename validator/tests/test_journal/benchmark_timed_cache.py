@@ -0,0 +1,189 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+# pylint: disable=no-name-in-module
+
+"""Benchmark of TimedCache against the previous implementation.
+
+The throughput workload mimics the gossip seen-caches: a stream of new ids
+is added, each one is checked a few times, and some lookups miss. Entries
+expire quickly, so purges run throughout. Memory is measured by filling a
+cache with ids and comparing the traced allocations.
+
+Run from the validator directory:
+
+    python3 tests/test_journal/benchmark_timed_cache.py
+"""
+
+import argparse
+from collections.abc import MutableMapping
+import hashlib
+import sys
+from threading import RLock
+import time
+import tracemalloc
+
+from sawtooth_validator.journal.timed_cache import TimedCache
+
+
+class _WrappedTimedCache(MutableMapping):
+    """
+    The TimedCache implementation that wrapped each value with its
+    timestamp and rebuilt the cache on purge, kept here as the baseline.
+    """
+    class CachedValue:
+        def __init__(self, value):
+            self.value = value
+            self.timestamp = time.time()  # the time this State was created,
+            # used for house keeping, ie when to flush this from the cache.
+
+        def touch(self):
+            """
+            Mark this entry as accessed.
+            """
+            self.timestamp = time.time()
+
+    def __init__(self, keep_time=30, purge_frequency=30):
+        super(_WrappedTimedCache, self).__init__()
+        self._lock = RLock()
+        self._cache = {}
+        self._keep_time = keep_time
+        self._purge_frequency = purge_frequency
+        self._next_purge_time = time.time() + purge_frequency
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            if time.time() > self._next_purge_time:
+                self._purge_expired()
+                self._next_purge_time = time.time() + self._purge_frequency
+            self._cache[key] = self.CachedValue(value)
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = self._cache[key]
+            value.touch()
+            return value.value
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._cache[key]
+
+    def __iter__(self):
+        with self._lock:
+            return iter(self._cache)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._cache)
+
+    def __str__(self):
+        with self._lock:
+            out = []
+            for v in self._cache.values():
+                out.append(str(v.value))
+            return ','.join(out)
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @property
+    def keep_time(self):
+        return self._keep_time
+
+    @property
+    def purge_frequency(self):
+        return self._purge_frequency
+
+    def _purge_expired(self):
+        """
+        Remove all expired entries from the cache.
+        """
+        time_horizon = time.time() - self._keep_time
+        new_cache = {}
+        for (k, v) in self._cache.items():
+            if v.timestamp > time_horizon:
+                new_cache[k] = v
+        self._cache = new_cache
+
+
+def _make_ids(count):
+    return [hashlib.sha256(str(i).encode()).hexdigest() + '0' * 64
+            for i in range(count)]
+
+
+def churn(cache_class, ids, keep_time, purge_frequency):
+    """Returns the number of operations per second over the ids."""
+    cache = cache_class(keep_time=keep_time, purge_frequency=purge_frequency)
+    operations = 0
+
+    start = time.perf_counter()
+    for i, id_ in enumerate(ids):
+        if id_ not in cache:
+            cache[id_] = True
+        cache.get(id_)
+        cache.get(ids[i // 2])
+        # lookups for ids that were never added
+        _ = ids[-1 - i] in cache
+        operations += 4
+    elapsed = time.perf_counter() - start
+
+    return operations / elapsed
+
+
+def memory(cache_class, ids):
+    """Returns the bytes allocated while filling a cache with the ids."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    cache = cache_class(keep_time=3600, purge_frequency=3600)
+    for id_ in ids:
+        cache[id_] = True
+
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'lineno'))
+    del cache
+    return size
+
+
+def main(args):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', '--ids', type=int, default=200000)
+    parser.add_argument('-k', '--keep-time', type=float, default=0.5)
+    parser.add_argument('-p', '--purge-frequency', type=float, default=0.1)
+    opts = parser.parse_args(args)
+
+    ids = _make_ids(opts.ids)
+    half = opts.ids // 2
+
+    results = {}
+    for name, cache_class in (('old', _WrappedTimedCache),
+                              ('new', TimedCache)):
+        throughput = churn(
+            cache_class, ids[:half], opts.keep_time, opts.purge_frequency)
+        size = memory(cache_class, ids[half:])
+        results[name] = (throughput, size)
+        print('{}: {:,.0f} ops/s, {:,.0f} bytes for {} entries'.format(
+            name, throughput, size, opts.ids - half))
+
+    print('throughput: {:.2f}x, memory: {:.2f}x'.format(
+        results['new'][0] / results['old'][0],
+        results['new'][1] / results['old'][1]))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -48,6 +48,7 @@ from sawtooth_validator.journal.chain_commit_state import ChainCommitState
 from sawtooth_validator.journal.chain_commit_state import DuplicateTransaction
 from sawtooth_validator.journal.chain_commit_state import DuplicateBatch
 from sawtooth_validator.journal.chain_commit_state import MissingDependency
+from sawtooth_validator.journal.chain_commit_state import UncommittedIdCache
 from sawtooth_validator.journal.publisher import BlockPublisher
 from sawtooth_validator.journal.timed_cache import TimedCache
 from sawtooth_validator.journal.event_extractors \
@@ -1428,28 +1429,33 @@ class TestTimedCache(unittest.TestCase):
         del bc["test"]
         self.assertFalse("test" in bc)
 
-    def test_evict_expired(self):
+    @patch('sawtooth_validator.journal.timed_cache.time')
+    def test_evict_expired(self, mock_time):
         """ Test that values will be evicted from the
         cache as they time out.
         """
 
-        # use an invasive technique so that we don't have to sleep for
+        # control the clock so that we don't have to sleep for
         # the item to expire
+        mock_time.monotonic.return_value = 100
 
         bc = TimedCache(keep_time=1, purge_frequency=0)
 
         bc["test"] = "value"
+        mock_time.monotonic.return_value = 100.5
         bc["test2"] = "value2"
         self.assertEqual(len(bc), 2)
 
         # test that expired item i
-        bc.cache["test"].timestamp = bc.cache["test"].timestamp - 2
+        mock_time.monotonic.return_value = 101.2
         bc["test2"] = "value2"  # set value to activate purge
         self.assertEqual(len(bc), 1)
         self.assertFalse("test" in bc)
         self.assertTrue("test2" in bc)
 
-    def test_access_update(self):
+    @patch('sawtooth_validator.journal.timed_cache.time')
+    def test_access_update(self, mock_time):
+        mock_time.monotonic.return_value = 100
 
         bc = TimedCache(keep_time=1, purge_frequency=0)
 
@@ -1457,14 +1463,18 @@ class TestTimedCache(unittest.TestCase):
         bc["test2"] = "value2"
         self.assertEqual(len(bc), 2)
 
-        bc["test"] = "value"
-        bc.cache["test"].timestamp = bc.cache["test"].timestamp - 2
+        mock_time.monotonic.return_value = 101.5
         bc["test"]  # access to update timestamp
         bc["test2"] = "value2"  # set value to activate purge
         self.assertEqual(len(bc), 2)
         self.assertTrue("test" in bc)
         self.assertTrue("test2" in bc)
 
+        mock_time.monotonic.return_value = 102.8
+        bc["test2"] = "value2"  # set value to activate purge
+        self.assertEqual(len(bc), 1)
+        self.assertFalse("test" in bc)
+
 
 class TestChainCommitState(unittest.TestCase):
     """Test for:
@@ -1754,6 +1764,57 @@ class TestChainCommitState(unittest.TestCase):
         commit_state.check_for_duplicate_transactions(
             [transactions[8]])
 
+    def test_uncommitted_id_cache(self):
+        """Verify that a ChainCommitState created from an UncommittedIdCache
+        finds the same uncommitted ids as one created without it, that the
+        ids of a block are cached, and that the cache is cleared when the
+        chain head moves.
+        """
+        _, _, committed_blocks, uncommitted_blocks =\
+            self.create_new_chain()
+
+        block_store = BlockStore(DictDatabase(
+            indexes=BlockStore.create_index_configuration()))
+        block_store.update_chain(committed_blocks)
+        block_cache = BlockCache(block_store=block_store)
+        for block in uncommitted_blocks:
+            block_cache[block.header_signature] = block
+
+        cache = UncommittedIdCache(block_cache, block_store)
+
+        for head_id in ['B9', 'B8', 'B6']:
+            expected = ChainCommitState(head_id, block_cache, block_store)
+            commit_state = ChainCommitState(
+                head_id, block_cache, block_store,
+                uncommitted_id_cache=cache)
+
+            self.assertEqual(
+                expected.uncommitted_block_ids,
+                commit_state.uncommitted_block_ids)
+            self.assertEqual(
+                expected.uncommitted_batch_ids,
+                commit_state.uncommitted_batch_ids)
+            self.assertEqual(
+                expected.uncommitted_txn_ids,
+                commit_state.uncommitted_txn_ids)
+            self.assertEqual(
+                expected.common_ancestor.header_signature,
+                commit_state.common_ancestor.header_signature)
+
+        # B7, B8 and B9 are cached, B6 is in the block store. B7 carries
+        # the batch of B0.
+        self.assertEqual(3, len(cache))
+        self.assertEqual(
+            {'b0', 'b8', 'b9'}, cache.get('B9').batch_ids)
+        self.assertEqual(['B9', 'B8', 'B7'], cache.get('B9').block_ids)
+
+        # Switch to the fork
+        block_store.update_chain(
+            uncommitted_blocks, old_chain=committed_blocks[4:])
+
+        self.assertEqual(frozenset(), cache.get('B9').batch_ids)
+        self.assertEqual(0, len(cache))
+
     def create_new_chain(self):
         """
         NUM     0  1  2  3  4  5  6
@@ -0,0 +1,106 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import unittest
+
+from sawtooth_validator.state.leaf_cache import LeafCache
+
+
+class TestLeafCache(unittest.TestCase):
+    def test_get_and_put(self):
+        """Test that a value put under a root is returned only for that root
+        and address.
+        """
+        cache = LeafCache()
+
+        self.assertEqual((False, None), cache.get('root', 'aa'))
+
+        cache.put('root', 'aa', b'value')
+
+        self.assertEqual((True, b'value'), cache.get('root', 'aa'))
+        self.assertEqual((False, None), cache.get('root', 'bb'))
+        self.assertEqual((False, None), cache.get('other_root', 'aa'))
+
+    def test_values_not_shared(self):
+        """Test that modifying a value after putting it, or after getting
+        it, does not change the cached value.
+        """
+        cache = LeafCache()
+
+        value = {'items': [1, 2]}
+        cache.put('root', 'aa', value)
+        value['items'].append(3)
+
+        (_, cached) = cache.get('root', 'aa')
+        self.assertEqual({'items': [1, 2]}, cached)
+
+        cached['items'].append(4)
+        self.assertEqual((True, {'items': [1, 2]}), cache.get('root', 'aa'))
+
+    def test_shared_between_roots(self):
+        """Test that a value cached under a parent root is returned for a
+        child root, unless the address was changed between them.
+        """
+        cache = LeafCache()
+
+        cache.put('root_0', 'aa', b'a0')
+        cache.put('root_0', 'bb', b'b0')
+        cache.add_lineage('root_1', 'root_0', ['bb'])
+        cache.add_lineage('root_2', 'root_1', ['cc'])
+
+        self.assertEqual((True, b'a0'), cache.get('root_2', 'aa'))
+        self.assertEqual((False, None), cache.get('root_2', 'bb'))
+
+        cache.put('root_1', 'bb', b'b1')
+        self.assertEqual((True, b'b1'), cache.get('root_2', 'bb'))
+        self.assertEqual((True, b'b0'), cache.get('root_0', 'bb'))
+
+    def test_lineage_depth(self):
+        """Test that lookups do not search more than the configured number
+        of ancestors.
+        """
+        cache = LeafCache(max_lineage_depth=3)
+
+        cache.put('root_0', 'aa', b'a0')
+        for i in range(1, 4):
+            cache.add_lineage('root_{}'.format(i), 'root_{}'.format(i - 1),
+                              ['bb'])
+
+        self.assertEqual((True, b'a0'), cache.get('root_2', 'aa'))
+        self.assertEqual((False, None), cache.get('root_3', 'aa'))
+
+    def test_eviction_by_size(self):
+        """Test that least recently used entries are evicted once the cache
+        exceeds its size in bytes.
+        """
+        cache = LeafCache(max_bytes=1200)
+
+        cache.put('root', 'aa', b'x' * 300)
+        cache.put('root', 'bb', b'x' * 300)
+        self.assertEqual(2, len(cache))
+
+        # touch 'aa', so 'bb' is the least recently used
+        cache.get('root', 'aa')
+        cache.put('root', 'cc', b'x' * 300)
+
+        self.assertEqual(2, len(cache))
+        self.assertLessEqual(cache.size, 1200)
+        self.assertTrue(cache.get('root', 'aa')[0])
+        self.assertFalse(cache.get('root', 'bb')[0])
+        self.assertTrue(cache.get('root', 'cc')[0])
+
+        # values larger than the cache are not stored
+        cache.put('root', 'dd', b'x' * 2000)
+        self.assertFalse(cache.get('root', 'dd')[0])
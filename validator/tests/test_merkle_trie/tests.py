@@ -169,6 +169,40 @@ class TestSawtoothMerkleTrie(unittest.TestCase):
         self.assertEqual([("010202", {"my_data": 2})],
                          [entry for entry in self.trie.leaves('0102')])
 
+    def test_merkle_trie_get_multi(self):
+        new_root = self.update({
+            "010101": {"my_data": 1},
+            "010202": {"my_data": 2},
+            "020303": {"my_data": 3}
+        }, [], virtual=False)
+
+        self.set_merkle_root(new_root)
+
+        self.assertEqual(
+            [("020303", {"my_data": 3}),
+             ("010101", {"my_data": 1}),
+             ("010203", None),
+             ("030303", None),
+             ("010202", {"my_data": 2})],
+            self.trie.get_multi(
+                ["020303", "010101", "010203", "030303", "010202"]))
+
+        self.assertEqual([], self.trie.get_multi([]))
+
+    def test_merkle_trie_update_cached_values(self):
+        """Test that changing a value after it has been committed with update
+        does not change the value read back from the trie.
+        """
+        value = {"my_data": 1}
+        new_root = self.update({"010101": value}, [], virtual=False)
+        value["my_data"] = 2
+
+        self.set_merkle_root(new_root)
+
+        self.assertEqual({"my_data": 1}, self.trie.get("010101"))
+        self.assertEqual(
+            [("010101", {"my_data": 1})], self.trie.get_multi(["010101"]))
+
     # assertions
     def assert_value_at_address(self, address, value, ishash=False):
         self.assertEqual(
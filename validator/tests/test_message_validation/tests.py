@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ------------------------------------------------------------------------------
+from concurrent.futures import ThreadPoolExecutor
 import unittest
+from unittest.mock import patch
 import hashlib
 import random
 import string
@@ -27,6 +29,8 @@ from sawtooth_validator.protobuf.batch_pb2 import BatchHeader, Batch
 from sawtooth_validator.protobuf.block_pb2 import BlockHeader, Block
 from sawtooth_validator.gossip import signature_verifier as verifier
 from sawtooth_validator.gossip import structure_verifier
+from sawtooth_validator.networking.dispatch import HandlerStatus
+from sawtooth_validator.protobuf.network_pb2 import GossipMessage
 
 
 class TestMessageValidation(unittest.TestCase):
@@ -228,3 +232,78 @@ class TestMessageValidation(unittest.TestCase):
         block = block_list[0]
         valid = verifier.is_valid_block(block)
         self.assertFalse(valid)
+
+    def test_verified_transaction_header_changed(self):
+        """Test that a transaction whose signature has been verified is not
+        considered verified once its header is changed.
+        """
+        txn = self._create_transactions(1)[0]
+        self.assertTrue(verifier.is_valid_transaction(txn))
+
+        header = TransactionHeader()
+        header.ParseFromString(txn.header)
+        header.family_name = 'changed'
+        txn.header = header.SerializeToString()
+
+        self.assertFalse(verifier.is_valid_transaction(txn))
+
+    def test_verified_batch_in_block(self):
+        """Test that a block does not verify the signatures of a batch that
+        was verified when it arrived on its own, unless the batch's contents
+        were changed.
+        """
+        batch = self._create_batches(1, 2)[0]
+        self.assertFalse(verifier.is_verified_batch(batch))
+        self.assertTrue(verifier.is_valid_batch(batch))
+        self.assertTrue(verifier.is_verified_batch(batch))
+
+        block_header = BlockHeader(signer_public_key=self.public_key,
+                                   batch_ids=[batch.header_signature])
+        header_bytes = block_header.SerializeToString()
+        block = Block(header=header_bytes,
+                      batches=[batch],
+                      header_signature=self.signer.sign(header_bytes))
+
+        with patch.object(
+                verifier, '_verify', wraps=verifier._verify) as verify:
+            self.assertTrue(verifier.is_valid_block(block))
+            # Only the block's signature is verified
+            self.assertEqual(1, verify.call_count)
+
+        batch.transactions[0].payload = cbor.dumps({'Verb': 'changed'})
+        self.assertFalse(verifier.is_verified_batch(batch))
+        self.assertFalse(verifier.is_valid_batch(batch))
+
+    def test_verified_batch_gossip_and_response(self):
+        """Test that an already verified batch is dropped when it is
+        broadcast again, but passed on when it arrives in response to a
+        request.
+        """
+        batch = self._create_batches(1, 2)[0]
+        self.assertTrue(verifier.is_valid_batch(batch))
+
+        result = verifier.GossipMessageSignatureVerifier().handle(
+            'connection_id', (batch, GossipMessage.BATCH, 10))
+        self.assertEqual(HandlerStatus.DROP, result.status)
+
+        with patch.object(
+                verifier, '_verify', wraps=verifier._verify) as verify:
+            result = verifier.GossipBatchResponseSignatureVerifier().handle(
+                'connection_id', (batch, b''))
+            self.assertEqual(HandlerStatus.PASS, result.status)
+            verify.assert_not_called()
+
+    def test_valid_block_with_verification_pool(self):
+        """Test that blocks are verified when their transactions are spread
+        across a verification pool.
+        """
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            verifier.set_verification_pool(pool, chunk_size=2)
+            try:
+                block = self._create_blocks(1, 3)[0]
+                self.assertTrue(verifier.is_valid_block(block))
+
+                block = self._create_blocks(1, 3, valid_batch=False)[0]
+                self.assertFalse(verifier.is_valid_block(block))
+            finally:
+                verifier.set_verification_pool(None)
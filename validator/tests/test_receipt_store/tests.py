@@ -93,6 +93,23 @@ class ReceiptStoreTest(unittest.TestCase):
         with self.assertRaises(KeyError):
             receipt_store.get('unknown')
 
+    def test_get_receipts(self):
+        """Tests that many receipts are returned in the order of the given
+        ids, and that a key error is raised if any receipt is missing.
+        """
+        receipt_store = TransactionReceiptStore(DictDatabase())
+        for i in range(3):
+            receipt_store.put(
+                str(i), TransactionReceipt(data=[str(i).encode()]))
+
+        receipts = receipt_store.get_receipts(['2', '0'])
+        self.assertEqual(
+            [[b'2'], [b'0']],
+            [list(receipt.data) for receipt in receipts])
+
+        with self.assertRaises(KeyError):
+            receipt_store.get_receipts(['1', 'unknown'])
+
 
 class TransactionReceiptGetRequestHandlerTest(unittest.TestCase):
     def test_get_receipts(self):
@@ -0,0 +1,329 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+# pylint: disable=protected-access
+
+"""Micro-benchmark of the parallel scheduler's predecessor tree.
+
+Replays the reads and writes of generated blocks through PredecessorTree,
+backed by the radix tree and by the set-based prefix tree it replaced, and
+checks that both produce the same predecessors. Blocks are modelled on
+intkey and settings traffic: transactions touch a 70-character address in
+a hot or cold keyspace, read a few settings addresses, and occasionally
+read a whole namespace.
+
+Run from the validator directory:
+
+    python3 tests/test_scheduler/benchmark_predecessor_tree.py
+"""
+
+import argparse
+from collections import deque
+import hashlib
+import random
+import sys
+import time
+
+from sawtooth_validator.execution.scheduler_parallel import AddressNotInTree
+from sawtooth_validator.execution.scheduler_parallel import PredecessorTree
+from sawtooth_validator.execution.scheduler_parallel import Tree
+
+
+INTKEY_NAMESPACE = hashlib.sha512('intkey'.encode()).hexdigest()[:6]
+SETTINGS_NAMESPACE = '000000'
+
+
+class _SetNode:
+    def __init__(self, address, data=None):
+        self.address = address
+        self.children = set()
+        self.data = data
+
+
+class _SetTree:
+    '''
+    The set-based prefix tree previously used by PredecessorTree, kept
+    here as the baseline.
+    '''
+    def __init__(self):
+        self._root = _SetNode('')
+
+    def _get_child(self, node, address):
+        for child in node.children:
+            if address.startswith(child.address):
+                return child
+
+        match = None
+
+        for child in node.children:
+            if child.address.startswith(address):
+                match = child.address
+
+        raise AddressNotInTree(match=match)
+
+    def _walk_to_address(self, address):
+        node = self._root
+
+        yield node
+
+        # A node's address is always a proper prefix of the addresses
+        # of its children, so we only need to check the ordering. A
+        # more explicit but also more verbose and probably slower
+        # check would be:
+        #
+        # while address != node.address and address.startswith(node.address):
+        #
+        while node.address < address:
+            node = self._get_child(node, address)
+
+            yield node
+
+    def update(self, address, updater, prune=False):
+        '''
+        Walk to ADDRESS, creating nodes if necessary, and set the data
+        there to UPDATER(data).
+
+        Arguments:
+            address (str): the address to be updated
+        '''
+
+        node = self._get_or_create(address)
+
+        node.data = updater(node.data)
+
+        if prune:
+            node.children.clear()
+
+    def prune(self, address):
+        '''
+        Remove all children (and descendants) below ADDRESS.
+
+        Arguments:
+            address (str): the address to be pruned
+        '''
+
+        try:
+            for step in self._walk_to_address(address):
+                node = step
+        except AddressNotInTree:
+            return
+
+        node.children.clear()
+
+    def walk(self, address):
+        '''
+        Returns a stream of pairs of node addresses and data, raising
+        AddressNotInTree if ADDRESS is not in the tree.
+
+        First the ancestors of ADDRESS (including itself) are yielded,
+        earliest to latest, and then the descendants of ADDRESS are
+        yielded in an unspecified order.
+
+        Arguments:
+            address (str): the address to be walked
+        '''
+
+        for step in self._walk_to_address(address):
+            node = step
+            yield node.address, node.data
+
+        to_process = deque()
+
+        to_process.extendleft(
+            node.children)
+
+        while to_process:
+            node = to_process.pop()
+
+            yield node.address, node.data
+
+            if node.children:
+                to_process.extendleft(
+                    node.children)
+
+    def _get_or_create(self, address):
+        # Walk as far down the tree as possible. If the desired
+        # address is reached, return that node. Otherwise, add a new
+        # one.
+        try:
+            for step in self._walk_to_address(address):
+                node = step
+
+            return node
+
+        except AddressNotInTree:
+            # The rest of the function deals with adding a new node,
+            # but there's no sense adding a level of indentation, so
+            # just pass here.
+            pass
+
+        # The address isn't in the tree, so a new node will be added
+        # one way or another.
+        new_node = _SetNode(address)
+
+        # Try to get the next child with a matching prefix.
+        try:
+            prefix_len = len(node.address)
+
+            match = next(
+                child
+                for child in node.children
+                if child.address[prefix_len:].startswith(
+                    address[prefix_len:][0])
+            )
+
+        # There's no match, so just add the new address as a child.
+        except StopIteration:
+            node.children.add(new_node)
+            return new_node
+
+        # If node address is 'rustic' and the address being added is
+        # 'rust', then 'rust' will be the intermediate node taking
+        # 'rustic' as a child.
+        if match.address.startswith(address):
+            node.children.add(new_node)
+            new_node.children.add(match)
+            node.children.remove(match)
+            return new_node
+
+        # The address and the match address share a common prefix, so
+        # an intermediate node with the prefix as its address will
+        # take them both as children.
+
+        shorter = (
+            address
+            if len(address) < len(match.address)
+            else match.address
+        )
+
+        for i in range(1, len(shorter)):
+            if address[i] != match.address[i]:
+                prefix = shorter[:i]
+                break
+
+        intermediate_node = _SetNode(prefix)
+        intermediate_node.children.update((new_node, match))
+        node.children.add(intermediate_node)
+        node.children.remove(match)
+        return new_node
+
+
+def _hash(value, length):
+    return hashlib.sha256(value.encode()).hexdigest()[:length]
+
+
+def _settings_address(key):
+    parts = key.split('.', maxsplit=3)
+    parts.extend([''] * (4 - len(parts)))
+    return SETTINGS_NAMESPACE + ''.join(_hash(part, 16) for part in parts)
+
+
+def generate_blocks(num_blocks, txns_per_block, keyspace, seed):
+    """Returns a list of blocks, each a list of (inputs, outputs) pairs."""
+    rand = random.Random(seed)
+
+    keys = [
+        INTKEY_NAMESPACE + hashlib.sha512(
+            'key{}'.format(i).encode()).hexdigest()[-64:]
+        for i in range(keyspace)
+    ]
+    hot_keys = keys[:max(1, keyspace // 100)]
+    settings = [
+        _settings_address(key) for key in (
+            'sawtooth.validator.transaction_families',
+            'sawtooth.validator.batch_injectors',
+            'sawtooth.settings.vote.authorized_keys',
+        )
+    ]
+
+    blocks = []
+    for _ in range(num_blocks):
+        block = []
+        for _ in range(txns_per_block):
+            key = rand.choice(hot_keys if rand.random() < 0.2 else keys)
+            inputs = [key] + rand.sample(settings, 2)
+            outputs = [key]
+            if rand.random() < 0.01:
+                inputs.append(INTKEY_NAMESPACE)
+            block.append((inputs, outputs))
+        blocks.append(block)
+
+    return blocks
+
+
+def replay(tree_factory, blocks):
+    """Schedules each block into a fresh PredecessorTree the way
+    ParallelScheduler.add_batch does, and returns the predecessors found
+    for every transaction along with the elapsed time.
+    """
+    results = []
+    start = time.perf_counter()
+    for block in blocks:
+        tree = PredecessorTree()
+        tree._tree = tree_factory()
+        for txn_num, (inputs, outputs) in enumerate(block):
+            predecessors = set()
+            for address in inputs:
+                predecessors.update(tree.find_read_predecessors(address))
+            for address in outputs:
+                predecessors.update(tree.find_write_predecessors(address))
+            results.append(predecessors)
+
+            for address in inputs:
+                tree.add_reader(address, txn_num)
+            for address in outputs:
+                tree.set_writer(address, txn_num)
+
+    return results, time.perf_counter() - start
+
+
+def main(args):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-b', '--blocks', type=int, default=50)
+    parser.add_argument('-t', '--transactions', type=int, default=500,
+                        help='the number of transactions per block')
+    parser.add_argument('-k', '--keyspace', type=int, default=5000,
+                        help='the number of distinct intkey addresses')
+    parser.add_argument('-r', '--rounds', type=int, default=3)
+    parser.add_argument('-s', '--seed', type=int, default=0)
+    opts = parser.parse_args(args)
+
+    blocks = generate_blocks(
+        opts.blocks, opts.transactions, opts.keyspace, opts.seed)
+
+    timings = {}
+    expected = None
+    for name, factory in (('set', _SetTree), ('radix', Tree)):
+        best = None
+        for _ in range(opts.rounds):
+            results, elapsed = replay(factory, blocks)
+            best = elapsed if best is None else min(best, elapsed)
+
+        if expected is None:
+            expected = results
+        elif results != expected:
+            print('{} tree predecessors differ from set tree'.format(name))
+            return 1
+
+        timings[name] = best
+        print('{:>6}: {:.3f}s for {} transactions'.format(
+            name, best, opts.blocks * opts.transactions))
+
+    print('speedup: {:.2f}x'.format(timings['set'] / timings['radix']))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
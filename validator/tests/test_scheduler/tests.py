@@ -22,6 +22,7 @@ import shutil
 import tempfile
 import threading
 import time
+from unittest.mock import Mock
 
 from sawtooth_signing import create_context
 from sawtooth_signing import CryptoFactory
@@ -1547,3 +1548,162 @@ class TestParallelScheduler(unittest.TestCase):
 
         scheduled_txn_info = self.scheduler.next_transaction()
         self.assertIsNone(scheduled_txn_info)
+
+
+class TestParallelSchedulerUnblocking(unittest.TestCase):
+    """Tests that transactions blocked by other transactions are scheduled,
+    or failed, once the transactions blocking them have results or are
+    removed from the schedule.
+    """
+
+    def setUp(self):
+        self.squash_handler = Mock()
+        self.scheduler = ParallelScheduler(self.squash_handler,
+                                           'first_state_root',
+                                           always_persist=False)
+
+        context = create_context('secp256k1')
+        private_key = context.new_random_private_key()
+        self.signer = CryptoFactory(context).new_signer(private_key)
+
+    def _create_txn(self, payload, addresses, dependencies=None):
+        txn, _ = create_transaction(
+            payload=payload.encode(),
+            signer=self.signer,
+            inputs=addresses,
+            outputs=addresses,
+            dependencies=dependencies)
+        return txn
+
+    def _add_batch(self, *txns, required=False):
+        batch = create_batch(transactions=list(txns), signer=self.signer)
+        self.scheduler.add_batch(batch, required=required)
+        return batch
+
+    def test_blocked_until_predecessor_has_result(self):
+        """Tests that a transaction writing an address an earlier transaction
+        writes is only returned once the earlier transaction has a result.
+        """
+        address = create_address('conflict')
+        txn_a = self._create_txn('A', [address])
+        txn_b = self._create_txn('B', [address])
+        self._add_batch(txn_a)
+        self._add_batch(txn_b)
+
+        self.assertEqual(
+            txn_a.header_signature,
+            self.scheduler.next_transaction().txn.header_signature)
+        self.assertIsNone(self.scheduler.next_transaction())
+
+        self.scheduler.set_transaction_execution_result(
+            txn_a.header_signature, is_valid=True, context_id='context-a')
+
+        txn_info = self.scheduler.next_transaction()
+        self.assertEqual(txn_b.header_signature,
+                         txn_info.txn.header_signature)
+        self.assertEqual(['context-a'], txn_info.base_context_ids)
+        self.assertIsNone(self.scheduler.next_transaction())
+
+    def test_blocked_until_predecessor_is_invalid(self):
+        """Tests that a transaction blocked by a transaction in another batch
+        is returned once that transaction is invalid, without its context.
+        """
+        address = create_address('conflict')
+        txn_a = self._create_txn('A', [address])
+        txn_b = self._create_txn('B', [address])
+        self._add_batch(txn_a)
+        self._add_batch(txn_b)
+
+        self.scheduler.next_transaction()
+        self.assertIsNone(self.scheduler.next_transaction())
+
+        self.scheduler.set_transaction_execution_result(
+            txn_a.header_signature, is_valid=False, context_id=None)
+
+        txn_info = self.scheduler.next_transaction()
+        self.assertEqual(txn_b.header_signature,
+                         txn_info.txn.header_signature)
+        self.assertEqual([], txn_info.base_context_ids)
+
+    def test_dependency_in_invalid_batch(self):
+        """Tests that a transaction with an explicit dependency on a
+        transaction in an invalid batch is failed once that batch has all of
+        its results, without being returned.
+        """
+        txn_a = self._create_txn('A', [create_address('A')])
+        txn_b = self._create_txn(
+            'B', [create_address('B')],
+            dependencies=[txn_a.header_signature])
+        txn_c = self._create_txn('C', [create_address('C')])
+        self._add_batch(txn_a)
+        batch_b = self._add_batch(txn_b)
+        self._add_batch(txn_c)
+
+        self.assertEqual(
+            txn_a.header_signature,
+            self.scheduler.next_transaction().txn.header_signature)
+        # B is blocked by A, so C is returned before it
+        self.assertEqual(
+            txn_c.header_signature,
+            self.scheduler.next_transaction().txn.header_signature)
+        self.assertIsNone(self.scheduler.next_transaction())
+
+        self.scheduler.set_transaction_execution_result(
+            txn_a.header_signature, is_valid=False, context_id=None)
+
+        self.assertIsNone(self.scheduler.next_transaction())
+        self.assertFalse(
+            self.scheduler.get_transaction_execution_results(
+                batch_b.header_signature)[0].is_valid)
+
+    def test_unblocked_by_unscheduled_batch(self):
+        """Tests that a transaction blocked by an explicit dependency in a
+        batch removed by unschedule_incomplete_batches is then returned.
+        """
+        txn_x = self._create_txn('X', [create_address('X')])
+        txn_a = self._create_txn('A', [create_address('A')])
+        txn_b = self._create_txn(
+            'B', [create_address('B')],
+            dependencies=[txn_a.header_signature])
+        # The first batch is preserved; the second is not, as it is neither
+        # the first nor required
+        self._add_batch(txn_x)
+        self._add_batch(txn_a)
+        self._add_batch(txn_b, required=True)
+
+        self.scheduler.next_transaction()
+        self.assertEqual(
+            txn_a.header_signature,
+            self.scheduler.next_transaction().txn.header_signature)
+        self.assertIsNone(self.scheduler.next_transaction())
+
+        self.scheduler.unschedule_incomplete_batches()
+        self.assertFalse(
+            self.scheduler.is_transaction_in_schedule(txn_a.header_signature))
+
+        self.assertEqual(
+            txn_b.header_signature,
+            self.scheduler.next_transaction().txn.header_signature)
+
+    def test_cancel(self):
+        """Tests that cancelling the scheduler squashes the contexts of the
+        valid results only, without persisting them, and only once.
+        """
+        txn_a = self._create_txn('A', [create_address('A')])
+        txn_b = self._create_txn('B', [create_address('B')])
+        self._add_batch(txn_a)
+        self._add_batch(txn_b)
+
+        self.scheduler.next_transaction()
+        self.scheduler.next_transaction()
+        self.scheduler.set_transaction_execution_result(
+            txn_a.header_signature, is_valid=True, context_id='context-a')
+        self.scheduler.set_transaction_execution_result(
+            txn_b.header_signature, is_valid=False, context_id='context-b')
+
+        self.scheduler.cancel()
+        self.scheduler.cancel()
+
+        self.assertTrue(self.scheduler.is_cancelled())
+        self.squash_handler.assert_called_once_with(
+            'first_state_root', ['context-a'], persist=False, clean_up=True)